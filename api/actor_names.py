@@ -0,0 +1,104 @@
+"""
+Actor name index for the actors endpoint and its autocomplete.
+
+Names reach Actors (film credits, plus the actor rows shows link to) and Acted_in
+(show credits) straight from the CSVs, with stray whitespace, repeats and
+placeholders such as "N/A" or "Documentary". rebuild_actor_names(), run by the
+import scripts, cleans them once into Actor_name: one row per distinct name with
+its film + show credit count and a normalized form (case-folded, accents and
+punctuation removed) to match what users type against.
+
+Normalized_name is indexed for prefix matching (migration 0011): Django's
+startswith is LIKE 'term%', which SQLite serves from a NOCASE index and
+PostgreSQL from a varchar_pattern_ops one. Substring matches scan the table on
+SQLite (it holds one short row per actor) and use a trigram index on PostgreSQL
+when pg_trgm is installed.
+"""
+import re
+import unicodedata
+from collections import Counter
+
+from django.db import transaction
+from django.db.models import Count
+
+from .models import ActedIn, ActorName, Actors
+
+
+MIN_NAME_LENGTH = 2
+MAX_NAME_LENGTH = 49
+PLACEHOLDERS = ('documentary', 'n/a')
+
+MATCH_MODES = ('prefix', 'substring')
+
+REBUILD_BATCH_SIZE = 1000
+
+# Dropped when normalizing ("O'Brien" -> "obrien", "J.K." -> "jk"); any other
+# run of non-alphanumerics becomes one space
+IGNORED_CHARACTERS = re.compile(r"['’.]")
+SEPARATORS = re.compile(r'[\W_]+')
+
+
+def clean_actor_name(raw):
+    """The display form of a credited name, or None for a placeholder/junk value"""
+    name = ' '.join((raw or '').split())
+    if not MIN_NAME_LENGTH <= len(name) <= MAX_NAME_LENGTH or name.isdigit():
+        return None
+    lowered = name.lower()
+    if any(placeholder in lowered for placeholder in PLACEHOLDERS):
+        return None
+    return name
+
+
+def normalize_actor_name(text):
+    """Case-folded, accent- and punctuation-free form used for matching"""
+    decomposed = unicodedata.normalize('NFKD', text.casefold())
+    text = ''.join(char for char in decomposed if not unicodedata.combining(char))
+    return SEPARATORS.sub(' ', IGNORED_CHARACTERS.sub('', text)).strip()
+
+
+def credit_counts():
+    """Counter of cleaned name -> film and show credits.
+
+    Every Actors row contributes its name, but only rows with a film count as a
+    credit (show actors have a film-less row that Acted_in points at).
+    """
+    credits = Counter()
+    for model, credit in ((Actors, 'film_id'), (ActedIn, 'show_id')):
+        rows = model.objects.values('actor_name').annotate(credits=Count(credit)).values_list('actor_name', 'credits')
+        for raw_name, count in rows:
+            name = clean_actor_name(raw_name)
+            if name:
+                credits[name] += count
+    return credits
+
+
+def rebuild_actor_names():
+    """Replace Actor_name with the current cast lists; returns the number of names"""
+    rows = [
+        ActorName(name=name, normalized_name=normalize_actor_name(name), credit_count=count)
+        for name, count in credit_counts().items()
+    ]
+    with transaction.atomic():
+        ActorName.objects.all().delete()
+        ActorName.objects.bulk_create(rows, batch_size=REBUILD_BATCH_SIZE)
+    return len(rows)
+
+
+def actor_name_list():
+    """Names in alphabetical order (the actors endpoint without ?q=)"""
+    return ActorName.objects.order_by('name').values_list('name', flat=True)
+
+
+def search_actor_names(query, match='prefix'):
+    """(name, credits) of names whose normalized form starts with / contains the query,
+    most credited first. Slice the result to the number of suggestions wanted.
+    """
+    term = normalize_actor_name(query)
+    names = ActorName.objects.all()
+    if not term:
+        names = names.none()
+    elif match == 'substring':
+        names = names.filter(normalized_name__contains=term)
+    else:
+        names = names.filter(normalized_name__startswith=term)
+    return names.order_by('-credit_count', 'name').values_list('name', 'credit_count')
@@ -24,8 +24,8 @@ class AllTablesAdmin(admin.ModelAdmin):
 
 @admin.register(AuditLog)
 class AuditLogAdmin(admin.ModelAdmin):
-    list_display = ('table_id', 'date', 'changes_to_data')
-    list_filter = ('date',)
+    list_display = ('table_id', 'date', 'action', 'user_id', 'entity_type', 'entity_id', 'changes_to_data')
+    list_filter = ('date', 'action', 'entity_type')
     readonly_fields = ('date',)
 
 
@@ -5,3 +5,9 @@ class ApiConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'api'
 
+    def ready(self):
+        # Register the SQLite connection profile
+        from . import db_tuning  # noqa: F401
+        # Time queries for the request metrics (after the profile, so its PRAGMAs aren't counted)
+        from . import metrics  # noqa: F401
+
@@ -0,0 +1,208 @@
+"""
+Async versions of the catalog and library GET endpoints, for ASGI deployments.
+
+urls.py serves these instead of the views in views.py when settings.ASYNC_VIEWS
+is on. They share the query builders and serializers in views.py and read through
+Django's async ORM, so under ASGI a request no longer hands the whole view to a
+worker thread. Queries are awaited one after another: Django runs a request's
+async ORM calls on that request's database thread, so gathering independent ones
+(such as the movie and show halves of user_top_rated) wouldn't run them
+concurrently anyway.
+
+Writes (review POST/PUT/DELETE) are delegated to the synchronous views.
+"""
+import traceback
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_http_methods
+
+from . import views
+from .actor_names import actor_name_list, search_actor_names
+from .catalog_cache import acached_catalog
+from .models import ActedIn, Actors
+from .pagination import InvalidCursor, akeyset_page
+from .routers import read_only_db
+from .search import aload_search_support
+from .views import (
+    ACTOR_LIST_LIMIT, MOVIE_SORTS, REVIEW_SORT, SHOW_SORTS, actor_search_params, movie_genre_names,
+    movie_page_query, movie_review_queryset, review_page_limit, serialize_actor_match, serialize_movie,
+    serialize_movie_review, serialize_show, serialize_show_review, serialize_top_movie, serialize_top_show,
+    show_genre_names, show_page_query, show_review_queryset, top_cast_rows, top_movie_reviews, top_show_reviews,
+)
+
+
+async def fetch_all(queryset):
+    return [item async for item in queryset]
+
+
+async def atop_cast_by_id(queryset, key_field, ids, per_item=3):
+    """Async version of views.top_cast_by_id()"""
+    cast_map = {item_id: [] for item_id in ids}
+    if cast_map:
+        async for item_id, actor_name in top_cast_rows(queryset, key_field, ids, per_item):
+            cast_map[item_id].append(actor_name)
+    return cast_map
+
+
+def server_error(error):
+    return JsonResponse({
+        'success': False,
+        'error': str(error),
+        'stack': traceback.format_exc() if settings.DEBUG else None
+    }, status=500)
+
+
+def with_cors(response):
+    response['Access-Control-Allow-Origin'] = '*'
+    return response
+
+
+@require_http_methods(["GET"])
+@read_only_db
+async def genres(request):
+    """Get all unique movie genres from the database"""
+    try:
+        genres_list = await acached_catalog('genres', lambda: fetch_all(movie_genre_names()))
+        return JsonResponse({'success': True, 'genres': genres_list})
+    except Exception as error:
+        return server_error(error)
+
+
+@require_http_methods(["GET"])
+@read_only_db
+async def show_genres(request):
+    """Get all unique show genres from the database"""
+    try:
+        genres_list = await acached_catalog('show_genres', lambda: fetch_all(show_genre_names()))
+        return JsonResponse({'success': True, 'genres': genres_list})
+    except Exception as error:
+        return server_error(error)
+
+
+@require_http_methods(["GET"])
+@read_only_db
+async def actors(request):
+    """Get actor names, or autocomplete matches for ?q= (see views.actors)"""
+    try:
+        search = actor_search_params(request.GET)
+    except ValueError as error:
+        return JsonResponse({'success': False, 'error': str(error)}, status=400)
+
+    try:
+        if search:
+            query, match, limit = search
+            matches = [serialize_actor_match(row) async for row in search_actor_names(query, match)[:limit]]
+            return JsonResponse({'success': True, 'actors': matches, 'count': len(matches)})
+        actors_list = await acached_catalog('actors', lambda: fetch_all(actor_name_list()[:ACTOR_LIST_LIMIT]))
+        return JsonResponse({'success': True, 'actors': actors_list})
+    except Exception as error:
+        return server_error(error)
+
+
+@require_http_methods(["GET"])
+@read_only_db
+async def movies(request):
+    """Get movies with filtering using Django ORM - ONLY MOVIES"""
+    try:
+        await aload_search_support()
+        queryset, sort_name, limit, cursor = movie_page_query(request.GET)
+        films, next_cursor = await akeyset_page(queryset, sort_name, MOVIE_SORTS[sort_name], limit, cursor)
+        cast_by_film = await atop_cast_by_id(Actors.objects.all(), 'film_id', [film.film_id for film in films])
+        movies_data = [serialize_movie(film, cast_by_film.get(film.film_id, [])) for film in films]
+        return JsonResponse({
+            'success': True,
+            'movies': movies_data,
+            'count': len(movies_data),
+            'next_cursor': next_cursor
+        })
+    except InvalidCursor as error:
+        return JsonResponse({'success': False, 'error': str(error)}, status=400)
+    except Exception as error:
+        return server_error(error)
+
+
+@require_http_methods(["GET"])
+@read_only_db
+async def shows(request):
+    """Get shows with filtering using Django ORM - ONLY SHOWS"""
+    try:
+        await aload_search_support()
+        queryset, sort_name, limit, cursor = show_page_query(request.GET)
+        filtered_shows, next_cursor = await akeyset_page(queryset, sort_name, SHOW_SORTS[sort_name], limit, cursor)
+        cast_by_show = await atop_cast_by_id(
+            ActedIn.objects.all(), 'show_id', [show.show_id for show in filtered_shows]
+        )
+        shows_data = [serialize_show(show, cast_by_show.get(show.show_id, [])) for show in filtered_shows]
+        return JsonResponse({
+            'success': True,
+            'movies': shows_data,  # Use 'movies' key for frontend compatibility
+            'count': len(shows_data),
+            'next_cursor': next_cursor
+        })
+    except InvalidCursor as error:
+        return JsonResponse({'success': False, 'error': str(error)}, status=400)
+    except Exception as error:
+        return server_error(error)
+
+
+@csrf_exempt
+@require_http_methods(["GET"])
+async def user_top_rated(request):
+    """Get user's top-rated movies and shows"""
+    user = await request.auser()
+    if not user.is_authenticated:
+        return with_cors(JsonResponse({'success': False, 'error': 'Authentication required'}, status=401))
+
+    try:
+        top_movies = [serialize_top_movie(review) for review in await fetch_all(top_movie_reviews(user))]
+        top_shows = [serialize_top_show(review) for review in await fetch_all(top_show_reviews(user))]
+        return with_cors(JsonResponse({
+            'success': True,
+            'top_movies': top_movies,
+            'top_shows': top_shows,
+            'total_movies': len(top_movies),
+            'total_shows': len(top_shows)
+        }))
+    except Exception as error:
+        return with_cors(JsonResponse({'success': False, 'error': str(error)}, status=500))
+
+
+async def review_page(request, queryset, serialize):
+    try:
+        reviews, next_cursor = await akeyset_page(
+            queryset, 'reviews', REVIEW_SORT, review_page_limit(request), request.GET.get('cursor')
+        )
+        reviews_data = [serialize(review) for review in reviews]
+        return with_cors(JsonResponse({
+            'success': True,
+            'reviews': reviews_data,
+            'count': len(reviews_data),
+            'next_cursor': next_cursor
+        }))
+    except InvalidCursor as error:
+        return with_cors(JsonResponse({'success': False, 'error': str(error)}, status=400))
+    except Exception as error:
+        return with_cors(JsonResponse({'success': False, 'error': str(error)}, status=500))
+
+
+@csrf_exempt
+@require_http_methods(["GET", "POST", "PUT", "DELETE"])
+@read_only_db
+async def movie_reviews(request, film_id=None):
+    """Get movie reviews; writes go through views.movie_reviews"""
+    if request.method != 'GET':
+        return await sync_to_async(views.movie_reviews)(request, film_id=film_id)
+    return await review_page(request, movie_review_queryset(film_id), serialize_movie_review)
+
+
+@csrf_exempt
+@require_http_methods(["GET", "POST", "PUT", "DELETE"])
+@read_only_db
+async def show_reviews(request, show_id=None):
+    """Get show reviews; writes go through views.show_reviews"""
+    if request.method != 'GET':
+        return await sync_to_async(views.show_reviews)(request, show_id=show_id)
+    return await review_page(request, show_review_queryset(show_id), serialize_show_review)
@@ -0,0 +1,205 @@
+"""
+Batched, asynchronous AuditLog writes.
+
+Views call record_audit() instead of AuditLog.objects.create(). Once the surrounding
+transaction commits, the entry is queued in process and a background thread writes
+queued entries with one bulk_create when AUDIT_LOG_BATCH_SIZE of them are waiting or
+AUDIT_LOG_FLUSH_INTERVAL seconds have passed, so requests no longer pay for a
+second write transaction. Entries from a rolled-back transaction are never written.
+
+The queue is bounded (AUDIT_LOG_QUEUE_SIZE). When it is full a request waits up to
+AUDIT_LOG_PUT_TIMEOUT seconds for room and then writes its entry itself, so a slow
+writer doesn't drop entries. A batch the database rejects is kept and retried with
+the next flush; only if failures pile up past AUDIT_LOG_QUEUE_SIZE entries are the
+oldest dropped (and logged). Whatever is still queued is flushed when the process
+exits. Set AUDIT_LOG_ASYNC = False to write every entry synchronously.
+
+Every entry written by this process is also published to audit_events, a bounded
+in-memory buffer that the audit-logs stream endpoint fans out to its subscribers.
+"""
+import atexit
+import logging
+import os
+import queue
+import threading
+from collections import deque
+
+from django.conf import settings
+from django.db import connections, transaction
+
+from .models import AuditLog
+
+
+logger = logging.getLogger(__name__)
+
+
+class AuditEventBuffer:
+    """The most recent audit entries written by this process, for live subscribers"""
+
+    def __init__(self, size=1000):
+        self._events = deque(maxlen=size)  # AuditLog instances in table_id order
+        self._condition = threading.Condition()
+
+    def publish(self, logs):
+        with self._condition:
+            self._events.extend(sorted(logs, key=lambda log: log.table_id))
+            self._condition.notify_all()
+
+    def since(self, last_id):
+        """Buffered entries newer than ``last_id``, or None if the buffer can't tell.
+
+        None means the caller must read from the table: nothing is buffered yet,
+        entries after ``last_id`` may already have been evicted, or the buffered ids
+        skip some, which other processes (or a rolled-back sequence value) took.
+        """
+        with self._condition:
+            if not self._events or last_id < self._events[0].table_id - 1:
+                return None
+            logs = [log for log in self._events if log.table_id > last_id]
+        expected = range(last_id + 1, last_id + 1 + len(logs))
+        if any(log.table_id != table_id for log, table_id in zip(logs, expected)):
+            return None
+        return logs
+
+    def latest_id(self):
+        with self._condition:
+            return self._events[-1].table_id if self._events else None
+
+    def wait(self, last_id, timeout):
+        """Block until an entry newer than ``last_id`` is published; False on timeout"""
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: self._events and self._events[-1].table_id > last_id, timeout
+            )
+
+
+audit_events = AuditEventBuffer(getattr(settings, 'AUDIT_LOG_STREAM_BUFFER', 1000))
+
+
+class AuditWriter:
+    """Background writer that drains a bounded queue of audit entries in batches"""
+
+    def __init__(self, batch_size=100, flush_interval=0.5, max_queue=10000, put_timeout=1.0):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.put_timeout = put_timeout
+        self.queue = queue.Queue(maxsize=max_queue)
+        # Held while draining and writing, so entries are written in queue order and
+        # flush() also waits for a batch the background thread is writing
+        self._write_lock = threading.Lock()
+        self._failed = []  # entries from writes that failed, retried first (under _write_lock)
+        self._start_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread = None
+        self._pid = None
+
+    def enqueue(self, entry):
+        """Queue one entry: a dict of AuditLog field values"""
+        self._ensure_started()
+        try:
+            self.queue.put(entry, timeout=self.put_timeout)
+        except queue.Full:
+            # Backpressure: the writer is behind, so this caller writes its own entry
+            # (under the lock, so it isn't published alongside a batch being written)
+            with self._write_lock:
+                self._write([entry])
+            return
+        if self.queue.qsize() >= self.batch_size:
+            self._wakeup.set()
+
+    def flush(self):
+        """Write everything queued so far from the calling thread"""
+        with self._write_lock:
+            entries, self._failed = self._failed, []
+            while True:
+                try:
+                    entries.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            if entries:
+                self._write(entries)
+
+    def shutdown(self, timeout=5.0):
+        """Stop the background thread and write whatever is still queued"""
+        self._stopping.set()
+        self._wakeup.set()
+        if self._thread is not None and self._thread.is_alive():
+            self._thread.join(timeout)
+        self.flush()
+
+    def _ensure_started(self):
+        # Checked per process so a forked worker starts its own thread
+        if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._thread is None or self._pid != os.getpid() or not self._thread.is_alive():
+                if self._pid is None:
+                    atexit.register(self.shutdown)
+                self._pid = os.getpid()
+                self._stopping.clear()
+                self._thread = threading.Thread(target=self._run, name='audit-writer', daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        try:
+            while not self._stopping.is_set():
+                # Woken early once batch_size entries are waiting
+                self._wakeup.wait(self.flush_interval)
+                self._wakeup.clear()
+                self.flush()
+        finally:
+            connections.close_all()
+
+    def _write(self, entries):
+        try:
+            logs = AuditLog.objects.bulk_create(
+                [AuditLog(**entry) for entry in entries],
+                batch_size=self.batch_size
+            )
+        except Exception:
+            # Keep them for the next flush, within the same bound as the queue
+            failed = self._failed + entries
+            self._failed = failed[-self.queue.maxsize:]
+            logger.exception(
+                "Failed to write %d audit log entries; retrying %d, dropped %d",
+                len(entries), len(self._failed), len(failed) - len(self._failed)
+            )
+            return
+        # bulk_create only sets primary keys on backends that return them
+        if all(log.table_id is not None for log in logs):
+            audit_events.publish(logs)
+
+
+audit_writer = AuditWriter(
+    batch_size=getattr(settings, 'AUDIT_LOG_BATCH_SIZE', 100),
+    flush_interval=getattr(settings, 'AUDIT_LOG_FLUSH_INTERVAL', 0.5),
+    max_queue=getattr(settings, 'AUDIT_LOG_QUEUE_SIZE', 10000),
+    put_timeout=getattr(settings, 'AUDIT_LOG_PUT_TIMEOUT', 1.0),
+)
+
+
+def record_audit(message, action, user_id=None, entity_type=None, entity_id=None):
+    """Record an audit log entry once the current transaction (if any) commits.
+
+    ``message`` is the human-readable text; ``action`` (e.g. 'signin', 'review_create'),
+    the acting ``user_id`` and the ``entity_type``/``entity_id`` it touched are stored
+    in their own indexed columns for filtering.
+    """
+    entry = {
+        'changes_to_data': message,
+        'action': action,
+        'user_id': user_id,
+        'entity_type': entity_type,
+        'entity_id': entity_id,
+    }
+    if not getattr(settings, 'AUDIT_LOG_ASYNC', True):
+        # The audit log can live on its own database, outside this transaction
+        transaction.on_commit(lambda: audit_events.publish([AuditLog.objects.create(**entry)]))
+        return
+    transaction.on_commit(lambda: audit_writer.enqueue(entry))
+
+
+def flush_audit_log():
+    """Write queued entries now, e.g. before reading the audit log back"""
+    audit_writer.flush()
@@ -0,0 +1,201 @@
+"""
+Monthly archive segments for old audit log rows.
+
+The archive_audit_log command moves Audit_log rows older than
+AUDIT_LOG_RETENTION_DAYS out of the database into one segment per month under
+AUDIT_LOG_ARCHIVE_DIR:
+
+    audit-2026-01.jsonl.gz    gzip members appended by each archive run, one JSON row per line
+    audit-2026-01.idx.json    sidecar index: byte range, row count, date and id range per member
+
+Segments are append-only. A run appends a new gzip member (a valid multi-member gzip
+file) and then replaces the sidecar atomically, so a run interrupted mid-append
+leaves trailing bytes the sidecar doesn't cover; the next run truncates them.
+
+read_archived_logs() serves the audit-logs endpoint once the live table runs out:
+archived rows are always older than the live ones, so the same (date, id) cursor
+continues into the segments, newest month first, skipping members whose date
+range can't match.
+"""
+import gzip
+import json
+import os
+from datetime import timezone as dt_timezone
+from pathlib import Path
+
+from django.conf import settings
+from django.utils.dateparse import parse_datetime
+
+from .models import AuditLog
+
+
+SEGMENT_SUFFIX = '.jsonl.gz'
+INDEX_SUFFIX = '.idx.json'
+
+
+def archive_dir():
+    return Path(getattr(settings, 'AUDIT_LOG_ARCHIVE_DIR', settings.BASE_DIR / 'data' / 'audit_archive'))
+
+
+def month_key(date):
+    """'YYYY-MM' of a datetime, in UTC for aware values"""
+    if date.tzinfo is not None:
+        date = date.astimezone(dt_timezone.utc)
+    return date.strftime('%Y-%m')
+
+
+def segment_paths(month):
+    base = archive_dir() / f'audit-{month}'
+    return Path(f'{base}{SEGMENT_SUFFIX}'), Path(f'{base}{INDEX_SUFFIX}')
+
+
+def load_index(month):
+    _, index_path = segment_paths(month)
+    if not index_path.exists():
+        return {'month': month, 'rows': 0, 'actions': [], 'members': []}
+    with open(index_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def archived_months():
+    """Months that have a sidecar index, newest first"""
+    directory = archive_dir()
+    if not directory.exists():
+        return []
+    months = [path.name[len('audit-'):-len(INDEX_SUFFIX)] for path in directory.glob(f'audit-*{INDEX_SUFFIX}')]
+    return sorted(months, reverse=True)
+
+
+def row_to_dict(log):
+    return {
+        'id': log.table_id,
+        'date': log.date.isoformat(),
+        'message': log.changes_to_data,
+        'user_id': log.user_id,
+        'action': log.action,
+        'entity_type': log.entity_type,
+        'entity_id': log.entity_id,
+    }
+
+
+def dict_to_row(row):
+    """Rebuild an (unsaved) AuditLog from an archived row"""
+    return AuditLog(
+        table_id=row['id'],
+        date=parse_datetime(row['date']),
+        changes_to_data=row['message'],
+        user_id=row['user_id'],
+        action=row['action'],
+        entity_type=row['entity_type'],
+        entity_id=row['entity_id'],
+    )
+
+
+def read_member(segment, member):
+    """Decompress one gzip member of a segment into row dicts"""
+    with open(segment, 'rb') as f:
+        f.seek(member['offset'])
+        data = gzip.decompress(f.read(member['length']))
+    return [json.loads(line) for line in data.decode('utf-8').splitlines() if line]
+
+
+def append_segment(month, logs):
+    """Append rows (AuditLog instances from one month) as a new member; returns rows written.
+
+    Rows already present in the segment (from a run that appended them but died before
+    deleting them from the database) are skipped.
+    """
+    segment, index_path = segment_paths(month)
+    segment.parent.mkdir(parents=True, exist_ok=True)
+    index = load_index(month)
+    indexed_size = sum(member['length'] for member in index['members'])
+
+    ids = [log.table_id for log in logs]
+    overlapping = [m for m in index['members'] if m['first_id'] <= max(ids) and m['last_id'] >= min(ids)]
+    if overlapping:
+        archived_ids = {row['id'] for member in overlapping for row in read_member(segment, member)}
+        logs = [log for log in logs if log.table_id not in archived_ids]
+    if not logs:
+        return 0
+
+    logs = sorted(logs, key=lambda log: (log.date, log.table_id))
+    payload = ''.join(json.dumps(row_to_dict(log), separators=(',', ':')) + '\n' for log in logs)
+    compressed = gzip.compress(payload.encode('utf-8'))
+
+    with open(segment, 'ab') as f:
+        # Drop bytes from an append the sidecar never recorded
+        f.truncate(indexed_size)
+        f.seek(indexed_size)
+        f.write(compressed)
+        f.flush()
+        os.fsync(f.fileno())
+
+    index['members'].append({
+        'offset': indexed_size,
+        'length': len(compressed),
+        'rows': len(logs),
+        'first_date': logs[0].date.isoformat(),
+        'last_date': logs[-1].date.isoformat(),
+        'first_id': min(log.table_id for log in logs),
+        'last_id': max(log.table_id for log in logs),
+    })
+    index['rows'] += len(logs)
+    index['actions'] = sorted(set(index['actions']) | {log.action for log in logs})
+
+    temp_path = index_path.with_suffix('.tmp')
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, indent=1)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, index_path)
+    return len(logs)
+
+
+def _matches(row, filters):
+    """Apply the ORM-style filters used by the audit-logs view to an archived row"""
+    for lookup, value in filters.items():
+        if lookup == 'date__gte':
+            if parse_datetime(row['date']) < value:
+                return False
+        elif lookup == 'date__lt':
+            if parse_datetime(row['date']) >= value:
+                return False
+        elif row[lookup] != value:
+            return False
+    return True
+
+
+def read_archived_logs(filters, before, limit):
+    """Return up to ``limit`` archived rows matching ``filters``, newest first.
+
+    ``before`` is the (date, id) of the last row already returned, or None.
+    """
+    since, until = filters.get('date__gte'), filters.get('date__lt')
+    results = []
+    for month in archived_months():
+        if since and month < month_key(since):
+            break
+        if until and month > month_key(until):
+            continue
+        if before and month > month_key(before[0]):
+            continue
+        index = load_index(month)
+        if 'action' in filters and filters['action'] not in index['actions']:
+            continue
+
+        segment, _ = segment_paths(month)
+        rows = []
+        for member in index['members']:
+            first, last = parse_datetime(member['first_date']), parse_datetime(member['last_date'])
+            if (since and last < since) or (until and first >= until) or (before and first > before[0]):
+                continue
+            rows += [row for row in read_member(segment, member) if _matches(row, filters)]
+
+        logs = [dict_to_row(row) for row in rows]
+        if before:
+            logs = [log for log in logs if (log.date, log.table_id) < before]
+        logs.sort(key=lambda log: (log.date, log.table_id), reverse=True)
+        results += logs
+        if len(results) >= limit:
+            break
+    return results[:limit]
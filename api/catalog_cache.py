@@ -0,0 +1,135 @@
+"""
+Cache for the catalog dimension endpoints (genres, show genres, actors).
+
+Their answers only change when the catalog does, so entries don't expire on a
+TTL: they are keyed by the catalog version, a counter in Catalog_version that
+the import, update and fix scripts bump with bump_catalog_version() once they
+have written (python manage.py bump_catalog_version after editing the catalog
+by hand). A request reads the version (one primary-key lookup) before anything
+else and asks for '<name>:<version>'; after a bump the old keys are never asked
+for again and simply age out.
+
+Entries live in a per-process LRU of CATALOG_CACHE_SIZE entries. Set
+CATALOG_CACHE_BACKEND to an alias in CACHES (Redis, memcached, ...) to share them
+between workers too: an LRU miss then checks the shared cache before computing.
+CATALOG_CACHE_ENABLED = False computes every request.
+"""
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import F
+from django.utils import timezone
+
+from .models import CatalogVersion
+
+
+CATALOG_VERSION_ID = 1
+SHARED_KEY_PREFIX = 'catalog:'
+
+_missing = object()
+
+
+class LRUCache:
+    """Thread-safe mapping that drops the least recently used entry when full"""
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                self._entries.move_to_end(key)
+            except KeyError:
+                return default
+            return self._entries[key]
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+local_cache = LRUCache(getattr(settings, 'CATALOG_CACHE_SIZE', 64))
+
+
+def cache_enabled():
+    return getattr(settings, 'CATALOG_CACHE_ENABLED', True)
+
+
+def shared_cache():
+    """The CACHES backend shared between workers, or None"""
+    alias = getattr(settings, 'CATALOG_CACHE_BACKEND', None)
+    return caches[alias] if alias else None
+
+
+def catalog_version_query():
+    return CatalogVersion.objects.filter(pk=CATALOG_VERSION_ID).values_list('version', flat=True)
+
+
+def catalog_version():
+    """Current catalog version (0 until the first bump)"""
+    return catalog_version_query().first() or 0
+
+
+async def acatalog_version():
+    return await catalog_version_query().afirst() or 0
+
+
+def bump_catalog_version():
+    """Invalidate every cached catalog answer, in all processes; returns the new version"""
+    updated = CatalogVersion.objects.filter(pk=CATALOG_VERSION_ID).update(
+        version=F('version') + 1, updated_at=timezone.now()
+    )
+    if not updated:
+        CatalogVersion.objects.get_or_create(pk=CATALOG_VERSION_ID, defaults={'version': 1})
+    return catalog_version()
+
+
+def cached_catalog(name, compute):
+    """compute() for the current catalog version, from the cache when possible"""
+    if not cache_enabled():
+        return compute()
+    key = f'{name}:{catalog_version()}'
+    value = local_cache.get(key, _missing)
+    if value is _missing:
+        shared = shared_cache()
+        if shared is not None:
+            value = shared.get(SHARED_KEY_PREFIX + key, _missing)
+        if value is _missing:
+            value = compute()
+            if shared is not None:
+                # Versioned keys are never stale, so no timeout; old ones get evicted
+                shared.set(SHARED_KEY_PREFIX + key, value, timeout=None)
+        local_cache.set(key, value)
+    return value
+
+
+async def acached_catalog(name, acompute):
+    """Async version of cached_catalog(); acompute is a coroutine function"""
+    if not cache_enabled():
+        return await acompute()
+    key = f'{name}:{await acatalog_version()}'
+    value = local_cache.get(key, _missing)
+    if value is _missing:
+        shared = shared_cache()
+        if shared is not None:
+            value = await shared.aget(SHARED_KEY_PREFIX + key, _missing)
+        if value is _missing:
+            value = await acompute()
+            if shared is not None:
+                await shared.aset(SHARED_KEY_PREFIX + key, value, timeout=None)
+        local_cache.set(key, value)
+    return value
@@ -0,0 +1,38 @@
+"""
+SQLite connection profile.
+
+apply_sqlite_pragmas() runs on every new database connection and applies
+settings.SQLITE_PRAGMAS (WAL journal, synchronous=NORMAL, page cache, mmap,
+in-memory temp store, busy timeout), with settings.SQLITE_ALIAS_PRAGMAS
+overriding values per database alias. It is a no-op for other database
+backends or when settings.SQLITE_TUNING is False.
+"""
+import re
+
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+
+# Only these pragmas may be set from settings/env, and only to simple values
+ALLOWED_PRAGMAS = {
+    'journal_mode', 'synchronous', 'cache_size', 'mmap_size', 'temp_store', 'busy_timeout', 'query_only',
+}
+PRAGMA_VALUE = re.compile(r'^-?\w+$')
+
+
+@receiver(connection_created)
+def apply_sqlite_pragmas(sender, connection, **kwargs):
+    if connection.vendor != 'sqlite' or not getattr(settings, 'SQLITE_TUNING', False):
+        return
+    pragmas = {
+        **getattr(settings, 'SQLITE_PRAGMAS', {}),
+        **getattr(settings, 'SQLITE_ALIAS_PRAGMAS', {}).get(connection.alias, {}),
+    }
+    with connection.cursor() as cursor:
+        for name, value in pragmas.items():
+            if value is None or value == '':
+                continue
+            if name not in ALLOWED_PRAGMAS or not PRAGMA_VALUE.match(str(value)):
+                raise ValueError(f"Unsupported SQLite pragma setting: {name}={value!r}")
+            cursor.execute(f'PRAGMA {name} = {value}')
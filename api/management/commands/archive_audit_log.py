@@ -0,0 +1,68 @@
+"""
+Move old Audit_log rows into compressed monthly archive segments.
+
+Rows older than AUDIT_LOG_RETENTION_DAYS (or --days) are appended to
+AUDIT_LOG_ARCHIVE_DIR/audit-YYYY-MM.jsonl.gz, one month at a time in batches
+of ARCHIVE_BATCH_SIZE rows, each deleted from the database once it is on disk.
+The audit-logs endpoint keeps serving them from the archive. Safe to re-run after an interruption.
+
+Usage: python manage.py archive_audit_log [--days N] [--dry-run]
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db.models.functions import TruncMonth
+from django.utils import timezone
+
+from api.audit_archive import append_segment, archive_dir, month_key
+from api.models import AuditLog
+
+
+ARCHIVE_BATCH_SIZE = 500
+
+
+class Command(BaseCommand):
+    help = 'Archive audit log rows older than the retention period into monthly segment files'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=getattr(settings, 'AUDIT_LOG_RETENTION_DAYS', 90),
+                            help='keep rows newer than this many days in the database')
+        parser.add_argument('--dry-run', action='store_true',
+                            help='report what would be archived without writing or deleting')
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options['days'])
+        old_logs = AuditLog.objects.filter(date__lt=cutoff)
+        months = list(
+            old_logs.annotate(month=TruncMonth('date')).values_list('month', flat=True).distinct().order_by('month')
+        )
+        if not months:
+            self.stdout.write(f"No audit log rows older than {options['days']} days")
+            return
+
+        total = 0
+        for month_start in months:
+            month_end = (month_start + timedelta(days=32)).replace(day=1)
+            month_logs = old_logs.filter(date__gte=month_start, date__lt=month_end).order_by('date', 'table_id')
+            month = month_key(month_start)
+            if options['dry_run']:
+                count = month_logs.count()
+                self.stdout.write(f"  {month}: would archive {count} rows")
+                total += count
+                continue
+
+            # One segment member per batch, so a month never has to fit in memory
+            written = deleted = 0
+            while batch := list(month_logs[:ARCHIVE_BATCH_SIZE]):
+                written += append_segment(month, batch)
+                # Only delete once the segment and its index are on disk
+                removed, _ = AuditLog.objects.filter(table_id__in=[log.table_id for log in batch]).delete()
+                deleted += removed
+            self.stdout.write(f"  {month}: archived {written} rows, removed {deleted} from the database")
+            total += deleted
+
+        verb = 'Would archive' if options['dry_run'] else 'Archived'
+        self.stdout.write(self.style.SUCCESS(
+            f"{verb} {total} audit log rows older than {options['days']} days to {archive_dir()}"
+        ))
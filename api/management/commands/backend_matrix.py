@@ -0,0 +1,123 @@
+"""
+Run the integration checks and the concurrent read/write workload against each
+database backend, to compare them on the same data:
+
+  sqlite         a copy of the SQLite databases (settings.SQLITE_PATH), tuned profile
+  postgres       the POSTGRES_* database with persistent connections (CONN_MAX_AGE)
+  postgres-pool  the same database through psycopg's connection pool
+
+Postgres must be migrated and imported first:
+
+  DB_ENGINE=postgres python manage.py migrate
+  DB_ENGINE=postgres python import_all_csv.py --bulk
+
+The workload posts benchmark reviews, so point POSTGRES_DB at a scratch database.
+
+Each backend runs in child processes with DB_ENGINE set: verify_integration.py,
+then the benchmark_sqlite workload (movies pages and review upserts).
+
+Usage: python manage.py backend_matrix [--backends sqlite,postgres,postgres-pool]
+       [--readers 6] [--writers 2] [--seconds 10] [--json FILE]
+"""
+import json
+import os
+import shutil
+import sqlite3
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+
+BACKENDS = {
+    'sqlite': {'DB_ENGINE': 'sqlite'},
+    'postgres': {'DB_ENGINE': 'postgres', 'POSTGRES_POOL': 'False'},
+    'postgres-pool': {'DB_ENGINE': 'postgres', 'POSTGRES_POOL': 'True'},
+}
+
+
+def copy_sqlite(source, target):
+    source_db = sqlite3.connect(str(source))
+    target_db = sqlite3.connect(str(target))
+    source_db.backup(target_db)
+    source_db.close()
+    target_db.close()
+
+
+class Command(BaseCommand):
+    help = 'Run the integration checks and the benchmark workload against SQLite and PostgreSQL'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--backends', default='sqlite,postgres,postgres-pool',
+                            help='comma-separated backends to run (sqlite, postgres, postgres-pool)')
+        parser.add_argument('--readers', type=int, default=6, help='reader threads')
+        parser.add_argument('--writers', type=int, default=2, help='writer threads')
+        parser.add_argument('--seconds', type=float, default=10, help='duration of each workload run')
+        parser.add_argument('--json', dest='json_path', help='also write the results to this file')
+
+    def handle(self, *args, **options):
+        results = {}
+        for backend in options['backends'].split(','):
+            if backend not in BACKENDS:
+                raise CommandError(f"Unknown backend: {backend}")
+            self.stdout.write(f"Running {backend}...")
+            results[backend] = self.run_backend(backend, options)
+
+        self.report(results)
+        if options['json_path']:
+            with open(options['json_path'], 'w', encoding='utf-8') as f:
+                json.dump(results, f, indent=2)
+
+    def run_backend(self, backend, options):
+        workdir = Path(tempfile.mkdtemp(prefix='backend-matrix-'))
+        try:
+            env = dict(os.environ, **BACKENDS[backend])
+            if backend == 'sqlite':
+                # Run against copies so benchmark reviews don't land in the real database
+                sqlite_path = Path(env.get('SQLITE_PATH', settings.BASE_DIR / 'db.sqlite3'))
+                audit_path = Path(env.get('SQLITE_AUDIT_PATH', settings.BASE_DIR / 'audit.sqlite3'))
+                env['SQLITE_PATH'] = str(workdir / 'db.sqlite3')
+                env['SQLITE_AUDIT_PATH'] = str(workdir / 'audit.sqlite3')
+                env.pop('SQLITE_READ_PATH', None)
+                copy_sqlite(sqlite_path, env['SQLITE_PATH'])
+                copy_sqlite(audit_path, env['SQLITE_AUDIT_PATH'])
+
+            checks = subprocess.run(
+                [sys.executable, str(Path(settings.BASE_DIR) / 'verify_integration.py')],
+                env=env, capture_output=True, text=True
+            )
+            failed = [line for line in checks.stdout.splitlines() if line.startswith('FAIL')]
+
+            workload = subprocess.run(
+                [
+                    sys.executable, str(Path(settings.BASE_DIR) / 'manage.py'), 'benchmark_sqlite', '--worker',
+                    '--readers', str(options['readers']), '--writers', str(options['writers']),
+                    '--seconds', str(options['seconds']),
+                ],
+                env=env, capture_output=True, text=True
+            )
+            if workload.returncode != 0:
+                raise CommandError(f"{backend} workload failed:\n{workload.stderr}")
+            result = json.loads(workload.stdout.strip().splitlines()[-1])
+            result['checks'] = {'passed': checks.returncode == 0 and not failed, 'failures': failed}
+            return result
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    def report(self, results):
+        self.stdout.write('')
+        self.stdout.write(f"{'backend':<14} {'checks':<7} {'op':<6} {'ops/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'errors':>7}")
+        for backend, result in results.items():
+            checks = 'pass' if result['checks']['passed'] else 'FAIL'
+            for kind in ('read', 'write'):
+                row = result[kind]
+                self.stdout.write(
+                    f"{backend:<14} {checks:<7} {kind:<6} {row['ops_per_sec']:>9.1f} {row['p50_ms']:>9.2f} "
+                    f"{row['p95_ms']:>9.2f} {row['errors']:>7}"
+                )
+        for backend, result in results.items():
+            for line in result['checks']['failures']:
+                self.stdout.write(f"{backend}: {line}")
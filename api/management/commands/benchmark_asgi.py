@@ -0,0 +1,225 @@
+"""
+Compare request throughput of the read endpoints under WSGI and ASGI.
+
+Each mode runs in its own process against a copy of the databases, driving the
+project's real handlers in process (no HTTP server, so only Django and the
+database are measured) with --concurrency clients issuing requests back to back:
+
+  wsgi        databases_proj.wsgi with the sync views, one client per thread
+  asgi-sync   databases_proj.asgi with the sync views (each request hops to a thread)
+  asgi-async  databases_proj.asgi with the async views (ASYNC_VIEWS=True)
+
+Requests cycle through movies/shows pages, genres, actors, review listings and
+the signed-in user's top-rated titles. The report shows requests/sec, latency
+percentiles and non-200 responses.
+
+Usage: python manage.py benchmark_asgi [--concurrency 50] [--seconds 10] [--modes wsgi,asgi-sync,asgi-async] [--json FILE]
+"""
+import asyncio
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from .backend_matrix import copy_sqlite
+from .benchmark_sqlite import percentile
+
+
+MODES = {
+    'wsgi': {'ASYNC_VIEWS': 'False'},
+    'asgi-sync': {'ASYNC_VIEWS': 'False'},
+    'asgi-async': {'ASYNC_VIEWS': 'True'},
+}
+
+REQUESTS = [
+    ('/api/movies/', 'limit=20&sortBy=rating'),
+    ('/api/movies/', 'limit=20&sortBy=year&genre=Drama'),
+    ('/api/shows/', 'limit=20&sortBy=votes'),
+    ('/api/genres/', ''),
+    ('/api/show-genres/', ''),
+    ('/api/actors/', ''),
+    ('/api/reviews/movie/', 'limit=20'),
+    ('/api/reviews/show/', 'limit=20'),
+    ('/api/favorites/top-rated/', ''),
+]
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the read endpoints under WSGI (sync views) and ASGI (sync and async views)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--concurrency', type=int, default=50, help='concurrent clients')
+        parser.add_argument('--seconds', type=float, default=10, help='duration of each run')
+        parser.add_argument('--modes', default='wsgi,asgi-sync,asgi-async',
+                            help='comma-separated modes to run (wsgi, asgi-sync, asgi-async)')
+        parser.add_argument('--json', dest='json_path', help='also write the results to this file')
+        # Internal: run one mode's workload in this process and print JSON
+        parser.add_argument('--worker', help='internal')
+
+    def handle(self, *args, **options):
+        if options['worker']:
+            self.stdout.write(json.dumps(self.run_workload(options['worker'], options)))
+            return
+
+        results = {}
+        for mode in options['modes'].split(','):
+            if mode not in MODES:
+                raise CommandError(f"Unknown mode: {mode}")
+            self.stdout.write(f"Running {mode} ({options['concurrency']} clients, {options['seconds']:g}s)...")
+            results[mode] = self.run_mode(mode, options)
+
+        self.report(results)
+        if options['json_path']:
+            with open(options['json_path'], 'w', encoding='utf-8') as f:
+                json.dump(results, f, indent=2)
+
+    def run_mode(self, mode, options):
+        """Run the workload for ``mode`` in a child process, on copies of SQLite databases"""
+        workdir = Path(tempfile.mkdtemp(prefix='bench-asgi-'))
+        try:
+            env = dict(os.environ, **MODES[mode])
+            if connection.vendor == 'sqlite':
+                for alias, variable in (('default', 'SQLITE_PATH'), ('audit', 'SQLITE_AUDIT_PATH')):
+                    if alias in settings.DATABASES:
+                        env[variable] = str(workdir / f'{alias}.sqlite3')
+                        copy_sqlite(settings.DATABASES[alias]['NAME'], env[variable])
+                env.pop('SQLITE_READ_PATH', None)
+
+            command = [
+                sys.executable, str(Path(settings.BASE_DIR) / 'manage.py'), 'benchmark_asgi', '--worker', mode,
+                '--concurrency', str(options['concurrency']), '--seconds', str(options['seconds']),
+            ]
+            completed = subprocess.run(command, env=env, capture_output=True, text=True)
+            if completed.returncode != 0:
+                raise CommandError(f"{mode} run failed:\n{completed.stderr}")
+            return json.loads(completed.stdout.strip().splitlines()[-1])
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    def session_cookie(self):
+        from django.test import Client
+        from api.models import User
+
+        user = User.objects.get_or_create(email='bench-asgi@example.com')[0]
+        client = Client()
+        client.force_login(user)
+        return f"{settings.SESSION_COOKIE_NAME}={client.cookies[settings.SESSION_COOKIE_NAME].value}"
+
+    def run_workload(self, mode, options):
+        cookie = self.session_cookie()
+        connection.close()
+        deadline = time.monotonic() + options['seconds']
+        if mode == 'wsgi':
+            latencies, errors = self.run_wsgi(cookie, deadline, options['concurrency'])
+        else:
+            latencies, errors = asyncio.run(self.run_asgi(cookie, deadline, options['concurrency']))
+        elapsed = options['seconds']
+        return {
+            'requests': len(latencies),
+            'requests_per_sec': round(len(latencies) / elapsed, 1),
+            'p50_ms': round(percentile(latencies, 0.50), 2),
+            'p95_ms': round(percentile(latencies, 0.95), 2),
+            'errors': errors,
+        }
+
+    def run_wsgi(self, cookie, deadline, concurrency):
+        from databases_proj.wsgi import application
+
+        latencies, errors = [], 0
+        lock = threading.Lock()
+
+        def client(offset):
+            nonlocal errors
+            index = offset
+            while time.monotonic() < deadline:
+                path, query = REQUESTS[index % len(REQUESTS)]
+                index += 1
+                status = []
+                environ = {
+                    'REQUEST_METHOD': 'GET', 'PATH_INFO': path, 'QUERY_STRING': query,
+                    'SERVER_NAME': 'localhost', 'SERVER_PORT': '80', 'SERVER_PROTOCOL': 'HTTP/1.1',
+                    'HTTP_HOST': 'localhost', 'HTTP_COOKIE': cookie,
+                    'wsgi.input': io.BytesIO(b''), 'wsgi.errors': sys.stderr, 'wsgi.url_scheme': 'http',
+                    'wsgi.version': (1, 0), 'wsgi.multithread': True, 'wsgi.multiprocess': False,
+                    'wsgi.run_once': False,
+                }
+                started = time.perf_counter()
+                result = application(environ, lambda line, headers: status.append(line))
+                try:
+                    b''.join(result)
+                finally:
+                    result.close()  # fires request_finished, like a WSGI server
+                with lock:
+                    latencies.append((time.perf_counter() - started) * 1000)
+                    if not status[0].startswith('200'):
+                        errors += 1
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            list(executor.map(client, range(concurrency)))
+        return latencies, errors
+
+    async def run_asgi(self, cookie, deadline, concurrency):
+        from databases_proj.asgi import application
+
+        latencies, errors = [], 0
+
+        async def request(path, query):
+            body_sent = False
+
+            async def receive():
+                nonlocal body_sent
+                if not body_sent:
+                    body_sent = True
+                    return {'type': 'http.request', 'body': b'', 'more_body': False}
+                # The client stays connected; Django cancels this once the response is sent
+                await asyncio.Future()
+
+            status = []
+
+            async def send(message):
+                if message['type'] == 'http.response.start':
+                    status.append(message['status'])
+
+            scope = {
+                'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1', 'method': 'GET',
+                'scheme': 'http', 'path': path, 'raw_path': path.encode(), 'query_string': query.encode(),
+                'root_path': '', 'client': ('127.0.0.1', 0), 'server': ('localhost', 80),
+                'headers': [(b'host', b'localhost'), (b'cookie', cookie.encode())],
+            }
+            await application(scope, receive, send)
+            return status[0]
+
+        async def client(offset):
+            nonlocal errors
+            index = offset
+            while time.monotonic() < deadline:
+                path, query = REQUESTS[index % len(REQUESTS)]
+                index += 1
+                started = time.perf_counter()
+                status = await request(path, query)
+                latencies.append((time.perf_counter() - started) * 1000)
+                if status != 200:
+                    errors += 1
+
+        await asyncio.gather(*(client(offset) for offset in range(concurrency)))
+        return latencies, errors
+
+    def report(self, results):
+        self.stdout.write('')
+        self.stdout.write(f"{'mode':<11} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'errors':>7}")
+        for mode, row in results.items():
+            self.stdout.write(
+                f"{mode:<11} {row['requests_per_sec']:>9.1f} {row['p50_ms']:>9.2f} "
+                f"{row['p95_ms']:>9.2f} {row['errors']:>7}"
+            )
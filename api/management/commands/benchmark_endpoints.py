@@ -0,0 +1,412 @@
+"""
+Benchmark every route in api/urls.py, and gate on a saved baseline.
+
+Runs in a child process against copies of the SQLite databases (--database FILE
+copies another catalog database instead, with the audit.sqlite3 beside it if there
+is one, e.g. a dataset built by generate_dataset; on PostgreSQL it runs against
+POSTGRES_DB, so point that at a scratch database). Requests go
+one at a time through django.test.Client, so the full middleware stack, sessions
+and URL routing are included. Each round issues a mix modelled on the frontend:
+
+  catalog   movies/shows with every sortBy mode, genre and year filters, title
+            searches (relevance) and second pages via next_cursor; genres,
+            show genres, actors (the list and ?q= autocomplete)
+  library   a signed-in user's watch later, favorites, top-rated,
+            recommendations and review listings, plus review and watch-later
+            writes (POST/PUT/DELETE) on titles outside the seeded library
+  accounts  signup, signin (with and without the trailing slash), check-auth,
+            signout
+  other     testdb, metrics, audit logs with each filter, and the audit stream
+            (time to response headers; the event stream isn't consumed)
+
+A second, shorter pass runs under tracemalloc and query capture, so neither
+skews the latencies. Per endpoint (URL name and method) the report shows
+p50/p95/p99 latency, the most queries one request ran and the peak Python memory
+allocated while serving one request.
+
+--json FILE saves the results; pass such a file as --baseline to compare. A run
+fails (non-zero exit) when an endpoint runs more queries than in the baseline,
+or its p95 latency or peak allocation grows by more than --threshold (and by more
+than a small absolute margin, so sub-millisecond noise doesn't count).
+
+Usage: python manage.py benchmark_endpoints [--rounds 40] [--profile-rounds 10]
+       [--database FILE] [--json FILE] [--baseline FILE] [--threshold 0.25]
+"""
+import gc
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import defaultdict
+from contextlib import ExitStack
+from pathlib import Path
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve
+
+from api.audit import flush_audit_log
+
+from .backend_matrix import copy_sqlite
+from .benchmark_sqlite import percentile
+
+
+BENCH_EMAIL = 'bench-endpoints@example.com'
+BENCH_PASSWORD = 'bench-endpoints-password'
+LIBRARY_SIZE = 10  # titles seeded into the benchmark user's reviews and watch later
+SAMPLE_SIZE = 200  # titles sampled for the write requests
+
+# The dashboard always sends its year range and limit=100
+CATALOG_DEFAULTS = {'yearFrom': 1900, 'yearTo': 2024, 'limit': 100}
+SORTS = ['rating', 'votes', 'year', 'year_old', 'runtime', 'runtime_long']
+CATALOG_FILTERS = [
+    {},
+    {'genre': 'Drama'},
+    {'genre': 'Comedy'},
+    {'yearFrom': 1990, 'yearTo': 1999},
+    {'yearFrom': 2015, 'genre': 'Horror'},
+    {'titleSearch': 'love'},
+    {'titleSearch': 'the dark'},
+]
+SHOW_FILTERS = [{'maxRating': 'TV-PG'}, {'minRating': 8}]
+
+# Actor autocomplete as typed: short and longer prefixes, and a substring match
+ACTOR_SEARCHES = [{'q': 'a'}, {'q': 'to'}, {'q': 'tom k'}, {'q': 'son', 'match': 'substring'}]
+
+# Allowed growth over the baseline on top of --threshold
+MIN_LATENCY_DELTA_MS = 1.0
+MIN_ALLOC_DELTA_KB = 64
+
+
+def catalog_queries():
+    """Every sortBy mode crossed with the filters, in a fixed shuffled order"""
+    queries = [
+        dict(CATALOG_DEFAULTS, sortBy=sort, **filters)
+        for filters in CATALOG_FILTERS
+        for sort in SORTS + (['relevance'] if 'titleSearch' in filters else [])
+    ]
+    random.Random(0).shuffle(queries)
+    return queries
+
+
+class Command(BaseCommand):
+    help = 'Benchmark every API route (latency percentiles, queries, allocations) against a baseline'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rounds', type=int, default=40, help='timed rounds through every route')
+        parser.add_argument('--profile-rounds', type=int, default=10,
+                            help='rounds run under tracemalloc and query capture')
+        parser.add_argument('--database', help='SQLite database to copy instead of SQLITE_PATH')
+        parser.add_argument('--json', dest='json_path', help='also write the results to this file')
+        parser.add_argument('--baseline', help='results file to compare against; regressions fail the run')
+        parser.add_argument('--threshold', type=float, default=0.25,
+                            help='allowed relative growth of p95 latency and allocations (default 0.25)')
+        parser.add_argument('--seed', type=int, default=1, help='seed for the sampled titles')
+        # Internal: run the workload in this process and print JSON
+        parser.add_argument('--worker', action='store_true', help='internal')
+
+    def handle(self, *args, **options):
+        if options['worker']:
+            self.stdout.write(json.dumps(self.run_workload(options)))
+            return
+
+        self.stdout.write(f"Benchmarking endpoints ({connection.vendor}, {options['rounds']} rounds)...")
+        results = self.run_child(options)
+        self.report(results)
+        if options['json_path']:
+            with open(options['json_path'], 'w', encoding='utf-8') as f:
+                json.dump(results, f, indent=2)
+        if options['baseline']:
+            with open(options['baseline'], encoding='utf-8') as f:
+                baseline = json.load(f)
+            regressions = self.compare(baseline, results, options['threshold'])
+            if regressions:
+                raise CommandError(f"{len(regressions)} endpoint regression(s):\n" + '\n'.join(regressions))
+            self.stdout.write(f"No regressions against {options['baseline']}")
+
+    def run_child(self, options):
+        """Run the workload in a child process, on copies of SQLite databases"""
+        workdir = Path(tempfile.mkdtemp(prefix='bench-endpoints-'))
+        try:
+            env = dict(os.environ)
+            env.setdefault('DEBUG', 'False')  # no per-query logging in connection.queries
+            if connection.vendor == 'sqlite':
+                sources = {
+                    'default': settings.DATABASES['default']['NAME'],
+                    'audit': settings.DATABASES.get('audit', {}).get('NAME'),
+                }
+                if options['database']:
+                    sources['default'] = options['database']
+                    audit_path = Path(options['database']).with_name('audit.sqlite3')
+                    if audit_path.exists():
+                        sources['audit'] = audit_path
+                for alias, variable in (('default', 'SQLITE_PATH'), ('audit', 'SQLITE_AUDIT_PATH')):
+                    if sources[alias]:
+                        env[variable] = str(workdir / f'{alias}.sqlite3')
+                        copy_sqlite(sources[alias], env[variable])
+                env.pop('SQLITE_READ_PATH', None)
+            elif options['database']:
+                raise CommandError('--database only applies to SQLite')
+
+            command = [
+                sys.executable, str(Path(settings.BASE_DIR) / 'manage.py'), 'benchmark_endpoints', '--worker',
+                '--rounds', str(options['rounds']), '--profile-rounds', str(options['profile_rounds']),
+                '--seed', str(options['seed']),
+            ]
+            completed = subprocess.run(command, env=env, capture_output=True, text=True)
+            if completed.returncode != 0:
+                raise CommandError(f"Benchmark run failed:\n{completed.stderr}")
+            return json.loads(completed.stdout.strip().splitlines()[-1])
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    # ---- workload (child process) ----
+
+    def run_workload(self, options):
+        from django.test import Client
+        from api.models import AllFilms, AllShows, MovieGenre, MovieRating, User
+
+        # Sessions are looked up by host; django.test.Client's 'testserver' isn't allowed
+        clients = {
+            'user': Client(HTTP_HOST='localhost'),
+            'accounts': Client(HTTP_HOST='localhost'),
+            'anonymous': Client(HTTP_HOST='localhost'),
+        }
+        user = User.objects.filter(email=BENCH_EMAIL).first() or User.objects.create_user(
+            email=BENCH_EMAIL, password=BENCH_PASSWORD
+        )
+        clients['user'].force_login(user)
+
+        rng = random.Random(options['seed'])
+        film_ids = list(AllFilms.objects.values_list('film_id', flat=True))
+        show_ids = list(AllShows.objects.values_list('show_id', flat=True))
+        films = rng.sample(film_ids, min(SAMPLE_SIZE, len(film_ids)))
+        shows = rng.sample(show_ids, min(SAMPLE_SIZE, len(show_ids)))
+        reviewed_film = (
+            MovieRating.objects.values_list('film_id', flat=True).order_by('-id').first() or films[0]
+        )
+        state = {
+            'user_id': user.user_id,
+            'library_films': films[:LIBRARY_SIZE],
+            'library_shows': shows[:LIBRARY_SIZE],
+            'films': films[LIBRARY_SIZE:],
+            'shows': shows[LIBRARY_SIZE:],
+            'reviewed_film': reviewed_film,
+            'genre_id': MovieGenre.objects.values_list('genre_id', flat=True).first(),
+            'queries': catalog_queries(),
+        }
+        self.seed_library(clients['user'], state)
+        self.check_coverage()
+
+        # Warm-up round: first-request imports and connection setup
+        self.run_round(clients, state, 0, record=None)
+        latencies = defaultdict(list)
+        errors = defaultdict(int)
+
+        def record_latency(label, response, elapsed, queries, allocated):
+            latencies[label].append(elapsed * 1000)
+            if response.status_code >= 400:
+                errors[label] += 1
+
+        for index in range(options['rounds']):
+            self.run_round(clients, state, index, record=record_latency)
+
+        queries = defaultdict(int)
+        allocations = defaultdict(int)
+
+        def record_profile(label, response, elapsed, query_count, allocated):
+            queries[label] = max(queries[label], query_count)
+            allocations[label] = max(allocations[label], allocated)
+
+        tracemalloc.start()
+        try:
+            for index in range(options['profile_rounds']):
+                self.run_round(clients, state, index, record=record_profile, profile=True)
+        finally:
+            tracemalloc.stop()
+
+        return {
+            'vendor': connection.vendor,
+            'rounds': options['rounds'],
+            'dataset': {'films': len(film_ids), 'shows': len(show_ids), 'ratings': MovieRating.objects.count()},
+            'endpoints': {
+                label: {
+                    'requests': len(values),
+                    'p50_ms': round(percentile(values, 0.50), 2),
+                    'p95_ms': round(percentile(values, 0.95), 2),
+                    'p99_ms': round(percentile(values, 0.99), 2),
+                    'queries': queries[label],
+                    'alloc_kb': round(allocations[label] / 1024, 1),
+                    'errors': errors[label],
+                }
+                for label, values in sorted(latencies.items())
+            },
+        }
+
+    def seed_library(self, client, state):
+        """Give the benchmark user reviews, watch-later entries and favorites to read back"""
+        for film_id in state['library_films']:
+            client.post(f'/api/reviews/movie/{film_id}/', {'rating': 4, 'review': 'benchmark'},
+                        content_type='application/json')
+            client.post(f'/api/watch-later/movie/{film_id}/')
+        for show_id in state['library_shows']:
+            client.post(f'/api/reviews/show/{show_id}/', {'rating': 4, 'review': 'benchmark'},
+                        content_type='application/json')
+            client.post(f'/api/watch-later/show/{show_id}/')
+        client.put('/api/favorites/', {'fav_genre': state['genre_id'], 'fav_decade': '1990s'},
+                   content_type='application/json')
+
+    def check_coverage(self):
+        """Every named route in api/urls.py must be exercised by a round"""
+        from api import urls
+
+        covered = {resolve(path.split('?')[0]).url_name for _, _, path, _ in self.round_requests(self.sample_state())}
+        missing = sorted({pattern.name for pattern in urls.urlpatterns} - covered)
+        if missing:
+            raise CommandError(f"No benchmark requests for route(s): {', '.join(missing)}")
+
+    def sample_state(self):
+        return {
+            'user_id': 1, 'library_films': [1], 'library_shows': [1], 'films': [1], 'shows': [1],
+            'reviewed_film': 1, 'genre_id': 1, 'queries': catalog_queries(),
+        }
+
+    def round_requests(self, state, index=0):
+        """(client, method, path, JSON body) for one round"""
+        query = state['queries'][index % len(state['queries'])]
+        show_query = dict(query, **SHOW_FILTERS[index % len(SHOW_FILTERS)])
+        film = state['films'][index % len(state['films'])]
+        show = state['shows'][index % len(state['shows'])]
+        library_film = state['library_films'][index % len(state['library_films'])]
+        library_show = state['library_shows'][index % len(state['library_shows'])]
+        audit_filters = [{}, {'limit': 50}, {'action': 'review_create'}, {'entityType': 'movie'},
+                         {'userId': state['user_id']}]
+        email = f'bench-signup-{os.getpid()}-{index}-{time.monotonic_ns()}@example.com'
+        credentials = {'email': BENCH_EMAIL, 'password': BENCH_PASSWORD}
+        review = {'rating': index % 5 + 1, 'review': f'benchmark round {index}'}
+
+        requests = [
+            ('anonymous', 'GET', '/api/testdb/', None),
+            ('anonymous', 'GET', '/api/metrics/', None),
+            ('anonymous', 'GET', '/api/genres/', None),
+            ('anonymous', 'GET', '/api/show-genres/', None),
+            ('anonymous', 'GET', '/api/actors/', None),
+            ('anonymous', 'GET', f'/api/actors/?{urlencode(ACTOR_SEARCHES[index % len(ACTOR_SEARCHES)])}', None),
+            ('anonymous', 'GET', f'/api/movies/?{urlencode(query)}', None),
+            ('anonymous', 'GET', f'/api/shows/?{urlencode(show_query)}', None),
+            ('anonymous', 'GET', f'/api/audit-logs/?{urlencode(audit_filters[index % len(audit_filters)])}', None),
+            ('anonymous', 'GET', '/api/audit-logs/stream/', None),
+            # Accounts
+            ('accounts', 'POST', '/api/signup/', {'email': email, 'password': BENCH_PASSWORD}),
+            ('accounts', 'POST', '/api/signup', {'email': 'x' + email, 'password': BENCH_PASSWORD}),
+            ('accounts', 'POST', '/api/signin', credentials),
+            ('accounts', 'POST', '/api/signin/', credentials),
+            ('accounts', 'GET', '/api/check-auth/', None),
+            ('accounts', 'POST', '/api/signout/', None),
+            # Library reads
+            ('user', 'GET', '/api/watch-later/movie/', None),
+            ('user', 'GET', '/api/watch-later/show/', None),
+            ('user', 'GET', '/api/favorites/', None),
+            ('user', 'GET', '/api/favorites/top-rated/', None),
+            ('user', 'GET', '/api/favorites/recommendations/', None),
+            ('user', 'GET', '/api/reviews/movie/?limit=20', None),
+            ('user', 'GET', '/api/reviews/show/?limit=20', None),
+            ('user', 'GET', f'/api/reviews/movie/{library_film}/', None),
+            ('user', 'GET', f'/api/reviews/movie/{state["reviewed_film"]}/', None),
+            ('user', 'GET', f'/api/reviews/show/{library_show}/', None),
+            # Library writes, undone within the round
+            ('user', 'POST', '/api/favorites/', {'fav_decade': f'{1950 + index % 7 * 10}s'}),
+            ('user', 'POST', f'/api/watch-later/movie/{film}/', None),
+            ('user', 'DELETE', f'/api/watch-later/movie/{film}/', None),
+            ('user', 'POST', f'/api/watch-later/show/{show}/', None),
+            ('user', 'DELETE', f'/api/watch-later/show/{show}/', None),
+            ('user', 'POST', f'/api/reviews/movie/{film}/', review),
+            ('user', 'PUT', f'/api/reviews/movie/{film}/', dict(review, rating=5)),
+            ('user', 'DELETE', f'/api/reviews/movie/{film}/', None),
+            ('user', 'POST', f'/api/reviews/show/{show}/', review),
+            ('user', 'PUT', f'/api/reviews/show/{show}/', dict(review, rating=5)),
+            ('user', 'DELETE', f'/api/reviews/show/{show}/', None),
+        ]
+        return requests
+
+    def run_round(self, clients, state, index, record, profile=False):
+        for client_name, method, path, body in self.round_requests(state, index):
+            response = self.measure(clients[client_name], method, path, body, record, profile)
+            if path.startswith(('/api/movies/?', '/api/shows/?')):
+                # The next page, as the frontend would load it
+                next_cursor = json.loads(response.content).get('next_cursor')
+                if next_cursor:
+                    self.measure(clients[client_name], method, f'{path}&cursor={next_cursor}', body, record, profile)
+
+    def measure(self, client, method, path, body, record, profile):
+        query_count = allocated = 0
+        with ExitStack() as stack:
+            if profile:
+                # audit-logs writes out whatever is still queued; empty the queue first so
+                # its query count doesn't depend on the background writer's timing
+                flush_audit_log()
+                captures = [stack.enter_context(CaptureQueriesContext(connections[alias])) for alias in connections]
+                gc.collect()  # so garbage from earlier requests doesn't count towards this one's peak
+                tracemalloc.reset_peak()
+                traced_before = tracemalloc.get_traced_memory()[0]
+            started = time.perf_counter()
+            response = self.send(client, method, path, body)
+            elapsed = time.perf_counter() - started
+            if profile:
+                allocated = tracemalloc.get_traced_memory()[1] - traced_before
+                query_count = sum(len(capture.captured_queries) for capture in captures)
+        if record:
+            record(f"{resolve(path.split('?')[0]).url_name} {method}", response, elapsed, query_count, allocated)
+        return response
+
+    def send(self, client, method, path, body):
+        if body is None:
+            response = client.generic(method, path)
+        else:
+            response = client.generic(method, path, json.dumps(body), content_type='application/json')
+        if response.streaming:
+            # Only the time to the response headers; closing ends the stream
+            response.close()
+        return response
+
+    # ---- report and regression gate ----
+
+    def report(self, results):
+        dataset = results['dataset']
+        self.stdout.write(
+            f"\n{results['vendor']}: {dataset['films']} films, {dataset['shows']} shows, {dataset['ratings']} ratings"
+        )
+        self.stdout.write(
+            f"{'endpoint':<38} {'n':>4} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'queries':>7} "
+            f"{'alloc KB':>9} {'errors':>6}"
+        )
+        for label, row in results['endpoints'].items():
+            self.stdout.write(
+                f"{label:<38} {row['requests']:>4} {row['p50_ms']:>8.2f} {row['p95_ms']:>8.2f} "
+                f"{row['p99_ms']:>8.2f} {row['queries']:>7} {row['alloc_kb']:>9.1f} {row['errors']:>6}"
+            )
+
+    def compare(self, baseline, results, threshold):
+        """Regressions of ``results`` against ``baseline``, one line each"""
+        regressions = []
+        for label, row in results['endpoints'].items():
+            before = baseline['endpoints'].get(label)
+            if before is None:
+                continue
+            if row['queries'] > before['queries']:
+                regressions.append(f"{label}: {before['queries']} -> {row['queries']} queries")
+            if (row['p95_ms'] > before['p95_ms'] * (1 + threshold)
+                    and row['p95_ms'] - before['p95_ms'] > MIN_LATENCY_DELTA_MS):
+                regressions.append(f"{label}: p95 {before['p95_ms']:.2f} -> {row['p95_ms']:.2f} ms")
+            if (row['alloc_kb'] > before['alloc_kb'] * (1 + threshold)
+                    and row['alloc_kb'] - before['alloc_kb'] > MIN_ALLOC_DELTA_KB):
+                regressions.append(f"{label}: peak allocation {before['alloc_kb']:.1f} -> {row['alloc_kb']:.1f} KB")
+        return regressions
@@ -0,0 +1,201 @@
+"""
+Measure read/write throughput under concurrent workers with and without the
+SQLite connection profile (settings.SQLITE_PRAGMAS, api/db_tuning.py).
+
+Each profile runs in its own process against a fresh copy of the database:
+
+  baseline  rollback journal, SQLite defaults, deferred transactions, reads on 'default'
+  tuned     the configured profile (WAL, synchronous=NORMAL, cache, mmap, ...) with
+            catalog reads on the read-only alias
+
+Worker threads either read catalog pages through the movies view or post
+reviews (rating upsert plus aggregate update in one transaction), for a fixed
+duration. The report shows operations/sec, latency percentiles and how many
+operations failed with "database is locked".
+
+Usage: python manage.py benchmark_sqlite [--readers 6] [--writers 2] [--seconds 10] [--json FILE]
+"""
+import json
+import os
+import random
+import shutil
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import OperationalError, connection, connections, transaction
+from django.test import RequestFactory
+
+
+PROFILES = {
+    'baseline': {
+        'SQLITE_TUNING': 'False',
+        'SQLITE_TRANSACTION_MODE': 'DEFERRED',
+        'READ_ONLY_DATABASE': '',
+    },
+    'tuned': {
+        'SQLITE_TUNING': 'True',
+    },
+}
+
+BENCH_USERS = 50
+SORTS = ['rating', 'votes', 'year', 'runtime']
+
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+class Command(BaseCommand):
+    help = 'Benchmark concurrent reads/writes with and without the SQLite connection profile'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--readers', type=int, default=6, help='reader threads')
+        parser.add_argument('--writers', type=int, default=2, help='writer threads')
+        parser.add_argument('--seconds', type=float, default=10, help='duration of each run')
+        parser.add_argument('--profiles', default='baseline,tuned',
+                            help='comma-separated profiles to run (baseline, tuned)')
+        parser.add_argument('--json', dest='json_path', help='also write the results to this file')
+        # Internal: run one profile's workload in this process and print JSON
+        parser.add_argument('--worker', action='store_true', help='internal')
+
+    def handle(self, *args, **options):
+        if options['worker']:
+            # The workload itself runs on any backend (see backend_matrix)
+            self.stdout.write(json.dumps(self.run_workload(options)))
+            return
+        if connection.vendor != 'sqlite':
+            raise CommandError('benchmark_sqlite only applies to SQLite databases')
+
+        results = {}
+        for profile in options['profiles'].split(','):
+            if profile not in PROFILES:
+                raise CommandError(f"Unknown profile: {profile}")
+            self.stdout.write(f"Running {profile} ({options['readers']} readers, "
+                              f"{options['writers']} writers, {options['seconds']:g}s)...")
+            results[profile] = self.run_profile(profile, options)
+
+        self.report(results)
+        if options['json_path']:
+            with open(options['json_path'], 'w', encoding='utf-8') as f:
+                json.dump(results, f, indent=2)
+
+    def run_profile(self, profile, options):
+        """Copy the database and run the workload in a child process configured for ``profile``"""
+        workdir = Path(tempfile.mkdtemp(prefix='bench-sqlite-'))
+        try:
+            path = workdir / 'bench.sqlite3'
+            source = sqlite3.connect(str(settings.DATABASES['default']['NAME']))
+            target = sqlite3.connect(str(path))
+            source.backup(target)
+            source.close()
+            if profile == 'baseline':
+                target.execute('PRAGMA journal_mode = DELETE')
+            target.close()
+
+            env = dict(os.environ, SQLITE_PATH=str(path), **PROFILES[profile])
+            command = [
+                sys.executable, str(Path(settings.BASE_DIR) / 'manage.py'), 'benchmark_sqlite', '--worker',
+                '--readers', str(options['readers']), '--writers', str(options['writers']),
+                '--seconds', str(options['seconds']),
+            ]
+            completed = subprocess.run(command, env=env, capture_output=True, text=True)
+            if completed.returncode != 0:
+                raise CommandError(f"{profile} run failed:\n{completed.stderr}")
+            return json.loads(completed.stdout.strip().splitlines()[-1])
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    def run_workload(self, options):
+        from api import views
+        from api.models import AllFilms, MovieAverageRating, MovieRating, User
+
+        users = [
+            User.objects.get_or_create(email=f'bench{i}@example.com')[0]
+            for i in range(BENCH_USERS)
+        ]
+        film_ids = list(AllFilms.objects.values_list('film_id', flat=True)[:2000])
+        connections.close_all()
+
+        factory = RequestFactory()
+        deadline = time.monotonic() + options['seconds']
+        stats = {'read': [], 'write': [], 'read_errors': 0, 'write_errors': 0}
+        lock = threading.Lock()
+
+        def read_once(rng):
+            request = factory.get(f'/api/movies?limit=20&sortBy={rng.choice(SORTS)}')
+            response = views.movies(request)
+            if response.status_code != 200:
+                raise OperationalError(response.content[:200])
+
+        def write_once(rng):
+            with transaction.atomic():
+                film = AllFilms.objects.get(film_id=rng.choice(film_ids))
+                rating = rng.randint(1, 10)
+                review, created = MovieRating.objects.get_or_create(
+                    film_id=film, user_id=rng.choice(users),
+                    defaults={'user_rating': rating, 'user_review': 'benchmark'}
+                )
+                previous = None if created else review.user_rating
+                if not created:
+                    review.user_rating = rating
+                    review.save(update_fields=['user_rating'])
+                MovieAverageRating.apply_rating_change(film, previous, rating)
+
+        def worker(kind, seed):
+            rng = random.Random(seed)
+            operation = read_once if kind == 'read' else write_once
+            latencies, errors = [], 0
+            try:
+                while time.monotonic() < deadline:
+                    started = time.perf_counter()
+                    try:
+                        operation(rng)
+                        latencies.append((time.perf_counter() - started) * 1000)
+                    except OperationalError:
+                        errors += 1
+            finally:
+                connections.close_all()
+            with lock:
+                stats[kind] += latencies
+                stats[f'{kind}_errors'] += errors
+
+        threads = [threading.Thread(target=worker, args=('read', i)) for i in range(options['readers'])]
+        threads += [threading.Thread(target=worker, args=('write', 1000 + i)) for i in range(options['writers'])]
+        started = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.monotonic() - started
+
+        return {
+            kind: {
+                'ops': len(stats[kind]),
+                'ops_per_sec': round(len(stats[kind]) / elapsed, 1),
+                'p50_ms': round(percentile(stats[kind], 0.50), 2),
+                'p95_ms': round(percentile(stats[kind], 0.95), 2),
+                'errors': stats[f'{kind}_errors'],
+            }
+            for kind in ('read', 'write')
+        }
+
+    def report(self, results):
+        self.stdout.write('')
+        self.stdout.write(f"{'profile':<10} {'op':<6} {'ops/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'locked':>7}")
+        for profile, result in results.items():
+            for kind in ('read', 'write'):
+                row = result[kind]
+                self.stdout.write(
+                    f"{profile:<10} {kind:<6} {row['ops_per_sec']:>9.1f} {row['p50_ms']:>9.2f} "
+                    f"{row['p95_ms']:>9.2f} {row['errors']:>7}"
+                )
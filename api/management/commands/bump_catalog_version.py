@@ -0,0 +1,19 @@
+"""
+Invalidate the cached genres, show genres and actors responses.
+
+The import scripts do this themselves; run it after changing the catalog any
+other way (the admin, manual SQL, a restored backup).
+
+Usage: python manage.py bump_catalog_version
+"""
+from django.core.management.base import BaseCommand
+
+from api.catalog_cache import bump_catalog_version
+
+
+class Command(BaseCommand):
+    help = 'Bump the catalog version so every process recomputes its cached catalog responses'
+
+    def handle(self, *args, **options):
+        version = bump_catalog_version()
+        self.stdout.write(self.style.SUCCESS(f"Catalog version is now {version}"))
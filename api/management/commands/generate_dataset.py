@@ -0,0 +1,312 @@
+"""
+Generate a reproducible synthetic user-activity dataset on top of the catalog,
+for load and scale testing.
+
+The shipped data has films and shows but no users or activity. This adds, from
+a fixed --seed:
+
+  users          user<N>@generated.whattowatch.test, all with password 'generated'
+  ratings        Movie_rating / Show_user_rating, 1-5 around a per-title quality,
+                 some with review text; Movie/Show_average_rating are rebuilt after
+  watch later    Watch_later_movie / Watch_later_show
+  watched        Watched_movie / Watched_show
+  favorites      for about a third of the users
+  audit history  signins, reviews and watch-later events over the past year
+
+Activity is skewed the way real traffic is: titles are drawn with Zipf-like
+popularity (the title at popularity rank r has weight 1/r), and how many rows each
+user gets is heavy-tailed (Pareto), so a few titles and a few users account for
+much of the data. Every count scales with --scale.
+
+Rows are written with executemany (COPY on PostgreSQL), one transaction per
+table. With SQLite the dataset is built in --output DIR: db.sqlite3 and
+audit.sqlite3 there start as copies of the current databases, so the dev
+databases are untouched. Serve it with SQLITE_PATH=DIR/db.sqlite3
+SQLITE_AUDIT_PATH=DIR/audit.sqlite3, or benchmark it with
+`benchmark_endpoints --database DIR/db.sqlite3`. On PostgreSQL it is written into
+POSTGRES_DB, so point that at a scratch database.
+
+Usage: python manage.py generate_dataset --output DIR [--scale 1] [--seed 1]
+       [--users N] [--movie-ratings N] [--show-ratings N] [--watch-later N]
+       [--watched N] [--audit N]
+"""
+import os
+import random
+import subprocess
+import sys
+import time
+from datetime import timedelta
+from itertools import accumulate, islice
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management.color import no_style
+from django.db import connection, connections, router, transaction
+from django.utils import timezone
+
+from api.models import (
+    Actors, AllFilms, AllShows, AuditLog, Favorites, MovieRating, ShowUserRating, User,
+    WatchedMovie, WatchedShow, WatchLaterMovie, WatchLaterShow,
+)
+
+from .backend_matrix import copy_sqlite
+
+
+EMAIL_DOMAIN = 'generated.whattowatch.test'
+PASSWORD = 'generated'
+BATCH_SIZE = 10000
+
+# Rows at --scale 1 (about 4.5M in total)
+DEFAULT_COUNTS = {
+    'users': 100_000,
+    'movie_ratings': 2_000_000,
+    'show_ratings': 400_000,
+    'watch_later': 500_000,  # split 4:1 between movies and shows
+    'watched': 1_000_000,  # split 4:1 between movies and shows
+    'audit': 500_000,
+}
+FAVORITES_SHARE = 0.3
+REVIEW_SHARE = 0.15  # ratings that come with review text
+PER_USER_CAP = 0.1  # no user gets rows for more than this share of the titles
+AUDIT_DAYS = 365
+
+REVIEW_TEXTS = [
+    'Loved it.', 'Not for me.', 'A classic.', 'Better than I expected.', 'Overrated.',
+    'Great performances, weak ending.', 'Would watch again.', 'Slow start but worth it.',
+    'The soundtrack is fantastic.', 'Fell asleep halfway through.',
+]
+DECADES = ['1960s', '1970s', '1980s', '1990s', '2000s', '2010s', '2020s']
+# (action, weight, entity type)
+AUDIT_ACTIONS = [
+    ('signin', 40, 'user'),
+    ('review_create', 20, 'movie'),
+    ('watch_later_add', 15, 'movie'),
+    ('review_update', 8, 'movie'),
+    ('watch_later_remove', 5, 'movie'),
+    ('favorites_update', 5, 'user'),
+    ('signout', 4, 'user'),
+    ('signup', 3, 'user'),
+]
+
+
+def batches(rows, size):
+    rows = iter(rows)
+    while batch := list(islice(rows, size)):
+        yield batch
+
+
+def bulk_insert(using, model, fields, rows):
+    """Write tuples of ``fields`` values into ``model``'s table in one transaction.
+
+    COPY on PostgreSQL, batched executemany elsewhere. Returns the row count.
+    """
+    db = connections[using]
+    table = db.ops.quote_name(model._meta.db_table)
+    columns = ', '.join(db.ops.quote_name(model._meta.get_field(name).column) for name in fields)
+    count = 0
+    with transaction.atomic(using=using), db.cursor() as cursor:
+        if db.vendor == 'postgresql':
+            with cursor.cursor.copy(f'COPY {table} ({columns}) FROM STDIN') as copy:
+                for row in rows:
+                    copy.write_row(row)
+                    count += 1
+        else:
+            sql = f"INSERT INTO {table} ({columns}) VALUES ({', '.join(['%s'] * len(fields))})"
+            for batch in batches(rows, BATCH_SIZE):
+                cursor.executemany(sql, batch)
+                count += len(batch)
+    return count
+
+
+class PopularitySampler:
+    """Draws ids with Zipf-like popularity: the id at rank r (random order) has weight 1/r"""
+
+    def __init__(self, ids, rng, exponent=1.0):
+        self.rng = rng
+        self.ids = list(ids)
+        rng.shuffle(self.ids)
+        self.cum_weights = list(accumulate(1 / (rank + 1) ** exponent for rank in range(len(self.ids))))
+
+    def choices(self, k):
+        """``k`` ids, with repeats"""
+        return self.rng.choices(self.ids, cum_weights=self.cum_weights, k=k)
+
+    def distinct(self, k):
+        """``k`` different ids, sorted"""
+        chosen = set()
+        while len(chosen) < k:
+            chosen.update(self.choices(k - len(chosen)))
+        return sorted(chosen)
+
+
+def activity_counts(rng, users, total, cap):
+    """Rows per user: Pareto-distributed, capped at ``cap`` and scaled to about ``total``"""
+    raw = [rng.paretovariate(1.5) for _ in range(users)]
+    scale = total / sum(raw)
+    for _ in range(5):  # capping lowers the total; rescale the rest to make up for it
+        counts = [min(cap, int(value * scale)) for value in raw]
+        assigned = sum(counts)
+        if not assigned or abs(total - assigned) <= total * 0.001:
+            break
+        scale *= total / assigned
+    return counts
+
+
+class Command(BaseCommand):
+    help = 'Generate a seeded synthetic dataset of users, ratings, watch lists, favorites and audit history'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--output', help='directory to build the SQLite databases in')
+        parser.add_argument('--scale', type=float, default=1.0, help='multiplier for every row count')
+        parser.add_argument('--seed', type=int, default=1, help='random seed')
+        for name, default in DEFAULT_COUNTS.items():
+            parser.add_argument(f"--{name.replace('_', '-')}", type=int,
+                                help=f'{name.replace("_", " ")} rows (default {default:,} x scale)')
+        # Internal: generate into the configured databases
+        parser.add_argument('--worker', action='store_true', help='internal')
+
+    def handle(self, *args, **options):
+        counts = {
+            name: options[name] if options[name] is not None else int(default * options['scale'])
+            for name, default in DEFAULT_COUNTS.items()
+        }
+        if options['worker'] or connection.vendor != 'sqlite':
+            if options['output'] and not options['worker']:
+                raise CommandError('--output only applies to SQLite')
+            self.generate(counts, options['seed'])
+            return
+
+        if not options['output']:
+            raise CommandError('--output DIR is required with SQLite')
+        output = Path(options['output']).resolve()
+        env = dict(os.environ, SQLITE_PATH=str(output / 'db.sqlite3'), SQLITE_AUDIT_PATH=str(output / 'audit.sqlite3'))
+        env.pop('SQLITE_READ_PATH', None)
+        if Path(env['SQLITE_PATH']).exists():
+            raise CommandError(f"{env['SQLITE_PATH']} already exists")
+        output.mkdir(parents=True, exist_ok=True)
+        copy_sqlite(settings.DATABASES['default']['NAME'], env['SQLITE_PATH'])
+        if 'audit' in settings.DATABASES:
+            copy_sqlite(settings.DATABASES['audit']['NAME'], env['SQLITE_AUDIT_PATH'])
+
+        command = [
+            sys.executable, str(Path(settings.BASE_DIR) / 'manage.py'), 'generate_dataset', '--worker',
+            '--seed', str(options['seed']),
+        ]
+        for name, count in counts.items():
+            command += [f"--{name.replace('_', '-')}", str(count)]
+        if subprocess.run(command, env=env).returncode != 0:
+            raise CommandError('Dataset generation failed')
+        self.stdout.write(self.style.SUCCESS(f"Dataset written to {output}"))
+
+    def generate(self, counts, seed):
+        if User.objects.filter(email__endswith=f'@{EMAIL_DOMAIN}').exists():
+            raise CommandError('This database already has a generated dataset')
+        rng = random.Random(seed)
+        started = time.perf_counter()
+
+        films = list(AllFilms.objects.values_list('film_id', 'film_name', 'director_id', 'genre_id'))
+        shows = list(AllShows.objects.values_list('show_id', 'show_name', 'rating'))
+        if not films or not shows:
+            raise CommandError('Import the catalog first (import_all_csv.py)')
+        film_sampler = PopularitySampler([film[0] for film in films], rng)
+        show_sampler = PopularitySampler([show[0] for show in shows], rng)
+        # Per-title mean rating: shows from their IMDb-style rating, films at random
+        film_quality = {film[0]: rng.gauss(3.3, 0.6) for film in films}
+        show_quality = {show[0]: float(show[2]) / 2 if show[2] else rng.gauss(3.5, 0.5) for show in shows}
+
+        first_user = (User.objects.order_by('-user_id').values_list('user_id', flat=True).first() or 0) + 1
+        user_ids = range(first_user, first_user + counts['users'])
+        self.write('users', User, ['user_id', 'email', 'password'], self.user_rows(user_ids))
+
+        self.write('movie ratings', MovieRating, ['user_id', 'film_id', 'user_rating', 'user_review'],
+                   self.rating_rows(rng, user_ids, film_sampler, film_quality, counts['movie_ratings']))
+        self.write('show ratings', ShowUserRating, ['user_id', 'show_id', 'user_rating', 'user_review'],
+                   self.rating_rows(rng, user_ids, show_sampler, show_quality, counts['show_ratings']))
+        for label, model, key, sampler, total in (
+            ('watch-later movies', WatchLaterMovie, 'film_id', film_sampler, counts['watch_later'] * 4 // 5),
+            ('watch-later shows', WatchLaterShow, 'show_id', show_sampler, counts['watch_later'] // 5),
+            ('watched movies', WatchedMovie, 'film_id', film_sampler, counts['watched'] * 4 // 5),
+            ('watched shows', WatchedShow, 'show_id', show_sampler, counts['watched'] // 5),
+        ):
+            self.write(label, model, ['user_id', key], self.list_rows(rng, user_ids, sampler, total))
+        self.write('favorites', Favorites, ['user_id', 'fav_genre', 'fav_director', 'fav_decade', 'fav_actor'],
+                   self.favorite_rows(rng, user_ids, films, film_sampler))
+        self.write('audit entries', AuditLog,
+                   ['date', 'changes_to_data', 'user_id', 'action', 'entity_type', 'entity_id'],
+                   self.audit_rows(rng, user_ids, films, film_sampler, counts['audit']))
+
+        if connection.vendor == 'postgresql':
+            # user_ids were assigned here, not by the sequence
+            with connection.cursor() as cursor:
+                for sql in connection.ops.sequence_reset_sql(no_style(), [User]):
+                    cursor.execute(sql)
+        call_command('rebuild_rating_aggregates', stdout=self.stdout)
+        self.stdout.write(self.style.SUCCESS(f"Generated the dataset in {time.perf_counter() - started:.1f}s"))
+
+    def write(self, label, model, fields, rows):
+        started = time.perf_counter()
+        count = bulk_insert(router.db_for_write(model), model, fields, rows)
+        elapsed = time.perf_counter() - started
+        self.stdout.write(f"  {count:,} {label} in {elapsed:.1f}s ({count / elapsed if elapsed else 0:,.0f} rows/sec)")
+
+    def user_rows(self, user_ids):
+        # One hash for everyone: hashing each password would take hours at this size
+        password = make_password(PASSWORD)
+        for user_id in user_ids:
+            yield user_id, f'user{user_id}@{EMAIL_DOMAIN}', password
+
+    def rating_rows(self, rng, user_ids, sampler, quality, total):
+        counts = activity_counts(rng, len(user_ids), total, max(1, int(len(sampler.ids) * PER_USER_CAP)))
+        for user_id, count in zip(user_ids, counts):
+            for item_id in sampler.distinct(count):
+                rating = min(5, max(1, round(rng.gauss(quality[item_id], 1.0))))
+                review = rng.choice(REVIEW_TEXTS) if rng.random() < REVIEW_SHARE else None
+                yield user_id, item_id, rating, review
+
+    def list_rows(self, rng, user_ids, sampler, total):
+        counts = activity_counts(rng, len(user_ids), total, max(1, int(len(sampler.ids) * PER_USER_CAP)))
+        for user_id, count in zip(user_ids, counts):
+            for item_id in sampler.distinct(count):
+                yield user_id, item_id
+
+    def favorite_rows(self, rng, user_ids, films, film_sampler):
+        by_id = {film[0]: film for film in films}
+        # Favorite actors come from the cast of popular films
+        actor_names = sorted(set(
+            Actors.objects.filter(film_id__in=film_sampler.ids[:1000]).values_list('actor_name', flat=True)
+        ))
+        for user_id in user_ids:
+            if rng.random() >= FAVORITES_SHARE:
+                continue
+            _, _, director_id, genre_id = by_id[film_sampler.choices(1)[0]]
+            actor = rng.choice(actor_names) if actor_names and rng.random() < 0.5 else None
+            yield user_id, genre_id, director_id if rng.random() < 0.5 else None, rng.choice(DECADES), actor
+
+    def audit_rows(self, rng, user_ids, films, film_sampler, total):
+        names = {film[0]: film[1] for film in films}
+        user_sampler = PopularitySampler(user_ids, rng, exponent=0.8)
+        actions, weights, entity_types = zip(*AUDIT_ACTIONS)
+        db = connections[router.db_for_write(AuditLog)]
+        start = timezone.now() - timedelta(days=AUDIT_DAYS)
+        step = timedelta(days=AUDIT_DAYS) / max(total, 1)
+        for first in range(0, total, BATCH_SIZE):
+            size = min(BATCH_SIZE, total - first)
+            draws = zip(
+                user_sampler.choices(size),
+                rng.choices(range(len(actions)), weights=weights, k=size),
+                film_sampler.choices(size),
+            )
+            for index, (user_id, action_index, film_id) in enumerate(draws, first):
+                action, entity_type = actions[action_index], entity_types[action_index]
+                email = f'user{user_id}@{EMAIL_DOMAIN}'
+                if entity_type == 'movie':
+                    entity_id = film_id
+                    text = f"User {email} {action.replace('_', ' ')} for movie '{names[film_id]}'"
+                else:
+                    entity_id = user_id
+                    text = f"Authorization event - User {action}: User {email} (User ID: {user_id})"
+                date = db.ops.adapt_datetimefield_value(start + step * (index + rng.random()))
+                yield date, text, user_id, action, entity_type, entity_id
@@ -0,0 +1,22 @@
+"""
+Rebuild the Actor_name index from Actors and Acted_in.
+
+The import scripts do this themselves; run it after changing cast lists any
+other way (the admin, manual SQL). Also bumps the catalog version so cached
+actor lists are recomputed.
+
+Usage: python manage.py rebuild_actor_names
+"""
+from django.core.management.base import BaseCommand
+
+from api.actor_names import rebuild_actor_names
+from api.catalog_cache import bump_catalog_version
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the cleaned, deduplicated actor name table used by /api/actors/'
+
+    def handle(self, *args, **options):
+        count = rebuild_actor_names()
+        bump_catalog_version()
+        self.stdout.write(self.style.SUCCESS(f"Indexed {count} actor names"))
@@ -0,0 +1,48 @@
+"""
+Rebuild Movie_Average_rating and Show_average_rating from the rating tables.
+
+The views keep these tables current on every review change; run this after
+bulk edits that bypass the views (imports, user deletions, manual SQL).
+
+Usage: python manage.py rebuild_rating_aggregates
+"""
+from decimal import ROUND_HALF_UP, Decimal
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, Sum
+
+from api.models import MovieRating, MovieAverageRating, ShowUserRating, ShowAverageRating
+
+
+class Command(BaseCommand):
+    help = 'Recompute stored rating sums, counts and averages for all films and shows'
+
+    def handle(self, *args, **options):
+        movies = self.rebuild(MovieRating, MovieAverageRating, 'film_id', 'film_id__film_name')
+        shows = self.rebuild(ShowUserRating, ShowAverageRating, 'show_id', 'show_id__show_name')
+        self.stdout.write(self.style.SUCCESS(
+            f"Rebuilt rating aggregates for {movies} films and {shows} shows"
+        ))
+
+    def rebuild(self, rating_model, aggregate_model, key, name_path):
+        """Replace every aggregate row for one rating table in a single transaction"""
+        rows = rating_model.objects.values(key, name_path).annotate(
+            total=Sum('user_rating'),
+            votes=Count('id')
+        )
+        aggregates = [
+            aggregate_model(**{
+                f'{key}_id': row[key],
+                aggregate_model.name_field: row[name_path],
+                'rating_sum': row['total'],
+                'rating_count': row['votes'],
+                # Half away from zero, like SQL ROUND() in RatingAggregateMixin.apply_rating_change
+                'average_score': (Decimal(row['total']) / row['votes']).quantize(Decimal('0.01'), ROUND_HALF_UP),
+            })
+            for row in rows
+        ]
+        with transaction.atomic():
+            aggregate_model.objects.all().delete()
+            aggregate_model.objects.bulk_create(aggregates, batch_size=500)
+        return len(aggregates)
@@ -0,0 +1,259 @@
+"""
+Per-request performance metrics.
+
+RequestMetricsMiddleware times every request and, through an execute wrapper
+installed on every database connection as it opens, the SQL it runs. Each request is recorded under
+its URL name from api/urls.py (unresolved paths under 'unmatched') into in-process
+histograms of:
+
+  wall time       seconds from the middleware to the response
+  DB time         seconds spent executing SQL, across all database aliases
+  query count     statements executed
+  response bytes  body size (streaming responses aren't counted)
+
+GET /api/metrics/ renders them in the Prometheus text format. Histograms are per
+process: with several workers each one exposes its own, and Prometheus sums them.
+
+A request slower than METRICS_SLOW_REQUEST_MS is logged to 'api.metrics' with the
+first METRICS_SLOW_SQL_LIMIT statements it ran and their timings. Recording costs a
+perf_counter() pair per query plus one lock per request, so it stays enabled in
+production; METRICS_ENABLED = False leaves the middleware out altogether.
+"""
+import logging
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+
+logger = logging.getLogger(__name__)
+
+UNMATCHED_ROUTE = 'unmatched'
+
+SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 250)
+BYTES_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+HISTOGRAMS = (
+    # (metric name, help, buckets)
+    ('api_request_duration_seconds', 'Wall time of a request, by URL name', SECONDS_BUCKETS),
+    ('api_request_db_seconds', 'Time spent executing SQL per request, by URL name', SECONDS_BUCKETS),
+    ('api_request_queries', 'SQL statements executed per request, by URL name', QUERY_BUCKETS),
+    ('api_response_bytes', 'Response body size, by URL name', BYTES_BUCKETS),
+)
+
+
+class Histogram:
+    """Counts of observations per bucket upper bound, plus their sum"""
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+    def cumulative(self):
+        """(upper bound, observations <= bound) pairs, ending with +Inf"""
+        total = 0
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            total += count
+            yield bound, total
+
+
+class RequestMetrics:
+    """Histograms and response counts keyed by (URL name, method)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {}  # (route, method) -> [Histogram per HISTOGRAMS entry]
+        self._responses = {}  # (route, method, status) -> count
+
+    def observe(self, route, method, status, duration, db_time, queries, size):
+        with self._lock:
+            histograms = self._histograms.get((route, method))
+            if histograms is None:
+                histograms = self._histograms[(route, method)] = [
+                    Histogram(buckets) for _, _, buckets in HISTOGRAMS
+                ]
+            for histogram, value in zip(histograms, (duration, db_time, queries, size)):
+                if value is not None:
+                    histogram.observe(value)
+            key = (route, method, status)
+            self._responses[key] = self._responses.get(key, 0) + 1
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self._responses.clear()
+
+    def snapshot(self):
+        """{(route, method): {metric name: (cumulative buckets, count, sum)}}"""
+        with self._lock:
+            return {
+                key: {
+                    name: (list(histogram.cumulative()), sum(histogram.counts), histogram.sum)
+                    for (name, _, _), histogram in zip(HISTOGRAMS, histograms)
+                }
+                for key, histograms in self._histograms.items()
+            }
+
+    def render(self):
+        """The metrics in the Prometheus text exposition format (version 0.0.4)"""
+        with self._lock:
+            responses = sorted(self._responses.items())
+        snapshot = self.snapshot()
+
+        lines = [
+            '# HELP api_requests_total Requests handled, by URL name, method and status',
+            '# TYPE api_requests_total counter',
+        ]
+        for (route, method, status), count in responses:
+            lines.append(f'api_requests_total{{{labels(route, method)},status="{status}"}} {count}')
+
+        for name, help_text, _ in HISTOGRAMS:
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} histogram')
+            for (route, method), histograms in sorted(snapshot.items()):
+                buckets, count, total = histograms[name]
+                for bound, cumulative in buckets:
+                    le = '+Inf' if bound == float('inf') else format_number(bound)
+                    lines.append(f'{name}_bucket{{{labels(route, method)},le="{le}"}} {cumulative}')
+                lines.append(f'{name}_count{{{labels(route, method)}}} {count}')
+                lines.append(f'{name}_sum{{{labels(route, method)}}} {format_number(total)}')
+        return '\n'.join(lines) + '\n'
+
+
+def escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def labels(route, method):
+    return f'route="{escape_label(route)}",method="{escape_label(method)}"'
+
+
+def format_number(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+request_metrics = RequestMetrics()
+
+
+class QueryRecorder:
+    """Times and counts the statements of one request (or any block, see record_queries)"""
+
+    def __init__(self, keep_sql, parent=None):
+        self.keep_sql = keep_sql
+        self.parent = parent  # an enclosing recorder also sees these statements
+        self.count = 0
+        self.seconds = 0.0
+        self.statements = []  # (alias, seconds, sql), up to keep_sql of them
+
+    def add(self, alias, seconds, sql):
+        self.count += 1
+        self.seconds += seconds
+        if len(self.statements) < self.keep_sql:
+            self.statements.append((alias, seconds, sql))
+        if self.parent is not None:
+            self.parent.add(alias, seconds, sql)
+
+
+# The recorder of the request being handled. A context variable rather than a
+# per-request wrapper on the connections: async views run their queries on
+# another thread's connections, and sync_to_async copies the context across.
+_recorder = ContextVar('request_query_recorder', default=None)
+
+
+@contextmanager
+def record_queries(keep_sql):
+    """Record the statements run in this block, on any alias and any thread it awaits"""
+    recorder = QueryRecorder(keep_sql, parent=_recorder.get())
+    token = _recorder.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _recorder.reset(token)
+
+
+def execute_wrapper(alias):
+    def record(execute, sql, params, many, context):
+        recorder = _recorder.get()
+        if recorder is None:
+            return execute(sql, params, many, context)
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            recorder.add(alias, time.perf_counter() - started, sql)
+    record.metrics_wrapper = True
+    return record
+
+
+@receiver(connection_created)
+def install_execute_wrapper(sender, connection, **kwargs):
+    """Time queries on every connection; a reconnect keeps the existing wrapper"""
+    if not any(getattr(wrapper, 'metrics_wrapper', False) for wrapper in connection.execute_wrappers):
+        connection.execute_wrappers.append(execute_wrapper(connection.alias))
+
+
+class RequestMetricsMiddleware:
+    """Record wall time, DB time, query count and response size per URL name"""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'METRICS_ENABLED', True):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.slow_seconds = getattr(settings, 'METRICS_SLOW_REQUEST_MS', 500) / 1000
+        self.keep_sql = getattr(settings, 'METRICS_SLOW_SQL_LIMIT', 20)
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        started = time.perf_counter()
+        with record_queries(self.keep_sql) as recorder:
+            response = self.get_response(request)
+        self.record(request, response, recorder, time.perf_counter() - started)
+        return response
+
+    async def __acall__(self, request):
+        started = time.perf_counter()
+        with record_queries(self.keep_sql) as recorder:
+            response = await self.get_response(request)
+        self.record(request, response, recorder, time.perf_counter() - started)
+        return response
+
+    def record(self, request, response, recorder, duration):
+        match = getattr(request, 'resolver_match', None)
+        route = (match.url_name if match else None) or UNMATCHED_ROUTE
+        size = None if response.streaming else len(response.content)
+        request_metrics.observe(
+            route, request.method, response.status_code, duration, recorder.seconds, recorder.count, size
+        )
+        if duration >= self.slow_seconds:
+            self.log_slow_request(request, route, response, recorder, duration)
+
+    def log_slow_request(self, request, route, response, recorder, duration):
+        statements = '\n'.join(
+            f'  [{alias}] {seconds * 1000:.1f} ms: {sql}' for alias, seconds, sql in recorder.statements
+        )
+        if recorder.count > len(recorder.statements):
+            statements += f'\n  ... {recorder.count - len(recorder.statements)} more'
+        logger.warning(
+            'Slow request %s %s (%s) -> %s: %.1f ms, %d queries in %.1f ms\n%s',
+            request.method, request.get_full_path(), route, response.status_code,
+            duration * 1000, recorder.count, recorder.seconds * 1000, statements,
+        )
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-17 22:53
+
+import re
+
+from django.db import migrations, models
+
+
+def backfill_show_years(apps, schema_editor):
+    """Parse the existing Years strings into Start_year/End_year"""
+    AllShows = apps.get_model('api', 'AllShows')
+    shows = list(AllShows.objects.exclude(years__isnull=True).exclude(years='').only('show_id', 'years'))
+    for show in shows:
+        found = [int(y) for y in re.findall(r'\d{4}', show.years)]
+        show.start_year = found[0] if found else None
+        show.end_year = found[1] if len(found) > 1 else None
+    AllShows.objects.bulk_update(shows, ['start_year', 'end_year'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='allshows',
+            name='end_year',
+            field=models.IntegerField(blank=True, db_column='End_year', db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='allshows',
+            name='start_year',
+            field=models.IntegerField(blank=True, db_column='Start_year', db_index=True, null=True),
+        ),
+        migrations.RunPython(backfill_show_years, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,83 @@
+# Generated by Django 5.2.18 on 2026-10-17 22:54
+
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def backfill_rating_aggregates(apps, schema_editor):
+    """Seed the aggregate tables from the ratings already stored"""
+    for rating_model, aggregate_model, key, name_field, name_path in (
+        ('MovieRating', 'MovieAverageRating', 'film_id', 'film_name', 'film_id__film_name'),
+        ('ShowUserRating', 'ShowAverageRating', 'show_id', 'show_name', 'show_id__show_name'),
+    ):
+        Rating = apps.get_model('api', rating_model)
+        Aggregate = apps.get_model('api', aggregate_model)
+        rows = Rating.objects.values(key, name_path).annotate(total=Sum('user_rating'), votes=Count('id'))
+        Aggregate.objects.all().delete()
+        Aggregate.objects.bulk_create([
+            Aggregate(**{
+                f'{key}_id': row[key],
+                name_field: row[name_path],
+                'rating_sum': row['total'],
+                'rating_count': row['votes'],
+                'average_score': round(row['total'] / row['votes'], 2),
+            })
+            for row in rows
+        ], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0002_allshows_start_end_year'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='movieaveragerating',
+            name='rating_count',
+            field=models.IntegerField(db_column='Rating_count', default=0),
+        ),
+        migrations.AddField(
+            model_name='movieaveragerating',
+            name='rating_sum',
+            field=models.IntegerField(db_column='Rating_sum', default=0),
+        ),
+        migrations.AddField(
+            model_name='showaveragerating',
+            name='rating_count',
+            field=models.IntegerField(db_column='Rating_count', default=0),
+        ),
+        migrations.AddField(
+            model_name='showaveragerating',
+            name='rating_sum',
+            field=models.IntegerField(db_column='Rating_sum', default=0),
+        ),
+        migrations.AlterField(
+            model_name='movieaveragerating',
+            name='average_score',
+            field=models.DecimalField(db_column='Average_score', decimal_places=2, max_digits=4),
+        ),
+        migrations.AlterField(
+            model_name='showaveragerating',
+            name='average_score',
+            field=models.DecimalField(db_column='Average_score', decimal_places=2, max_digits=4),
+        ),
+        migrations.AddIndex(
+            model_name='movieaveragerating',
+            index=models.Index(fields=['average_score'], name='movie_avg_score_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='movieaveragerating',
+            index=models.Index(fields=['rating_count'], name='movie_avg_count_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='showaveragerating',
+            index=models.Index(fields=['average_score'], name='show_avg_score_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='showaveragerating',
+            index=models.Index(fields=['rating_count'], name='show_avg_count_idx'),
+        ),
+        migrations.RunPython(backfill_rating_aggregates, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.2.18 on 2026-10-17 22:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_rating_aggregates'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='allfilms',
+            index=models.Index(fields=['year', 'duration'], name='films_year_duration_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='allfilms',
+            index=models.Index(fields=['genre_id', 'year'], name='films_genre_year_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='allfilms',
+            index=models.Index(fields=['language_id', 'year'], name='films_language_year_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='allfilms',
+            index=models.Index(fields=['duration'], name='films_duration_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='allshows',
+            index=models.Index(fields=['rating'], name='shows_rating_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='allshows',
+            index=models.Index(fields=['genre_id', 'rating'], name='shows_genre_rating_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='allshows',
+            index=models.Index(fields=['duration'], name='shows_duration_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['date'], name='audit_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='movierating',
+            index=models.Index(fields=['user_id', 'user_rating'], name='movie_rating_user_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='showuserrating',
+            index=models.Index(fields=['user_id', 'user_rating'], name='show_rating_user_idx'),
+        ),
+    ]
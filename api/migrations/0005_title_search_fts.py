@@ -0,0 +1,67 @@
+from django.db import migrations
+from django.db.utils import OperationalError
+
+
+# (FTS table, source table, primary key column, title column)
+TITLE_INDEXES = [
+    ('Film_title_search', 'All_Films', 'Film_id', 'Film_name'),
+    ('Show_title_search', 'All_shows', 'Show_id', 'Show_name'),
+]
+
+
+def create_title_search(apps, schema_editor):
+    """Create FTS5 title indexes kept in sync with All_Films/All_shows by triggers.
+
+    Skipped when the database isn't SQLite or SQLite was built without FTS5;
+    the views then fall back to LIKE matching.
+    """
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        try:
+            cursor.execute("CREATE VIRTUAL TABLE temp.fts5_probe USING fts5(x)")
+            cursor.execute("DROP TABLE temp.fts5_probe")
+        except OperationalError:
+            return
+
+        for fts, source, pk, title in TITLE_INDEXES:
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE {fts} USING fts5("
+                f"{title}, content='{source}', content_rowid='{pk}', "
+                f"tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+            )
+            cursor.execute(
+                f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {source} BEGIN "
+                f"INSERT INTO {fts}(rowid, {title}) VALUES (new.{pk}, new.{title}); END"
+            )
+            cursor.execute(
+                f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {source} BEGIN "
+                f"INSERT INTO {fts}({fts}, rowid, {title}) VALUES ('delete', old.{pk}, old.{title}); END"
+            )
+            cursor.execute(
+                f"CREATE TRIGGER {fts}_au AFTER UPDATE OF {pk}, {title} ON {source} BEGIN "
+                f"INSERT INTO {fts}({fts}, rowid, {title}) VALUES ('delete', old.{pk}, old.{title}); "
+                f"INSERT INTO {fts}(rowid, {title}) VALUES (new.{pk}, new.{title}); END"
+            )
+            cursor.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+
+def drop_title_search(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        for fts, source, pk, title in TITLE_INDEXES:
+            for suffix in ('ai', 'ad', 'au'):
+                cursor.execute(f"DROP TRIGGER IF EXISTS {fts}_{suffix}")
+            cursor.execute(f"DROP TABLE IF EXISTS {fts}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0004_secondary_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_title_search, drop_title_search),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-17 23:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_title_search_fts'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImportCheckpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(db_column='Source', max_length=255, unique=True)),
+                ('file_hash', models.CharField(db_column='File_hash', max_length=64)),
+                ('records_done', models.IntegerField(db_column='Records_done', default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True, db_column='Updated_at')),
+            ],
+            options={
+                'db_table': 'Import_checkpoint',
+            },
+        ),
+        migrations.CreateModel(
+            name='ImportRowHash',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(db_column='Source', max_length=255)),
+                ('row_key', models.CharField(db_column='Row_key', max_length=255)),
+                ('row_hash', models.CharField(db_column='Row_hash', max_length=64)),
+                ('object_id', models.IntegerField(db_column='Object_id')),
+            ],
+            options={
+                'db_table': 'Import_row_hash',
+                'unique_together': {('source', 'row_key')},
+            },
+        ),
+    ]
@@ -0,0 +1,119 @@
+# Generated by Django 5.2.18 on 2026-10-17 23:13
+
+import re
+
+from django.db import migrations, models
+
+
+# (pattern, action) for the free-text messages written before this migration
+AUTH_PATTERN = re.compile(r"^Authorization event - User (signup|signin|signout): .*\(User ID: (\d+)\)")
+WATCH_LATER_PATTERN = re.compile(r"^User (.+?) (added|removed) (movie|show) '(.*)' (?:to|from) watch later$")
+FAVORITES_PATTERN = re.compile(r"^User (.+?) updated favorites$")
+REVIEW_PATTERN = re.compile(r"^User (.+?) (posted|updated|deleted) review for (movie|show) '(.*?)'(?: \(Rating: .*\))?$")
+IMPORT_PATTERN = re.compile(r"^Data import (started|completed|failed)")
+
+REVIEW_ACTIONS = {'posted': 'review_create', 'updated': 'review_update', 'deleted': 'review_delete'}
+
+
+def backfill_audit_fields(apps, schema_editor):
+    """Parse user, action and entity out of the existing changes_to_data messages.
+
+    Users are matched by email and movies/shows by title; entries whose user or
+    title no longer exists keep a NULL id.
+    """
+    AuditLog = apps.get_model('api', 'AuditLog')
+    User = apps.get_model('api', 'User')
+    AllFilms = apps.get_model('api', 'AllFilms')
+    AllShows = apps.get_model('api', 'AllShows')
+
+    # The audit log may live on its own database (DATABASE_ROUTES); users and
+    # titles are looked up wherever the router puts them
+    db_alias = schema_editor.connection.alias
+    logs = list(AuditLog.objects.using(db_alias).only('table_id', 'changes_to_data'))
+    if not logs:
+        return
+
+    user_ids = dict(User.objects.values_list('email', 'user_id'))
+    entity_ids = {
+        'movie': dict(AllFilms.objects.values_list('film_name', 'film_id').order_by('-film_id')),
+        'show': dict(AllShows.objects.values_list('show_name', 'show_id').order_by('-show_id')),
+    }
+
+    for log in logs:
+        message = log.changes_to_data or ''
+        log.action, log.user_id, log.entity_type, log.entity_id = 'other', None, None, None
+
+        match = AUTH_PATTERN.match(message)
+        if match:
+            log.action = match.group(1)
+            log.user_id = log.entity_id = int(match.group(2))
+            log.entity_type = 'user'
+            continue
+        match = WATCH_LATER_PATTERN.match(message)
+        if match:
+            email, verb, entity_type, title = match.groups()
+            log.action = 'watch_later_add' if verb == 'added' else 'watch_later_remove'
+            log.user_id = user_ids.get(email)
+            log.entity_type, log.entity_id = entity_type, entity_ids[entity_type].get(title)
+            continue
+        match = FAVORITES_PATTERN.match(message)
+        if match:
+            log.action = 'favorites_update'
+            log.user_id = user_ids.get(match.group(1))
+            log.entity_type, log.entity_id = 'user', log.user_id
+            continue
+        match = REVIEW_PATTERN.match(message)
+        if match:
+            email, verb, entity_type, title = match.groups()
+            log.action = REVIEW_ACTIONS[verb]
+            log.user_id = user_ids.get(email)
+            log.entity_type, log.entity_id = entity_type, entity_ids[entity_type].get(title)
+            continue
+        match = IMPORT_PATTERN.match(message)
+        if match:
+            log.action = f'import_{match.group(1)}'
+
+    AuditLog.objects.using(db_alias).bulk_update(logs, ['action', 'user_id', 'entity_type', 'entity_id'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0006_import_row_hashes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='auditlog',
+            name='action',
+            field=models.CharField(db_column='Action', default='other', max_length=30),
+        ),
+        migrations.AddField(
+            model_name='auditlog',
+            name='entity_id',
+            field=models.IntegerField(blank=True, db_column='Entity_id', null=True),
+        ),
+        migrations.AddField(
+            model_name='auditlog',
+            name='entity_type',
+            field=models.CharField(blank=True, db_column='Entity_type', max_length=20, null=True),
+        ),
+        migrations.AddField(
+            model_name='auditlog',
+            name='user_id',
+            field=models.IntegerField(blank=True, db_column='User_id', null=True),
+        ),
+        migrations.RunPython(backfill_audit_fields, migrations.RunPython.noop, hints={'model_name': 'auditlog'}),
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['user_id', 'date'], name='audit_user_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['action', 'date'], name='audit_action_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['entity_type', 'entity_id', 'date'], name='audit_entity_date_idx'),
+        ),
+    ]
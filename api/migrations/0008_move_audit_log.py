@@ -0,0 +1,72 @@
+from importlib import import_module
+
+from django.core.management.color import no_style
+from django.db import connections, migrations, transaction
+
+
+AUDIT_COLUMNS = ['Table_id', 'date', 'changes_to_data', 'User_id', 'Action', 'Entity_type', 'Entity_id']
+# Values for structured columns the old table doesn't have (0007's defaults)
+MISSING_COLUMN_DEFAULTS = {'User_id': None, 'Action': 'other', 'Entity_type': None, 'Entity_id': None}
+COPY_BATCH_SIZE = 5000
+
+
+def move_audit_log(apps, schema_editor):
+    """Copy Audit_log rows written before the audit database existed into it.
+
+    Runs on whichever database the router assigns AuditLog to. When that isn't
+    'default', rows still in the default database's Audit_log are copied across
+    (keeping their ids) and the old table is dropped once this migration commits.
+
+    0007 never ran against the default database's Audit_log in that case, so it
+    may lack the structured columns: only the columns it has are read, the rest
+    get 0007's defaults and the copied messages are then parsed the way 0007
+    parses them.
+    """
+    db_alias = schema_editor.connection.alias
+    source = connections['default']
+    if db_alias == 'default' or 'Audit_log' not in source.introspection.table_names():
+        return
+
+    with source.cursor() as cursor:
+        existing = {column.name.lower() for column in source.introspection.get_table_description(cursor, 'Audit_log')}
+    copied = [column for column in AUDIT_COLUMNS if column.lower() in existing]
+    missing = [column for column in AUDIT_COLUMNS if column not in copied]
+    defaults = tuple(MISSING_COLUMN_DEFAULTS[column] for column in missing)
+
+    quote = source.ops.quote_name
+    table = quote('Audit_log')
+    placeholders = ', '.join(['%s'] * len(AUDIT_COLUMNS))
+    select = f'SELECT {", ".join(map(quote, copied))} FROM {table} ORDER BY {quote("Table_id")}'
+    insert = f'INSERT INTO {table} ({", ".join(map(quote, copied + missing))}) VALUES ({placeholders})'
+    with source.cursor() as read_cursor, schema_editor.connection.cursor() as write_cursor:
+        read_cursor.execute(select)
+        while True:
+            rows = read_cursor.fetchmany(COPY_BATCH_SIZE)
+            if not rows:
+                break
+            write_cursor.executemany(insert, [tuple(row) + defaults for row in rows])
+        # Rows kept their ids: move the sequence past them (PostgreSQL)
+        AuditLog = apps.get_model('api', 'AuditLog')
+        for sql in schema_editor.connection.ops.sequence_reset_sql(no_style(), [AuditLog]):
+            write_cursor.execute(sql)
+
+    if missing:
+        structured_audit_log = import_module('api.migrations.0007_structured_audit_log')
+        structured_audit_log.backfill_audit_fields(apps, schema_editor)
+
+    def drop_old_table():
+        with source.cursor() as cursor:
+            cursor.execute(f'DROP TABLE IF EXISTS {table}')
+
+    transaction.on_commit(drop_old_table, using=db_alias)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_structured_audit_log'),
+    ]
+
+    operations = [
+        migrations.RunPython(move_audit_log, migrations.RunPython.noop, hints={'model_name': 'auditlog'}),
+    ]
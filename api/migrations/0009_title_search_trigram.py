@@ -0,0 +1,51 @@
+from django.db import migrations, transaction
+from django.db.utils import DatabaseError
+
+
+# (index name, table, title column)
+TRIGRAM_INDEXES = [
+    ('films_title_trgm_idx', 'All_Films', 'Film_name'),
+    ('shows_title_trgm_idx', 'All_shows', 'Show_name'),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    """Create GIN trigram indexes on the upper-cased titles.
+
+    Django's icontains on PostgreSQL compares UPPER("column"::text), so the indexes
+    are on that expression. Skipped when the database isn't PostgreSQL or the
+    pg_trgm extension can't be installed; the views then fall back to LIKE matching.
+    """
+    connection = schema_editor.connection
+    if connection.vendor != 'postgresql':
+        return
+    with connection.cursor() as cursor:
+        try:
+            with transaction.atomic(using=connection.alias):
+                cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        except DatabaseError:
+            return
+
+        for name, table, column in TRIGRAM_INDEXES:
+            cursor.execute(
+                f'CREATE INDEX IF NOT EXISTS {name} ON "{table}" USING gin (UPPER("{column}"::text) gin_trgm_ops)'
+            )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        for name, _, _ in TRIGRAM_INDEXES:
+            cursor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0008_move_audit_log'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
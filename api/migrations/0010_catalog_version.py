@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-17 23:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0009_title_search_trigram'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CatalogVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.BigIntegerField(db_column='Version', default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True, db_column='Updated_at')),
+            ],
+            options={
+                'db_table': 'Catalog_version',
+            },
+        ),
+    ]
@@ -0,0 +1,109 @@
+# Generated by Django 5.2.18 on 2026-10-17 23:58
+
+import re
+import unicodedata
+from collections import Counter
+
+from django.db import migrations, models, transaction
+from django.db.models import Count
+from django.db.utils import DatabaseError
+
+
+# Copies of api.actor_names as of this migration, so later changes there don't
+# alter what it does
+MIN_NAME_LENGTH = 2
+MAX_NAME_LENGTH = 49
+PLACEHOLDERS = ('documentary', 'n/a')
+IGNORED_CHARACTERS = re.compile(r"['’.]")
+SEPARATORS = re.compile(r'[\W_]+')
+POPULATE_BATCH_SIZE = 1000
+
+
+def create_prefix_indexes(apps, schema_editor):
+    """Index Normalized_name for LIKE 'term%' (and, with pg_trgm, LIKE '%term%').
+
+    SQLite's LIKE is case-insensitive, so it can only use an index built with the
+    NOCASE collation; PostgreSQL needs varchar_pattern_ops under a non-C locale.
+    """
+    connection = schema_editor.connection
+    with connection.cursor() as cursor:
+        if connection.vendor == 'sqlite':
+            cursor.execute(
+                'CREATE INDEX IF NOT EXISTS actor_name_prefix_idx ON "Actor_name" ("Normalized_name" COLLATE NOCASE)'
+            )
+        elif connection.vendor == 'postgresql':
+            cursor.execute(
+                'CREATE INDEX IF NOT EXISTS actor_name_prefix_idx ON "Actor_name" ("Normalized_name" varchar_pattern_ops)'
+            )
+            try:
+                with transaction.atomic(using=connection.alias):
+                    cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+            except DatabaseError:
+                return
+            cursor.execute(
+                'CREATE INDEX IF NOT EXISTS actor_name_trgm_idx ON "Actor_name" USING gin ("Normalized_name" gin_trgm_ops)'
+            )
+
+
+def drop_prefix_indexes(apps, schema_editor):
+    with schema_editor.connection.cursor() as cursor:
+        for name in ('actor_name_prefix_idx', 'actor_name_trgm_idx'):
+            cursor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+def clean_actor_name(raw):
+    name = ' '.join((raw or '').split())
+    if not MIN_NAME_LENGTH <= len(name) <= MAX_NAME_LENGTH or name.isdigit():
+        return None
+    lowered = name.lower()
+    if any(placeholder in lowered for placeholder in PLACEHOLDERS):
+        return None
+    return name
+
+
+def normalize_actor_name(text):
+    decomposed = unicodedata.normalize('NFKD', text.casefold())
+    text = ''.join(char for char in decomposed if not unicodedata.combining(char))
+    return SEPARATORS.sub(' ', IGNORED_CHARACTERS.sub('', text)).strip()
+
+
+def populate_actor_names(apps, schema_editor):
+    """One Actor_name row per cleaned cast name with its film + show credit count"""
+    ActorName = apps.get_model('api', 'ActorName')
+    credits = Counter()
+    for model_name, credit in (('Actors', 'film_id'), ('ActedIn', 'show_id')):
+        model = apps.get_model('api', model_name)
+        rows = model.objects.values('actor_name').annotate(credits=Count(credit)).values_list('actor_name', 'credits')
+        for raw_name, count in rows:
+            name = clean_actor_name(raw_name)
+            if name:
+                credits[name] += count
+    ActorName.objects.bulk_create(
+        [ActorName(name=name, normalized_name=normalize_actor_name(name), credit_count=count)
+         for name, count in credits.items()],
+        batch_size=POPULATE_BATCH_SIZE,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0010_catalog_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ActorName',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(db_column='Name', max_length=255, unique=True)),
+                ('normalized_name', models.CharField(db_column='Normalized_name', max_length=255)),
+                ('credit_count', models.IntegerField(db_column='Credit_count', default=0)),
+            ],
+            options={
+                'db_table': 'Actor_name',
+            },
+        ),
+        migrations.RunPython(create_prefix_indexes, drop_prefix_indexes),
+        migrations.RunPython(populate_actor_names, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,27 @@
+from django.db import migrations
+from django.db.models import ExpressionWrapper, F, FloatField
+from django.db.models.functions import Round
+
+
+def round_average_scores(apps, schema_editor):
+    """Re-derive every stored average rounded to the column's two decimals.
+
+    Reviews written before this stored the unrounded quotient, which the ORM reads
+    back rounded - so cursors and sorts compared different values.
+    """
+    for model_name in ('MovieAverageRating', 'ShowAverageRating'):
+        Aggregate = apps.get_model('api', model_name)
+        Aggregate.objects.filter(rating_count__gt=0).update(average_score=Round(
+            ExpressionWrapper(F('rating_sum') * 1.0 / F('rating_count'), output_field=FloatField()), 2
+        ))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0011_actor_names'),
+    ]
+
+    operations = [
+        migrations.RunPython(round_average_scores, migrations.RunPython.noop),
+    ]
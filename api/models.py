@@ -1,6 +1,9 @@
 from django.db import models
+from django.db.models import Case, ExpressionWrapper, F, FloatField, Value, When
+from django.db.models.functions import Round
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager
 from django.core.validators import MinValueValidator, MaxValueValidator
+import re
 
 
 # User Management
@@ -50,17 +53,96 @@ class AllTables(models.Model):
         return self.table_name
 
 
+AUDIT_ACTION_PATTERNS = [
+    (re.compile(r"^Authorization event - User (signup|signin|signout):"), lambda m: m.group(1)),
+    (re.compile(r"^User .+ (added|removed) (?:movie|show) '.*' (?:to|from) watch later$"),
+     lambda m: 'watch_later_add' if m.group(1) == 'added' else 'watch_later_remove'),
+    (re.compile(r"^User .+ updated favorites$"), lambda m: 'favorites_update'),
+    (re.compile(r"^User .+ (posted|updated|deleted) review for (?:movie|show) '"),
+     lambda m: {'posted': 'review_create', 'updated': 'review_update', 'deleted': 'review_delete'}[m.group(1)]),
+    (re.compile(r"^Data import (started|completed|failed)"), lambda m: f'import_{m.group(1)}'),
+]
+
+
+def parse_audit_action(message):
+    """Return the action type for a free-text audit message ('other' if unrecognised)"""
+    for pattern, action in AUDIT_ACTION_PATTERNS:
+        match = pattern.match(message or '')
+        if match:
+            return action(match)
+    return 'other'
+
+
 class AuditLog(models.Model):
     table_id = models.AutoField(primary_key=True, db_column='Table_id')
     date = models.DateTimeField(auto_now_add=True, db_column='date')
     changes_to_data = models.TextField(db_column='changes_to_data')
-    
+    # Structured copy of the message, for filtering
+    user_id = models.IntegerField(null=True, blank=True, db_column='User_id')  # acting user; kept if the user is deleted
+    action = models.CharField(max_length=30, default='other', db_column='Action')  # e.g. signin, review_create
+    entity_type = models.CharField(max_length=20, null=True, blank=True, db_column='Entity_type')  # user/movie/show
+    entity_id = models.IntegerField(null=True, blank=True, db_column='Entity_id')
+
     class Meta:
         db_table = 'Audit_log'
-    
+        indexes = [
+            models.Index(fields=['date'], name='audit_date_idx'),
+            models.Index(fields=['user_id', 'date'], name='audit_user_date_idx'),
+            models.Index(fields=['action', 'date'], name='audit_action_date_idx'),
+            models.Index(fields=['entity_type', 'entity_id', 'date'], name='audit_entity_date_idx'),
+        ]
+
     def __str__(self):
         return f"Audit {self.table_id} - {self.date}"
 
+    def save(self, *args, **kwargs):
+        # Entries created without structured fields (e.g. by the import scripts)
+        # still get an action parsed from the message
+        if self.action == 'other':
+            self.action = parse_audit_action(self.changes_to_data)
+        super().save(*args, **kwargs)
+
+
+class ImportRowHash(models.Model):
+    """Content hash of one source CSV row, used by the incremental importer"""
+    source = models.CharField(max_length=255, db_column='Source')  # CSV file name
+    row_key = models.CharField(max_length=255, db_column='Row_key')  # film/show title
+    row_hash = models.CharField(max_length=64, db_column='Row_hash')
+    object_id = models.IntegerField(db_column='Object_id')  # Film_id / Show_id
+
+    class Meta:
+        db_table = 'Import_row_hash'
+        unique_together = [['source', 'row_key']]
+
+    def __str__(self):
+        return f"{self.source}: {self.row_key}"
+
+
+class ImportCheckpoint(models.Model):
+    """Progress of an interrupted incremental import of one source file"""
+    source = models.CharField(max_length=255, unique=True, db_column='Source')
+    file_hash = models.CharField(max_length=64, db_column='File_hash')
+    records_done = models.IntegerField(default=0, db_column='Records_done')
+    updated_at = models.DateTimeField(auto_now=True, db_column='Updated_at')
+
+    class Meta:
+        db_table = 'Import_checkpoint'
+
+    def __str__(self):
+        return f"{self.source}: {self.records_done} records"
+
+
+class CatalogVersion(models.Model):
+    """Single-row counter bumped whenever the catalog is imported or edited (see api/catalog_cache.py)"""
+    version = models.BigIntegerField(default=0, db_column='Version')
+    updated_at = models.DateTimeField(auto_now=True, db_column='Updated_at')
+
+    class Meta:
+        db_table = 'Catalog_version'
+
+    def __str__(self):
+        return f"Catalog version {self.version}"
+
 
 # Movie Directors
 class MovieDirector(models.Model):
@@ -110,6 +192,12 @@ class AllFilms(models.Model):
     
     class Meta:
         db_table = 'All_Films'
+        indexes = [
+            models.Index(fields=['year', 'duration'], name='films_year_duration_idx'),
+            models.Index(fields=['genre_id', 'year'], name='films_genre_year_idx'),
+            models.Index(fields=['language_id', 'year'], name='films_language_year_idx'),
+            models.Index(fields=['duration'], name='films_duration_idx'),
+        ]
     
     def __str__(self):
         return self.film_name
@@ -128,19 +216,69 @@ class MovieRating(models.Model):
     class Meta:
         db_table = 'Movie_rating'
         unique_together = [['film_id', 'user_id']]
+        indexes = [
+            models.Index(fields=['user_id', 'user_rating'], name='movie_rating_user_idx'),
+        ]
     
     def __str__(self):
         return f"{self.user_id.email} - {self.film_id.film_name}: {self.user_rating}"
 
 
+# Rating aggregates shared by the movie and show average tables
+class RatingAggregateMixin:
+    """Incremental bookkeeping for the *AverageRating tables.
+
+    Subclasses set ``subject_field`` (the film/show key) and ``name_field``.
+    """
+    subject_field = None
+    name_field = None
+    
+    @classmethod
+    def apply_rating_change(cls, subject, old_rating=None, new_rating=None):
+        """Fold one review create/update/delete into the stored sum, count and average"""
+        sum_delta = (new_rating or 0) - (old_rating or 0)
+        count_delta = (new_rating is not None) - (old_rating is not None)
+        if not sum_delta and not count_delta:
+            return
+        
+        lookup = {cls.subject_field: subject}
+        cls.objects.get_or_create(**lookup, defaults={cls.name_field: str(subject), 'average_score': 0})
+        # SET expressions see the old column values, so the average uses the post-change totals
+        new_sum = F('rating_sum') + sum_delta
+        new_count = F('rating_count') + count_delta
+        cls.objects.filter(**lookup).update(
+            rating_sum=new_sum,
+            rating_count=new_count,
+            average_score=Case(
+                # Rounded like the column, so the stored value is the one the ORM reads back
+                When(rating_count__gt=-count_delta, then=Round(
+                    ExpressionWrapper(new_sum * 1.0 / new_count, output_field=FloatField()), 2
+                )),
+                default=Value(0.0),
+                output_field=FloatField()
+            )
+        )
+        if count_delta < 0:
+            cls.objects.filter(**lookup, rating_count__lte=0).delete()
+
+
 # Movie Average Rating
-class MovieAverageRating(models.Model):
+class MovieAverageRating(RatingAggregateMixin, models.Model):
     film_name = models.CharField(max_length=255, db_column='Film_name')
     film_id = models.OneToOneField(AllFilms, on_delete=models.CASCADE, primary_key=True, db_column='Film_id')
-    average_score = models.DecimalField(max_digits=3, decimal_places=2, db_column='Average_score')
+    average_score = models.DecimalField(max_digits=4, decimal_places=2, db_column='Average_score')
+    rating_sum = models.IntegerField(default=0, db_column='Rating_sum')
+    rating_count = models.IntegerField(default=0, db_column='Rating_count')
+    
+    subject_field = 'film_id'
+    name_field = 'film_name'
     
     class Meta:
         db_table = 'Movie_Average_rating'
+        indexes = [
+            models.Index(fields=['average_score'], name='movie_avg_score_idx'),
+            models.Index(fields=['rating_count'], name='movie_avg_count_idx'),
+        ]
     
     def __str__(self):
         return f"{self.film_name}: {self.average_score}"
@@ -225,6 +363,20 @@ class ShowGenre(models.Model):
         return self.genre_name
 
 
+def parse_show_years(years):
+    """Split a raw years string into (start_year, end_year).
+
+    Handles the formats found in the CSVs, e.g. "(20152022)", "2008-2013" and "2019".
+    Missing parts come back as None.
+    """
+    if not years:
+        return None, None
+    found = [int(y) for y in re.findall(r'\d{4}', str(years))]
+    start_year = found[0] if found else None
+    end_year = found[1] if len(found) > 1 else None
+    return start_year, end_year
+
+
 # All Shows
 class AllShows(models.Model):
     show_id = models.AutoField(primary_key=True, db_column='Show_id')
@@ -234,12 +386,24 @@ class AllShows(models.Model):
     rating = models.DecimalField(max_digits=3, decimal_places=2, null=True, blank=True, db_column='rating')
     genre_id = models.ForeignKey(ShowGenre, on_delete=models.SET_NULL, null=True, db_column='Genre_id')
     years = models.CharField(max_length=50, blank=True, null=True, db_column='Years')  # e.g., "2020-2024"
+    start_year = models.IntegerField(null=True, blank=True, db_index=True, db_column='Start_year')  # parsed from years
+    end_year = models.IntegerField(null=True, blank=True, db_index=True, db_column='End_year')  # parsed from years
     
     class Meta:
         db_table = 'All_shows'
+        indexes = [
+            models.Index(fields=['rating'], name='shows_rating_idx'),
+            models.Index(fields=['genre_id', 'rating'], name='shows_genre_rating_idx'),
+            models.Index(fields=['duration'], name='shows_duration_idx'),
+        ]
     
     def __str__(self):
         return self.show_name
+    
+    def save(self, *args, **kwargs):
+        # Keep the parsed year columns in sync with the raw years string
+        self.start_year, self.end_year = parse_show_years(self.years)
+        super().save(*args, **kwargs)
 
 
 # Show User Rating
@@ -255,19 +419,31 @@ class ShowUserRating(models.Model):
     class Meta:
         db_table = 'Show_user_rating'
         unique_together = [['show_id', 'user_id']]
+        indexes = [
+            models.Index(fields=['user_id', 'user_rating'], name='show_rating_user_idx'),
+        ]
     
     def __str__(self):
         return f"{self.user_id.email} - {self.show_id.show_name}: {self.user_rating}"
 
 
 # Show Average Rating
-class ShowAverageRating(models.Model):
+class ShowAverageRating(RatingAggregateMixin, models.Model):
     show_name = models.CharField(max_length=255, db_column='Film_name')  # Note: keeping original column name
     show_id = models.OneToOneField(AllShows, on_delete=models.CASCADE, primary_key=True, db_column='Film_id')  # Note: keeping original column name
-    average_score = models.DecimalField(max_digits=3, decimal_places=2, db_column='Average_score')
+    average_score = models.DecimalField(max_digits=4, decimal_places=2, db_column='Average_score')
+    rating_sum = models.IntegerField(default=0, db_column='Rating_sum')
+    rating_count = models.IntegerField(default=0, db_column='Rating_count')
+    
+    subject_field = 'show_id'
+    name_field = 'show_name'
     
     class Meta:
         db_table = 'Show_average_rating'
+        indexes = [
+            models.Index(fields=['average_score'], name='show_avg_score_idx'),
+            models.Index(fields=['rating_count'], name='show_avg_count_idx'),
+        ]
     
     def __str__(self):
         return f"{self.show_name}: {self.average_score}"
@@ -300,6 +476,19 @@ class ActedIn(models.Model):
         return f"{self.actor_name} in {self.show_id.show_name}"
 
 
+# Actor names, cleaned and deduplicated from Actors and Acted_in (see api/actor_names.py)
+class ActorName(models.Model):
+    name = models.CharField(max_length=255, unique=True, db_column='Name')
+    normalized_name = models.CharField(max_length=255, db_column='Normalized_name')  # prefix-indexed by 0011
+    credit_count = models.IntegerField(default=0, db_column='Credit_count')  # film + show credits
+
+    class Meta:
+        db_table = 'Actor_name'
+
+    def __str__(self):
+        return self.name
+
+
 # Watched Shows
 class WatchedShow(models.Model):
     show_id = models.ForeignKey(AllShows, on_delete=models.CASCADE, db_column='Show_id')
@@ -0,0 +1,180 @@
+"""
+Keyset (cursor) pagination for the list endpoints.
+
+A sort is described as a list of keys ``(field, descending, null_group)`` ending with
+the primary key. ``null_group`` names the field or relation that decides whether the
+key is NULL (None for keys that never are). NULLs always sort as the lowest value
+(last when descending, first when ascending), which is SQLite's native order, so an
+index on the lead key can serve the ORDER BY.
+
+To keep every page an index range scan, a sort whose lead key can be NULL is split
+into phases: rows where the lead key is set, and rows where it is NULL (sorted by
+the remaining keys, split again if needed). Keys sharing a ``null_group`` are NULL
+together - e.g. the stored average and count from a LEFT JOINed aggregate row, whose
+group is the relation itself so the "set" phase becomes an INNER JOIN.
+
+The cursor handed to clients is an opaque token holding the sort name, the phase and
+the key values of the last row returned. Those values are compared against the stored
+columns, so a key must read back exactly as stored - e.g. the average ratings are
+written already rounded to their column's two decimals (see RatingAggregateMixin).
+"""
+import base64
+import binascii
+import json
+from datetime import datetime
+from decimal import Decimal
+
+from django.db.models import F, Q
+
+
+class InvalidCursor(ValueError):
+    """Raised when a cursor token can't be decoded or doesn't match the request's sort"""
+
+
+def _cursor_value(value):
+    # Decimals and datetimes round-trip as strings; the ORM parses them back
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def encode_cursor(sort_name, phase, values):
+    payload = json.dumps(
+        {'s': sort_name, 'p': phase, 'k': [_cursor_value(v) for v in values]},
+        separators=(',', ':')
+    )
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(token, sort_name):
+    """Return (phase, key values) from a cursor token"""
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        phase, values = payload['p'], payload['k']
+    except (ValueError, KeyError, TypeError, binascii.Error):
+        raise InvalidCursor('Invalid cursor')
+    if payload.get('s') != sort_name or not isinstance(phase, int) or not isinstance(values, list):
+        raise InvalidCursor('Cursor does not match this sort order')
+    return phase, values
+
+
+def split_phases(keys):
+    """Expand a sort into [(filter Q, keys)] phases whose lead key is never NULL"""
+    field, descending, null_group = keys[0]
+    if null_group is None:
+        return [(Q(), keys)]
+
+    present = (Q(**{f'{null_group}__isnull': False}), keys)
+    absent_keys = [key for key in keys if key[2] != null_group]
+    absent = [
+        (Q(**{f'{null_group}__isnull': True}) & phase_filter, phase_keys)
+        for phase_filter, phase_keys in split_phases(absent_keys)
+    ]
+    # NULLs sort lowest: after the set values when descending, before them when ascending
+    return [present] + absent if descending else absent + [present]
+
+
+def order_expressions(keys):
+    return [
+        F(field).desc(nulls_last=True) if descending else F(field).asc(nulls_first=True)
+        for field, descending, _ in keys
+    ]
+
+
+def _after(field, descending, value):
+    """Rows strictly after ``value`` on one key; None when no row can be"""
+    if descending:
+        if value is None:
+            return None
+        return Q(**{f'{field}__lt': value}) | Q(**{f'{field}__isnull': True})
+    if value is None:
+        return Q(**{f'{field}__isnull': False})
+    return Q(**{f'{field}__gt': value})
+
+
+def _equal(field, value):
+    if value is None:
+        return Q(**{f'{field}__isnull': True})
+    return Q(**{field: value})
+
+
+def keyset_filter(keys, values):
+    """Rows that come after ``values`` in ``keys`` order.
+
+    The lead key is also bounded with a plain range so the database can seek
+    straight to the cursor position in its index.
+    """
+    (lead_field, lead_descending, _), lead_value = keys[0], values[0]
+    if lead_value is None:
+        raise InvalidCursor('Invalid cursor')
+    condition = Q(**{f'{lead_field}__lte' if lead_descending else f'{lead_field}__gte': lead_value})
+
+    alternatives = Q(pk__in=[])
+    prefix = Q()
+    for (field, descending, _), value in zip(keys, values):
+        after = _after(field, descending, value)
+        if after is not None:
+            alternatives |= prefix & after
+        prefix &= _equal(field, value)
+    return condition & alternatives
+
+
+def _start(keys, sort_name, cursor):
+    """Return (phases, start phase, last values) for a page request"""
+    phases = split_phases(keys)
+    start_phase, last_values = 0, None
+    if cursor:
+        start_phase, last_values = decode_cursor(cursor, sort_name)
+        if not 0 <= start_phase < len(phases) or len(last_values) != len(phases[start_phase][1]):
+            raise InvalidCursor('Invalid cursor')
+    return phases, start_phase, last_values
+
+
+def _phase_queryset(queryset, phases, phase, start_phase, last_values):
+    phase_filter, phase_keys = phases[phase]
+    phase_queryset = queryset.filter(phase_filter).order_by(*order_expressions(phase_keys))
+    if phase == start_phase and last_values is not None:
+        phase_queryset = phase_queryset.filter(keyset_filter(phase_keys, last_values))
+    return phase_queryset
+
+
+def _finish(rows, phases, sort_name, limit):
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        phase, last_item = rows[-1]
+        next_cursor = encode_cursor(
+            sort_name, phase, [getattr(last_item, field) for field, _, _ in phases[phase][1]]
+        )
+    return [item for _, item in rows], next_cursor
+
+
+def keyset_page(queryset, sort_name, keys, limit, cursor=None):
+    """Return (items, next_cursor) for one page of ``queryset`` sorted by ``keys``.
+
+    Each phase is read with its own LIMITed query, and one extra row is fetched to
+    tell whether another page exists.
+    """
+    phases, start_phase, last_values = _start(keys, sort_name, cursor)
+    rows = []  # (phase index, item)
+    for phase in range(start_phase, len(phases)):
+        phase_queryset = _phase_queryset(queryset, phases, phase, start_phase, last_values)
+        rows += [(phase, item) for item in phase_queryset[:limit + 1 - len(rows)]]
+        if len(rows) > limit:
+            break
+    return _finish(rows, phases, sort_name, limit)
+
+
+async def akeyset_page(queryset, sort_name, keys, limit, cursor=None):
+    """Async version of keyset_page(), for the async views"""
+    phases, start_phase, last_values = _start(keys, sort_name, cursor)
+    rows = []
+    for phase in range(start_phase, len(phases)):
+        phase_queryset = _phase_queryset(queryset, phases, phase, start_phase, last_values)
+        rows += [(phase, item) async for item in phase_queryset[:limit + 1 - len(rows)]]
+        if len(rows) > limit:
+            break
+    return _finish(rows, phases, sort_name, limit)
@@ -0,0 +1,67 @@
+"""
+Query budgets: fail when a block of code runs more SQL statements than allowed.
+
+    with query_budget(4, 'movies?limit=100'):
+        views.movies(request)
+
+Statements are counted on every database alias, including queries an async view
+runs on its worker thread (see api.metrics.record_queries). When the budget is
+exceeded, QueryBudgetExceeded lists every statement that ran, so the offending
+query (typically one repeated per row) is visible in the failure.
+
+Budgets are for code running in autocommit, where a view's atomic block costs one
+BEGIN (COMMIT and ROLLBACK go through the driver, not a statement). Run inside a
+transaction, as in a check that rolls back afterwards, that block takes a
+SAVEPOINT plus a RELEASE or ROLLBACK TO instead; only the SAVEPOINT is counted.
+An outermost atomic(savepoint=False) block, like the one QuerySet.delete() opens,
+runs no statement at all there, so it comes out one cheaper than in autocommit.
+"""
+from collections import Counter
+from contextlib import contextmanager
+
+from django.db import connections
+
+from .metrics import record_queries
+
+
+MAX_LISTED_STATEMENTS = 200
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+def outer_savepoint_ends(statements, aliases):
+    """RELEASE / ROLLBACK TO statements closing a block's outermost savepoints on ``aliases``"""
+    depth = Counter()
+    ends = 0
+    for alias, _, sql in statements:
+        if alias not in aliases:
+            continue
+        if sql.startswith('SAVEPOINT '):
+            depth[alias] += 1
+        elif sql.startswith('ROLLBACK TO SAVEPOINT '):
+            # atomic() releases the savepoint after rolling back to it
+            ends += depth[alias] == 1
+        elif sql.startswith('RELEASE SAVEPOINT '):
+            depth[alias] -= 1
+            ends += depth[alias] == 0
+    return ends
+
+
+@contextmanager
+def query_budget(limit, label='block'):
+    """Raise QueryBudgetExceeded if the block runs more than ``limit`` statements.
+
+    Yields the recorder, so callers can report recorder.count when within budget.
+    """
+    in_transaction = {conn.alias for conn in connections.all(initialized_only=True) if conn.in_atomic_block}
+    with record_queries(MAX_LISTED_STATEMENTS) as recorder:
+        yield recorder
+    if in_transaction:
+        recorder.count -= outer_savepoint_ends(recorder.statements, in_transaction)
+    if recorder.count > limit:
+        statements = '\n'.join(
+            f'  {number}. [{alias}] {sql}' for number, (alias, _, sql) in enumerate(recorder.statements, 1)
+        )
+        raise QueryBudgetExceeded(f"{label} ran {recorder.count} queries (budget {limit}):\n{statements}")
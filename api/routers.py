@@ -0,0 +1,100 @@
+"""
+Database routing.
+
+settings.DATABASE_ROUTES maps model labels ('api.auditlog') to a database alias.
+Routed models are read, written and migrated only on their alias; everything else
+stays on 'default'. A route to an alias that isn't configured in DATABASES falls
+back to 'default', so a single-database setup keeps working unchanged.
+
+Only tables with no relations to the rest of the schema can be routed: Django
+can't join or cascade across databases.
+
+Views decorated with @read_only_db read the default database's tables through
+settings.READ_ONLY_DATABASE for GET/HEAD requests: a second alias opened with
+mode=ro and query_only, so those reads never take a write lock. Its file defaults
+to the primary one but can point at a replica refreshed by an import job.
+Writes always go to the primary.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+
+
+DEFAULT_DB = 'default'
+READ_ONLY_METHODS = ('GET', 'HEAD')
+
+_read_only = ContextVar('read_only_db', default=False)
+
+
+def route_for(app_label, model_name):
+    """Alias a model is stored on"""
+    alias = getattr(settings, 'DATABASE_ROUTES', {}).get(f'{app_label}.{model_name}', DEFAULT_DB)
+    return alias if alias in settings.DATABASES else DEFAULT_DB
+
+
+def read_only_alias():
+    """The configured read-only alias for the default database, or None"""
+    alias = getattr(settings, 'READ_ONLY_DATABASE', None)
+    return alias if alias and alias in settings.DATABASES else None
+
+
+@contextmanager
+def use_read_only_db():
+    """Send reads of default-database models to the read-only alias in this block"""
+    token = _read_only.set(True)
+    try:
+        yield
+    finally:
+        _read_only.reset(token)
+
+
+def read_only_db(view):
+    """Serve a view's GET/HEAD requests from the read-only alias"""
+    if iscoroutinefunction(view):
+        @wraps(view)
+        async def async_wrapper(request, *args, **kwargs):
+            if request.method not in READ_ONLY_METHODS:
+                return await view(request, *args, **kwargs)
+            # The async ORM runs queries in a thread with a copy of this context
+            with use_read_only_db():
+                return await view(request, *args, **kwargs)
+        return async_wrapper
+
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        if request.method not in READ_ONLY_METHODS:
+            return view(request, *args, **kwargs)
+        with use_read_only_db():
+            return view(request, *args, **kwargs)
+    return wrapper
+
+
+class ModelDatabaseRouter:
+
+    def db_for_read(self, model, **hints):
+        alias = route_for(model._meta.app_label, model._meta.model_name)
+        if alias == DEFAULT_DB and _read_only.get():
+            return read_only_alias() or DEFAULT_DB
+        return alias
+
+    def db_for_write(self, model, **hints):
+        return route_for(model._meta.app_label, model._meta.model_name)
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Rows read through the read-only alias are rows of the default database
+        primary = {DEFAULT_DB, read_only_alias()}
+        if obj1._state.db in primary and obj2._state.db in primary:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db == read_only_alias():
+            return False
+        if model_name is None:
+            # Operations not tied to a model (e.g. RunPython/RunSQL without hints)
+            # belong to the default database
+            return db == DEFAULT_DB
+        return route_for(app_label, model_name) == db
@@ -0,0 +1,183 @@
+"""
+Title search for the catalog views.
+
+On SQLite, uses the FTS5 tables created by migration 0005 (Film_title_search /
+Show_title_search) for BM25-ranked prefix matching. On PostgreSQL with pg_trgm,
+every word is matched with icontains, served by the GIN trigram indexes from
+migration 0009, and results are ranked by word_similarity(). Otherwise falls back
+to a plain icontains filter on the whole text.
+"""
+import re
+
+from asgiref.sync import sync_to_async
+from django.db import connection
+from django.db.models import Expression, F, FloatField, Func, Value
+from django.db.models.expressions import RawSQL
+from django.db.models.sql.constants import INNER
+
+
+# model label -> (FTS table, catalog table, primary key column, title field)
+TITLE_SEARCH_TABLES = {
+    'AllFilms': ('Film_title_search', 'All_Films', 'Film_id', 'film_name'),
+    'AllShows': ('Show_title_search', 'All_shows', 'Show_id', 'show_name'),
+}
+
+_available_tables = None
+_trigram_available = None
+
+
+def fts_tables_available():
+    """Return the set of FTS title tables present in the database (checked once per process)"""
+    global _available_tables
+    if _available_tables is None:
+        _available_tables = set()
+        if connection.vendor == 'sqlite':
+            wanted = [fts for fts, _, _, _ in TITLE_SEARCH_TABLES.values()]
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'table' AND name IN (%s)"
+                    % ', '.join(['%s'] * len(wanted)),
+                    wanted
+                )
+                _available_tables = {row[0] for row in cursor.fetchall()}
+    return _available_tables
+
+
+def trigram_search_available():
+    """Whether the database is PostgreSQL with pg_trgm installed (checked once per process)"""
+    global _trigram_available
+    if _trigram_available is None:
+        _trigram_available = False
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+                _trigram_available = cursor.fetchone() is not None
+    return _trigram_available
+
+
+async def aload_search_support():
+    """Run the once-per-process availability checks from async code.
+
+    apply_title_search() only queries the database the first time; async views
+    call this first so that query runs in a worker thread.
+    """
+    if _available_tables is None or _trigram_available is None:
+        await sync_to_async(lambda: (fts_tables_available(), trigram_search_available()))()
+
+
+def build_match_expression(text):
+    """Turn free text into an FTS5 query: every word must match as a prefix.
+
+    Each word is quoted so FTS5 operators typed by the user are treated as text.
+    Returns '' when the text has no searchable words.
+    """
+    words = re.findall(r'\w+', text)
+    return ' '.join(f'"{word}"*' for word in words)
+
+
+class TitleMatchJoin:
+    """INNER JOIN of one FTS5 MATCH, as a (rowid, rank) derived table, on a catalog pk.
+
+    An alias_map entry (see django.db.models.sql.datastructures.Join), so the match
+    runs once per query rather than once per candidate row as a correlated subquery
+    would. Add it with Query.join(); the alias it gets is where ``rank`` lives.
+    """
+
+    filtered_relation = None
+    nullable = False
+
+    def __init__(self, fts, pk, expression, parent_alias, table_alias=None, join_type=INNER):
+        self.fts = fts
+        self.pk = pk
+        self.expression = expression
+        self.table_name = f'{fts}_match'
+        self.parent_alias = parent_alias
+        self.table_alias = table_alias
+        self.join_type = join_type
+
+    def as_sql(self, compiler, connection):
+        qn = connection.ops.quote_name
+        fts, alias = qn(self.fts), qn(self.table_alias)
+        parent = compiler.quote_name_unless_alias(self.parent_alias)
+        return (
+            f'{self.join_type} (SELECT rowid, bm25({fts}) AS rank FROM {fts} WHERE {fts} MATCH %s) {alias} '
+            f'ON ({alias}.rowid = {parent}.{qn(self.pk)})'
+        ), [self.expression]
+
+    def relabeled_clone(self, change_map):
+        return self.__class__(
+            self.fts, self.pk, self.expression, change_map.get(self.parent_alias, self.parent_alias),
+            change_map.get(self.table_alias, self.table_alias), self.join_type
+        )
+
+    @property
+    def identity(self):
+        return self.__class__, self.fts, self.expression, self.parent_alias
+
+    def __eq__(self, other):
+        if not isinstance(other, TitleMatchJoin):
+            return NotImplemented
+        return self.identity == other.identity
+
+    def __hash__(self):
+        return hash(self.identity)
+
+    # Titles without a match are filtered out, so the join always stays INNER
+    def demote(self):
+        return self.relabeled_clone({})
+
+    def promote(self):
+        return self.relabeled_clone({})
+
+
+class MatchRank(Expression):
+    """The ``rank`` column of the TitleMatchJoin at ``alias``"""
+
+    output_field = FloatField()
+
+    def __init__(self, alias):
+        super().__init__()
+        self.alias = alias
+
+    def as_sql(self, compiler, connection):
+        return f'{compiler.quote_name_unless_alias(self.alias)}.rank', []
+
+    def relabeled_clone(self, change_map):
+        return self.__class__(change_map.get(self.alias, self.alias))
+
+    def get_group_by_cols(self):
+        return [self]
+
+
+def title_search_ranked(model, text):
+    """Whether apply_title_search() ranks every match (FTS5 or trigram) rather than
+    leaving ``search_rank`` NULL on the LIKE fallback"""
+    fts = TITLE_SEARCH_TABLES[model.__name__][0]
+    return bool(build_match_expression(text)) and (trigram_search_available() or fts in fts_tables_available())
+
+
+def apply_title_search(queryset, text):
+    """Filter a film/show queryset by title and annotate a ``search_rank`` (lower is better).
+
+    ``search_rank`` is the BM25 score from FTS5, the negated trigram word similarity
+    on PostgreSQL, or None on the LIKE fallback.
+    """
+    fts, _, pk, title_field = TITLE_SEARCH_TABLES[queryset.model.__name__]
+    expression = build_match_expression(text)
+
+    if expression and trigram_search_available():
+        for word in re.findall(r'\w+', text):
+            queryset = queryset.filter(**{f'{title_field}__icontains': word})
+        return queryset.annotate(
+            search_rank=-Func(Value(text), F(title_field), function='WORD_SIMILARITY', output_field=FloatField())
+        )
+
+    if not expression or fts not in fts_tables_available():
+        return queryset.filter(**{f'{title_field}__icontains': text}).annotate(
+            search_rank=RawSQL('NULL', [])
+        )
+
+    queryset = queryset.all()
+    query = queryset.query
+    alias = query.join(TitleMatchJoin(fts, pk, expression, query.get_initial_alias()))
+    return queryset.annotate(search_rank=MatchRank(alias))
@@ -1,18 +1,24 @@
+from django.conf import settings
 from django.urls import path
-from . import views
+from . import async_views, views
+
+# Read endpoints with async versions (api/async_views.py), served under ASGI
+reads = async_views if settings.ASYNC_VIEWS else views
 
 urlpatterns = [
-    path('movies/', views.movies, name='movies'),
-    path('shows/', views.shows, name='shows'),
-    path('genres/', views.genres, name='genres'),
-    path('show-genres/', views.show_genres, name='show_genres'),
-    path('actors/', views.actors, name='actors'),
+    path('movies/', reads.movies, name='movies'),
+    path('shows/', reads.shows, name='shows'),
+    path('genres/', reads.genres, name='genres'),
+    path('show-genres/', reads.show_genres, name='show_genres'),
+    path('actors/', reads.actors, name='actors'),
     path('testdb/', views.testdb, name='testdb'),
+    path('metrics/', views.metrics, name='metrics'),
     path('signup/', views.signup, name='signup'),
     path('signin/', views.signin, name='signin'),
     path('signout/', views.signout, name='signout'),
     path('check-auth/', views.check_auth, name='check_auth'),
     path('audit-logs/', views.audit_logs, name='audit_logs'),
+    path('audit-logs/stream/', views.audit_log_stream, name='audit_log_stream'),
     # Watch later endpoints
     path('watch-later/movie/', views.watch_later_movie, name='watch_later_movie'),
     path('watch-later/movie/<int:film_id>/', views.watch_later_movie, name='watch_later_movie_id'),
@@ -20,13 +26,13 @@ urlpatterns = [
     path('watch-later/show/<int:show_id>/', views.watch_later_show, name='watch_later_show_id'),
     # Favorites endpoints
     path('favorites/', views.favorites, name='favorites'),
-    path('favorites/top-rated/', views.user_top_rated, name='user_top_rated'),
+    path('favorites/top-rated/', reads.user_top_rated, name='user_top_rated'),
     path('favorites/recommendations/', views.personalized_recommendations, name='personalized_recommendations'),
     # Reviews endpoints
-    path('reviews/movie/', views.movie_reviews, name='movie_reviews'),
-    path('reviews/movie/<int:film_id>/', views.movie_reviews, name='movie_reviews_id'),
-    path('reviews/show/', views.show_reviews, name='show_reviews'),
-    path('reviews/show/<int:show_id>/', views.show_reviews, name='show_reviews_id'),
+    path('reviews/movie/', reads.movie_reviews, name='movie_reviews'),
+    path('reviews/movie/<int:film_id>/', reads.movie_reviews, name='movie_reviews_id'),
+    path('reviews/show/', reads.show_reviews, name='show_reviews'),
+    path('reviews/show/<int:show_id>/', reads.show_reviews, name='show_reviews_id'),
     # Also handle without trailing slash for POST requests
     path('signup', views.signup, name='signup_no_slash'),
     path('signin', views.signin, name='signin_no_slash'),
@@ -1,10 +1,13 @@
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
 from django.views.decorators.http import require_http_methods
 from django.conf import settings
-from django.db.models import Q, Avg, Count
-from django.db import connection
+from django.db.models import Q, F, Window
+from django.db.models.functions import RowNumber
+from django.db import connection, transaction
 from django.contrib.auth import authenticate, login
 from django.views.decorators.csrf import csrf_exempt
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
 from .models import (
     AllFilms, MovieGenre, MovieDirector, MovieLanguage,
     Actors, MovieAverageRating, ShowAverageRating,
@@ -13,8 +16,18 @@ from .models import (
     WatchedMovie, WatchedShow, Favorites,
     MovieRating, ShowUserRating
 )
+from .actor_names import MATCH_MODES, actor_name_list, search_actor_names
+from .audit import audit_events, flush_audit_log, record_audit
+from .audit_archive import read_archived_logs
+from .catalog_cache import cached_catalog
+from .metrics import request_metrics
+from .pagination import InvalidCursor, decode_cursor, encode_cursor, keyset_page
+from .routers import read_only_db
+from .search import apply_title_search, title_search_ranked
+from datetime import datetime
 import json
 import re
+import time
 
 
 def safe_int(value, default=0):
@@ -41,6 +54,73 @@ def safe_float(value, default=0.0):
         return default
 
 
+def top_cast_by_id(queryset, key_field, ids, per_item=3):
+    """Fetch the first few actor names for many films/shows in a single query.
+
+    Returns a dict mapping each id in ``ids`` to a list of up to ``per_item`` names,
+    using ROW_NUMBER() so the per-item cap is applied by the database.
+    """
+    cast_map = {item_id: [] for item_id in ids}
+    if not cast_map:
+        return cast_map
+    
+    for item_id, actor_name in top_cast_rows(queryset, key_field, ids, per_item):
+        cast_map[item_id].append(actor_name)
+    return cast_map
+
+
+def top_cast_rows(queryset, key_field, ids, per_item=3):
+    """(id, actor name) rows for top_cast_by_id, capped per id by ROW_NUMBER()"""
+    return queryset.filter(**{f'{key_field}__in': list(ids)}).annotate(
+        cast_rank=Window(
+            expression=RowNumber(),
+            partition_by=[F(key_field)],
+            order_by=F('pk').asc()
+        )
+    ).filter(cast_rank__lte=per_item).order_by(key_field, 'cast_rank').values_list(key_field, 'actor_name')
+
+
+# Keyset sort keys for each sortBy mode: (field, descending, null group).
+# The stored average and count are NULL together, via the aggregate row, for titles
+# nobody has rated yet. A ranked title search (FTS5 or trigram) ranks every match;
+# only the LIKE fallback leaves search_rank NULL, so it sorts by relevance_unranked.
+MOVIE_SORTS = {
+    'rating': [('avg_rating', True, 'movieaveragerating'), ('year', True, 'year'), ('film_id', True, None)],
+    'votes': [('rating_count', True, 'movieaveragerating'), ('avg_rating', True, 'movieaveragerating'), ('film_id', True, None)],
+    'year': [('year', True, 'year'), ('avg_rating', True, 'movieaveragerating'), ('film_id', True, None)],
+    'year_old': [('year', False, 'year'), ('avg_rating', True, 'movieaveragerating'), ('film_id', True, None)],
+    'runtime': [('duration', False, 'duration'), ('avg_rating', True, 'movieaveragerating'), ('film_id', True, None)],
+    'runtime_long': [('duration', True, 'duration'), ('avg_rating', True, 'movieaveragerating'), ('film_id', True, None)],
+    'relevance': [('search_rank', False, None), ('avg_rating', True, 'movieaveragerating'), ('film_id', True, None)],
+    'relevance_unranked': [('search_rank', False, 'search_rank'), ('avg_rating', True, 'movieaveragerating'), ('film_id', True, None)],
+}
+
+SHOW_SORTS = {
+    'rating': [('rating', True, 'rating'), ('avg_rating', True, 'showaveragerating'), ('show_id', True, None)],
+    'votes': [('rating_count', True, 'showaveragerating'), ('avg_rating', True, 'showaveragerating'), ('show_id', True, None)],
+    'year': [('start_year', True, 'start_year'), ('avg_rating', True, 'showaveragerating'), ('show_id', True, None)],
+    'year_old': [('start_year', False, 'start_year'), ('avg_rating', True, 'showaveragerating'), ('show_id', True, None)],
+    'runtime': [('duration', False, 'duration'), ('avg_rating', True, 'showaveragerating'), ('show_id', True, None)],
+    'runtime_long': [('duration', True, 'duration'), ('avg_rating', True, 'showaveragerating'), ('show_id', True, None)],
+    'relevance': [('search_rank', False, None), ('avg_rating', True, 'showaveragerating'), ('show_id', True, None)],
+    'relevance_unranked': [('search_rank', False, 'search_rank'), ('avg_rating', True, 'showaveragerating'), ('show_id', True, None)],
+}
+
+REVIEW_SORT = [('id', False, None)]
+
+# Newest first; every audit filter has an index ending in date (and the rowid)
+AUDIT_SORT = [('date', True, None), ('table_id', True, None)]
+
+
+def catalog_sort_name(sort_by, title_search, model):
+    """Map the sortBy parameter to a sort key; relevance only applies to title searches"""
+    if sort_by in ('relevance', 'relevance_unranked'):
+        if not title_search:
+            return 'rating'
+        return 'relevance' if title_search_ranked(model, title_search) else 'relevance_unranked'
+    return sort_by if sort_by in MOVIE_SORTS else 'rating'
+
+
 def testdb(request):
     """Test database connection"""
     try:
@@ -72,14 +152,27 @@ def testdb(request):
 
 
 @require_http_methods(["GET"])
+def metrics(request):
+    """Per-endpoint request metrics in the Prometheus text format (see api/metrics.py)"""
+    return HttpResponse(request_metrics.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+
+def movie_genre_names():
+    return MovieGenre.objects.values_list('genre_name', flat=True).distinct().order_by('genre_name')
+
+
+def show_genre_names():
+    return ShowGenre.objects.values_list('genre_name', flat=True).distinct().order_by('genre_name')
+
+
+@require_http_methods(["GET"])
+@read_only_db
 def genres(request):
     """Get all unique movie genres from the database"""
     try:
-        genres_list = MovieGenre.objects.values_list('genre_name', flat=True).distinct().order_by('genre_name')
-        
         return JsonResponse({
             'success': True,
-            'genres': list(genres_list)
+            'genres': cached_catalog('genres', lambda: list(movie_genre_names()))
         })
     except Exception as error:
         import traceback
@@ -91,14 +184,13 @@ def genres(request):
 
 
 @require_http_methods(["GET"])
+@read_only_db
 def show_genres(request):
     """Get all unique show genres from the database"""
     try:
-        genres_list = ShowGenre.objects.values_list('genre_name', flat=True).distinct().order_by('genre_name')
-        
         return JsonResponse({
             'success': True,
-            'genres': list(genres_list)
+            'genres': cached_catalog('show_genres', lambda: list(show_genre_names()))
         })
     except Exception as error:
         import traceback
@@ -151,8 +243,9 @@ def signup(request):
         try:
             user = User.objects.create_user(email=email, password=password)
             # Log to audit log
-            AuditLog.objects.create(
-                changes_to_data=f"Authorization event - User signup: New user created with email {email} (User ID: {user.user_id})"
+            record_audit(
+                f"Authorization event - User signup: New user created with email {email} (User ID: {user.user_id})",
+                'signup', user_id=user.user_id, entity_type='user', entity_id=user.user_id
             )
         except Exception as create_error:
             response = JsonResponse({
@@ -238,8 +331,9 @@ def signin(request):
             try:
                 login(request, user)
                 # Log to audit log
-                AuditLog.objects.create(
-                    changes_to_data=f"Authorization event - User signin: User {user.email} (User ID: {user.user_id}) signed in successfully"
+                record_audit(
+                    f"Authorization event - User signin: User {user.email} (User ID: {user.user_id}) signed in successfully",
+                    'signin', user_id=user.user_id, entity_type='user', entity_id=user.user_id
                 )
             except Exception as login_error:
                 response = JsonResponse({
@@ -314,8 +408,9 @@ def signout(request):
     try:
         if request.user.is_authenticated:
             # Log to audit log
-            AuditLog.objects.create(
-                changes_to_data=f"Authorization event - User signout: User {request.user.email} (User ID: {request.user.user_id}) signed out"
+            record_audit(
+                f"Authorization event - User signout: User {request.user.email} (User ID: {request.user.user_id}) signed out",
+                'signout', user_id=request.user.user_id, entity_type='user', entity_id=request.user.user_id
             )
             from django.contrib.auth import logout
             logout(request)
@@ -335,9 +430,39 @@ def signout(request):
         return response
 
 
+def serialize_audit_log(log):
+    return {
+        'table_id': log.table_id,
+        'date': log.date.isoformat(),
+        'changes_to_data': log.changes_to_data,
+        'user_id': log.user_id,
+        'action': log.action,
+        'entity_type': log.entity_type,
+        'entity_id': log.entity_id
+    }
+
+
+def parse_audit_time(value):
+    """Parse a since/until parameter (ISO date or datetime); raises ValueError if invalid"""
+    parsed = parse_datetime(value)
+    if parsed is None:
+        day = parse_date(value)
+        if day is None:
+            raise ValueError(f"Invalid date: {value}")
+        parsed = datetime.combine(day, datetime.min.time())
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
 @require_http_methods(["GET"])
 def audit_logs(request):
-    """Get audit logs"""
+    """Get audit logs, newest first.
+
+    Optional filters: userId, action, entityType (+ entityId), since, until.
+    Pages with limit and the next_cursor returned by the previous page; once the
+    live table runs out, pages continue into the archived monthly segments.
+    """
     try:
         # Get limit parameter (default 100, max 1000)
         limit_param = request.GET.get("limit", "100")
@@ -346,22 +471,56 @@ def audit_logs(request):
         except:
             limit = 100
         
-        # Get logs ordered by date (newest first)
-        logs = AuditLog.objects.all().order_by('-date')[:limit]
+        filters = {}
+        try:
+            if request.GET.get('userId'):
+                filters['user_id'] = int(request.GET['userId'])
+            if request.GET.get('action'):
+                filters['action'] = request.GET['action']
+            if request.GET.get('entityType'):
+                filters['entity_type'] = request.GET['entityType']
+                if request.GET.get('entityId'):
+                    filters['entity_id'] = int(request.GET['entityId'])
+            elif request.GET.get('entityId'):
+                raise ValueError('entityId requires entityType')
+            if request.GET.get('since'):
+                filters['date__gte'] = parse_audit_time(request.GET['since'])
+            if request.GET.get('until'):
+                filters['date__lt'] = parse_audit_time(request.GET['until'])
+        except ValueError as error:
+            return JsonResponse({'success': False, 'error': str(error)}, status=400)
         
-        logs_data = []
-        for log in logs:
-            logs_data.append({
-                'table_id': log.table_id,
-                'date': log.date.isoformat(),
-                'changes_to_data': log.changes_to_data
-            })
+        # Write anything still queued so the response includes it
+        flush_audit_log()
+        
+        cursor = request.GET.get('cursor')
+        logs, next_cursor = keyset_page(AuditLog.objects.filter(**filters), 'audit', AUDIT_SORT, limit, cursor)
+        
+        if next_cursor is None and len(logs) < limit:
+            # The live table is exhausted; older rows may have been archived
+            # (see api/audit_archive.py), and they are all older than any live row
+            if logs:
+                before = (logs[-1].date, logs[-1].table_id)
+            elif cursor:
+                _, values = decode_cursor(cursor, 'audit')
+                before = (parse_datetime(values[0]), values[1])
+            else:
+                before = None
+            logs = list(logs) + read_archived_logs(filters, before, limit - len(logs) + 1)
+            if len(logs) > limit:
+                logs = logs[:limit]
+                next_cursor = encode_cursor('audit', 0, [logs[-1].date, logs[-1].table_id])
+        
+        logs_data = [serialize_audit_log(log) for log in logs]
         
         return JsonResponse({
             'success': True,
             'logs': logs_data,
-            'count': len(logs_data)
+            'count': len(logs_data),
+            'next_cursor': next_cursor
         })
+    except InvalidCursor as error:
+        return JsonResponse({'success': False, 'error': str(error)}, status=400)
     except Exception as error:
         import traceback
         return JsonResponse({
@@ -371,39 +530,117 @@ def audit_logs(request):
         }, status=500)
 
 
+
+AUDIT_STREAM_BATCH = 500
+
+
+def audit_events_after(last_id):
+    """Audit entries newer than ``last_id``: from the in-process buffer when it holds
+    an unbroken run of ids after it, otherwise one primary-key range read"""
+    logs = audit_events.since(last_id)
+    if logs is None:
+        logs = list(AuditLog.objects.filter(table_id__gt=last_id).order_by('table_id')[:AUDIT_STREAM_BATCH])
+    return logs
+
+
+@require_http_methods(["GET"])
+def audit_log_stream(request):
+    """Stream new audit entries as Server-Sent Events.
+
+    Each event's id is the entry's table_id, so a reconnecting EventSource resumes
+    after the last entry it saw (Last-Event-ID header, or lastEventId parameter).
+    Without one the stream starts at the newest entry. Entries come from the
+    in-process buffer the audit writer publishes to while it holds every id after
+    the last one sent, and from the table otherwise; when it is idle for
+    AUDIT_LOG_STREAM_HEARTBEAT seconds the stream checks the table for entries
+    written by other processes and otherwise sends a keepalive comment. Streams
+    close after AUDIT_LOG_STREAM_MAX_SECONDS and the client reconnects.
+    """
+    last_event_id = request.headers.get('Last-Event-ID') or request.GET.get('lastEventId')
+    if last_event_id:
+        try:
+            last_id = int(last_event_id)
+        except ValueError:
+            return JsonResponse({'success': False, 'error': 'Invalid Last-Event-ID'}, status=400)
+    else:
+        last_id = audit_events.latest_id()
+        if last_id is None:
+            last_id = AuditLog.objects.order_by('-table_id').values_list('table_id', flat=True).first() or 0
+    
+    heartbeat = getattr(settings, 'AUDIT_LOG_STREAM_HEARTBEAT', 15)
+    max_seconds = getattr(settings, 'AUDIT_LOG_STREAM_MAX_SECONDS', 300)
+    
+    def events(last_id):
+        deadline = time.monotonic() + max_seconds
+        yield 'retry: 3000\n\n'
+        while time.monotonic() < deadline:
+            logs = audit_events_after(last_id)
+            if not logs:
+                if audit_events.wait(last_id, heartbeat):
+                    continue
+                # Idle: pick up entries other processes wrote, or keep the connection alive
+                logs = list(AuditLog.objects.filter(table_id__gt=last_id).order_by('table_id')[:AUDIT_STREAM_BATCH])
+                if not logs:
+                    yield ': keepalive\n\n'
+                    continue
+            for log in logs:
+                last_id = log.table_id
+                yield f"id: {log.table_id}\nevent: audit\ndata: {json.dumps(serialize_audit_log(log))}\n\n"
+    
+    response = StreamingHttpResponse(events(last_id), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+ACTOR_LIST_LIMIT = 200
+AUTOCOMPLETE_LIMIT = 10  # default suggestions for ?q=, at most AUTOCOMPLETE_MAX_LIMIT
+AUTOCOMPLETE_MAX_LIMIT = 50
+
+
+def actor_search_params(params):
+    """(query, match mode, limit) for the actors autocomplete, or None without ?q=.
+
+    Raises ValueError for an unknown match mode.
+    """
+    if not params.get('q'):
+        return None
+    match = params.get('match', 'prefix')
+    if match not in MATCH_MODES:
+        raise ValueError(f"Invalid match mode: {match} (expected one of {', '.join(MATCH_MODES)})")
+    try:
+        limit = max(1, min(AUTOCOMPLETE_MAX_LIMIT, int(params.get('limit', AUTOCOMPLETE_LIMIT))))
+    except (ValueError, TypeError):
+        limit = AUTOCOMPLETE_LIMIT
+    return params['q'], match, limit
+
+
+def serialize_actor_match(row):
+    name, credits = row
+    return {'name': name, 'credits': credits}
+
+
 @require_http_methods(["GET"])
+@read_only_db
 def actors(request):
-    """Get all unique actors from the database"""
+    """Get actor names: the first 200 alphabetically, or with ?q= the best matches.
+
+    ?q= matches the start of the name (match=prefix, the default) or any part of it
+    (match=substring), ignoring case, accents and punctuation; results are ordered
+    by number of credits. limit= sets how many (default 10, max 50).
+    """
     try:
-        # Get actors from both Actors table and ActedIn table
-        actors_from_films = Actors.objects.values_list('actor_name', flat=True).distinct()
-        
-        # Also get actors from ActedIn (shows)
-        actors_from_shows = ActedIn.objects.values_list('actor_name', flat=True).distinct()
-        
-        # Combine and deduplicate
-        all_actors = set(actors_from_films) | set(actors_from_shows)
-        
-        # Filter and clean actor names
-        cleaned_actors = []
-        for actor in all_actors:
-            if actor:
-                actor_clean = actor.strip()
-                if (actor_clean and 
-                    len(actor_clean) >= 2 and 
-                    len(actor_clean) < 50 and
-                    actor_clean != "Documentary" and 
-                    actor_clean != "N/A" and
-                    not actor_clean.isdigit() and
-                    "documentary" not in actor_clean.lower() and
-                    "n/a" not in actor_clean.lower()):
-                    cleaned_actors.append(actor_clean)
-        
-        cleaned_actors = sorted(cleaned_actors)[:200]  # Limit to top 200
-        
+        search = actor_search_params(request.GET)
+    except ValueError as error:
+        return JsonResponse({'success': False, 'error': str(error)}, status=400)
+
+    try:
+        if search:
+            query, match, limit = search
+            matches = [serialize_actor_match(row) for row in search_actor_names(query, match)[:limit]]
+            return JsonResponse({'success': True, 'actors': matches, 'count': len(matches)})
         return JsonResponse({
             'success': True,
-            'actors': cleaned_actors
+            'actors': cached_catalog('actors', lambda: list(actor_name_list()[:ACTOR_LIST_LIMIT]))
         })
     except Exception as error:
         import traceback
@@ -414,125 +651,118 @@ def actors(request):
         }, status=500)
 
 
+def movie_page_query(params):
+    """Build the filtered movies queryset from the request parameters.
+
+    Returns (queryset, sort name, limit, cursor) for keyset_page().
+    """
+    # Get filter parameters
+    genre = params.get("genre", "")
+    max_rating = params.get("maxRating", "")
+    year_from = params.get("yearFrom", "")
+    year_to = params.get("yearTo", "")
+    min_rating = params.get("minRating", "")
+    min_votes = params.get("minVotes", "")  # Note: We don't have votes in new schema
+    title_search = params.get("titleSearch", "")
+    sort_by = params.get("sortBy", "rating")
+    limit_param = params.get("limit", "100")
+    cursor = params.get("cursor", "")
+    
+    # Parse limit
+    try:
+        limit = max(1, min(500, int(limit_param)))
+    except:
+        limit = 100
+    
+    # Start with base queryset - ONLY MOVIES
+    queryset = AllFilms.objects.select_related('director_id', 'genre_id', 'language_id').all()
+    
+    # Title search filter - FTS5 prefix match, LIKE when FTS5 isn't available
+    title_search = title_search.strip()
+    if title_search:
+        queryset = apply_title_search(queryset, title_search)
+    
+    # Genre filter
+    if genre and genre != "" and genre != "Any":
+        queryset = queryset.filter(genre_id__genre_name__icontains=genre)
+    
+    # Year filter
+    if year_from and safe_int(year_from) > 0:
+        queryset = queryset.filter(
+            Q(year__gte=safe_int(year_from)) | Q(year__isnull=True)
+        )
+    if year_to and safe_int(year_to) > 0 and safe_int(year_to) < 3000:
+        queryset = queryset.filter(
+            Q(year__lte=safe_int(year_to)) | Q(year__isnull=True)
+        )
+    
+    # Average rating and rating count come from the stored aggregate table,
+    # kept current by movie_reviews, so sorting doesn't group every rating
+    queryset = queryset.annotate(
+        avg_rating=F('movieaveragerating__average_score'),
+        rating_count=F('movieaveragerating__rating_count')
+    )
+    
+    # Sort by based on sortBy parameter ("votes" uses the number of ratings,
+    # "relevance" the BM25 title match)
+    return queryset, catalog_sort_name(sort_by, title_search, AllFilms), limit, cursor
+
+
+def serialize_movie(film, cast):
+    """Movie in the frontend's format; ``cast`` is its first three actor names"""
+    # Get genres (we have one genre per film, but frontend expects array)
+    genres = []
+    if film.genre_id:
+        genres = [film.genre_id.genre_name]
+    
+    # Get average rating (0 when the film has no reviews yet)
+    avg_rating = film.avg_rating or 0.0
+    
+    # Rating certificate - we don't have this in films, use default
+    rating = "Unrated"
+    
+    # Get synopsis - we don't have description in new schema
+    synopsis = "No description available."
+    
+    return {
+        'film_id': film.film_id,
+        'title': film.film_name or "Unknown",
+        'genres': genres,
+        'runtime': film.duration or 0,
+        'rating': rating,
+        'score': safe_float(avg_rating, 0),
+        'synopsis': synopsis,
+        'cast': cast,
+        'director': film.director_id.director_name if film.director_id else "Unknown",
+        'year': film.year or None,
+        'votes': 0,  # We don't have votes in new schema
+        'rating_value': safe_float(avg_rating, 0)
+    }
+
+
 @require_http_methods(["GET"])
+@read_only_db
 def movies(request):
     """Get movies with filtering using Django ORM - ONLY MOVIES"""
     try:
-        # Get filter parameters
-        genre = request.GET.get("genre", "")
-        max_rating = request.GET.get("maxRating", "")
-        year_from = request.GET.get("yearFrom", "")
-        year_to = request.GET.get("yearTo", "")
-        min_rating = request.GET.get("minRating", "")
-        min_votes = request.GET.get("minVotes", "")  # Note: We don't have votes in new schema
-        title_search = request.GET.get("titleSearch", "")
-        sort_by = request.GET.get("sortBy", "rating")
-        limit_param = request.GET.get("limit", "100")
+        queryset, sort_name, limit, cursor = movie_page_query(request.GET)
+        films, next_cursor = keyset_page(queryset, sort_name, MOVIE_SORTS[sort_name], limit, cursor)
         
-        # Parse limit
-        try:
-            limit = max(1, min(500, int(limit_param)))
-        except:
-            limit = 100
-        
-        # Start with base queryset - ONLY MOVIES
-        queryset = AllFilms.objects.select_related('director_id', 'genre_id', 'language_id').all()
-        
-        # Title search filter
-        if title_search and title_search.strip():
-            queryset = queryset.filter(film_name__icontains=title_search.strip())
-        
-        # Genre filter
-        if genre and genre != "" and genre != "Any":
-            queryset = queryset.filter(genre_id__genre_name__icontains=genre)
-        
-        # Year filter
-        if year_from and safe_int(year_from) > 0:
-            queryset = queryset.filter(
-                Q(year__gte=safe_int(year_from)) | Q(year__isnull=True)
-            )
-        if year_to and safe_int(year_to) > 0 and safe_int(year_to) < 3000:
-            queryset = queryset.filter(
-                Q(year__lte=safe_int(year_to)) | Q(year__isnull=True)
-            )
-        
-        # Get average ratings for sorting
-        # We'll annotate with average rating if available
-        queryset = queryset.annotate(
-            avg_rating=Avg('movierating__user_rating')
-        )
-        
-        # Sort by based on sortBy parameter
-        if sort_by == "votes":
-            # Since we don't have votes, sort by number of ratings instead
-            queryset = queryset.annotate(
-                rating_count=Count('movierating')
-            ).order_by('-rating_count', '-avg_rating')
-        elif sort_by == "year":
-            queryset = queryset.order_by('-year', '-avg_rating')
-        elif sort_by == "year_old":
-            queryset = queryset.order_by('year', '-avg_rating')
-        elif sort_by == "runtime":
-            queryset = queryset.order_by('duration', '-avg_rating')
-        elif sort_by == "runtime_long":
-            queryset = queryset.order_by('-duration', '-avg_rating')
-        else:  # rating (default)
-            queryset = queryset.order_by('-avg_rating', '-year')
-        
-        # Apply limit
-        films = queryset[:limit]
+        # Batch the per-film cast lookup so the page costs a fixed number of queries
+        cast_by_film = top_cast_by_id(Actors.objects.all(), 'film_id', [film.film_id for film in films])
         
         # Transform to match frontend format
-        movies_data = []
-        for film in films:
-            # Get genres (we have one genre per film, but frontend expects array)
-            genres = []
-            if film.genre_id:
-                genres = [film.genre_id.genre_name]
-            
-            # Get cast/actors - using reverse relationship
-            cast = []
-            film_actors = film.actors_set.values_list('actor_name', flat=True)[:3]
-            cast = list(film_actors)
-            
-            # Get average rating
-            avg_rating = film.avg_rating if hasattr(film, 'avg_rating') and film.avg_rating else None
-            if not avg_rating:
-                # Try to get from MovieAverageRating table
-                try:
-                    avg_rating_obj = MovieAverageRating.objects.get(film_id=film)
-                    avg_rating = float(avg_rating_obj.average_score)
-                except MovieAverageRating.DoesNotExist:
-                    avg_rating = 0.0
-            
-            # Rating certificate - we don't have this in films, use default
-            rating = "Unrated"
-            
-            # Get synopsis - we don't have description in new schema
-            synopsis = "No description available."
-            
-            movie = {
-                'film_id': film.film_id,
-                'title': film.film_name or "Unknown",
-                'genres': genres,
-                'runtime': film.duration or 0,
-                'rating': rating,
-                'score': safe_float(avg_rating, 0),
-                'synopsis': synopsis,
-                'cast': cast,
-                'director': film.director_id.director_name if film.director_id else "Unknown",
-                'year': film.year or None,
-                'votes': 0,  # We don't have votes in new schema
-                'rating_value': safe_float(avg_rating, 0)
-            }
-            movies_data.append(movie)
+        movies_data = [serialize_movie(film, cast_by_film.get(film.film_id, [])) for film in films]
         
         return JsonResponse({
             'success': True,
             'movies': movies_data,
-            'count': len(movies_data)
+            'count': len(movies_data),
+            'next_cursor': next_cursor
         })
         
+    except InvalidCursor as error:
+        return JsonResponse({'success': False, 'error': str(error)}, status=400)
     except Exception as error:
         import traceback
         return JsonResponse({
@@ -542,163 +772,123 @@ def movies(request):
         }, status=500)
 
 
+def show_page_query(params):
+    """Build the filtered shows queryset from the request parameters.
+
+    Returns (queryset, sort name, limit, cursor) for keyset_page().
+    """
+    # Get filter parameters
+    genre = params.get("genre", "")
+    max_rating = params.get("maxRating", "")
+    year_from = params.get("yearFrom", "")
+    year_to = params.get("yearTo", "")
+    min_rating = params.get("minRating", "")
+    title_search = params.get("titleSearch", "")
+    sort_by = params.get("sortBy", "rating")
+    limit_param = params.get("limit", "100")
+    cursor = params.get("cursor", "")
+    
+    # Parse limit
+    try:
+        limit = max(1, min(500, int(limit_param)))
+    except:
+        limit = 100
+    
+    # Start with base queryset - ONLY SHOWS
+    queryset = AllShows.objects.select_related('cert_id', 'genre_id').all()
+    
+    # Title search filter - FTS5 prefix match, LIKE when FTS5 isn't available
+    title_search = title_search.strip()
+    if title_search:
+        queryset = apply_title_search(queryset, title_search)
+    
+    # Genre filter
+    if genre and genre != "" and genre != "Any":
+        queryset = queryset.filter(genre_id__genre_name__icontains=genre)
+    
+    # Certificate/Rating filter
+    if max_rating:
+        rating_order = {"G": 1, "PG": 2, "PG-13": 3, "R": 4, "NC-17": 5, "TV-G": 1, "TV-PG": 2, "TV-14": 3, "TV-MA": 4}
+        max_rating_value = rating_order.get(max_rating, 4)
+        allowed_ratings = [r for r, v in rating_order.items() if v <= max_rating_value]
+        
+        if allowed_ratings:
+            queryset = queryset.filter(
+                Q(cert_id__cert_rating__in=allowed_ratings) | Q(cert_id__isnull=True)
+            )
+    
+    # Year filter - uses the start year parsed from the years field at import time.
+    # Shows whose start year couldn't be determined are kept.
+    if year_from and safe_int(year_from) > 0:
+        queryset = queryset.filter(
+            Q(start_year__gte=safe_int(year_from)) | Q(start_year__isnull=True)
+        )
+    if year_to and safe_int(year_to) > 0 and safe_int(year_to) < 3000:
+        queryset = queryset.filter(
+            Q(start_year__lte=safe_int(year_to)) | Q(start_year__isnull=True)
+        )
+    
+    # Average rating and rating count come from the stored aggregate table
+    queryset = queryset.annotate(
+        avg_rating=F('showaveragerating__average_score'),
+        rating_count=F('showaveragerating__rating_count')
+    )
+    
+    return queryset, catalog_sort_name(sort_by, title_search, AllShows), limit, cursor
+
+
+def serialize_show(show, cast):
+    """Show in the frontend's format; ``cast`` is its first three actor names"""
+    # Get genres
+    genres = []
+    if show.genre_id:
+        genres = [show.genre_id.genre_name]
+    
+    # Get rating
+    avg_rating = show.avg_rating if hasattr(show, 'avg_rating') and show.avg_rating else None
+    if not avg_rating:
+        avg_rating = float(show.rating) if show.rating else 0.0
+    
+    # Certificate
+    rating = show.cert_id.cert_rating if show.cert_id else "Unrated"
+    
+    return {
+        'show_id': show.show_id,
+        'title': show.show_name or "Unknown",
+        'genres': genres,
+        'runtime': show.duration or 0,
+        'rating': rating,
+        'score': safe_float(avg_rating, 0),
+        'synopsis': "No description available.",
+        'cast': cast,
+        'director': "N/A",  # Shows don't have directors
+        'year': show.start_year,
+        'votes': 0,
+        'rating_value': safe_float(avg_rating, 0)
+    }
+
+
 @require_http_methods(["GET"])
+@read_only_db
 def shows(request):
     """Get shows with filtering using Django ORM - ONLY SHOWS"""
     try:
-        # Get filter parameters
-        genre = request.GET.get("genre", "")
-        max_rating = request.GET.get("maxRating", "")
-        year_from = request.GET.get("yearFrom", "")
-        year_to = request.GET.get("yearTo", "")
-        min_rating = request.GET.get("minRating", "")
-        title_search = request.GET.get("titleSearch", "")
-        sort_by = request.GET.get("sortBy", "rating")
-        limit_param = request.GET.get("limit", "100")
-        
-        # Parse limit
-        try:
-            limit = max(1, min(500, int(limit_param)))
-        except:
-            limit = 100
-        
-        # Start with base queryset - ONLY SHOWS
-        queryset = AllShows.objects.select_related('cert_id', 'genre_id').all()
-        
-        # Title search filter
-        if title_search and title_search.strip():
-            queryset = queryset.filter(show_name__icontains=title_search.strip())
-        
-        # Genre filter
-        if genre and genre != "" and genre != "Any":
-            queryset = queryset.filter(genre_id__genre_name__icontains=genre)
-        
-        # Certificate/Rating filter
-        if max_rating:
-            rating_order = {"G": 1, "PG": 2, "PG-13": 3, "R": 4, "NC-17": 5, "TV-G": 1, "TV-PG": 2, "TV-14": 3, "TV-MA": 4}
-            max_rating_value = rating_order.get(max_rating, 4)
-            allowed_ratings = [r for r, v in rating_order.items() if v <= max_rating_value]
-            
-            if allowed_ratings:
-                queryset = queryset.filter(
-                    Q(cert_id__cert_rating__in=allowed_ratings) | Q(cert_id__isnull=True)
-                )
-        
-        # Year filter - parse from years field (format: "20152022" or "2008-2013")
-        # For shows, we need to extract the start year and check if it falls in range
-        if year_from and safe_int(year_from) > 0:
-            year_from_val = safe_int(year_from)
-            # Show must start in or after year_from, or we can't determine (include it)
-            # We'll filter in Python since SQL can't easily parse "20152022" format
-            pass  # Will filter after querying
-        
-        if year_to and safe_int(year_to) > 0 and safe_int(year_to) < 3000:
-            year_to_val = safe_int(year_to)
-            # Show must start before or in year_to, or we can't determine (include it)
-            pass  # Will filter after querying
-        
-        # Get average ratings for sorting
-        queryset = queryset.annotate(
-            avg_rating=Avg('showuserrating__user_rating')
-        )
-        
-        # Sort by based on sortBy parameter
-        if sort_by == "votes":
-            queryset = queryset.annotate(
-                rating_count=Count('showuserrating')
-            ).order_by('-rating_count', '-avg_rating')
-        elif sort_by == "year":
-            queryset = queryset.order_by('-years', '-avg_rating')
-        elif sort_by == "year_old":
-            queryset = queryset.order_by('years', '-avg_rating')
-        elif sort_by == "runtime":
-            queryset = queryset.order_by('duration', '-avg_rating')
-        elif sort_by == "runtime_long":
-            queryset = queryset.order_by('-duration', '-avg_rating')
-        else:  # rating (default)
-            queryset = queryset.order_by('-rating', '-avg_rating')
-        
-        # Get all shows first (before year filtering)
-        all_shows = list(queryset)
-        
-        # Apply year filtering in Python (since years field format is complex)
-        filtered_shows = []
-        for show in all_shows:
-            show_start_year = None
-            
-            # Parse years field - handle formats like "20152022", "2008-2013", "(20082013)"
-            if show.years:
-                years_str = str(show.years).strip().replace('(', '').replace(')', '')
-                # Try to extract first 4-digit year
-                import re
-                year_match = re.search(r'(\d{4})', years_str)
-                if year_match:
-                    show_start_year = int(year_match.group(1))
-            
-            # Apply year filters
-            if year_from and safe_int(year_from) > 0:
-                if show_start_year and show_start_year < safe_int(year_from):
-                    continue  # Show starts before year_from, exclude it
-            
-            if year_to and safe_int(year_to) > 0 and safe_int(year_to) < 3000:
-                if show_start_year and show_start_year > safe_int(year_to):
-                    continue  # Show starts after year_to, exclude it
-            
-            filtered_shows.append(show)
-            if len(filtered_shows) >= limit:
-                break
+        queryset, sort_name, limit, cursor = show_page_query(request.GET)
+        filtered_shows, next_cursor = keyset_page(queryset, sort_name, SHOW_SORTS[sort_name], limit, cursor)
+        cast_by_show = top_cast_by_id(ActedIn.objects.all(), 'show_id', [show.show_id for show in filtered_shows])
         
         # Transform to match frontend format
-        shows_data = []
-        for show in filtered_shows:
-            # Get genres
-            genres = []
-            if show.genre_id:
-                genres = [show.genre_id.genre_name]
-            
-            # Get cast/actors
-            cast = []
-            show_actors = ActedIn.objects.filter(show_id=show).values_list('actor_name', flat=True)[:3]
-            cast = list(show_actors)
-            
-            # Get rating
-            avg_rating = show.avg_rating if hasattr(show, 'avg_rating') and show.avg_rating else None
-            if not avg_rating:
-                avg_rating = float(show.rating) if show.rating else 0.0
-            
-            # Certificate
-            rating = show.cert_id.cert_rating if show.cert_id else "Unrated"
-            
-            # Parse year from years field
-            year = None
-            if show.years:
-                import re
-                year_match = re.search(r'(\d{4})', str(show.years))
-                if year_match:
-                    year = int(year_match.group(1))
-            
-            show_data = {
-                'show_id': show.show_id,
-                'title': show.show_name or "Unknown",
-                'genres': genres,
-                'runtime': show.duration or 0,
-                'rating': rating,
-                'score': safe_float(avg_rating, 0),
-                'synopsis': "No description available.",
-                'cast': cast,
-                'director': "N/A",  # Shows don't have directors
-                'year': year,
-                'votes': 0,
-                'rating_value': safe_float(avg_rating, 0)
-            }
-            shows_data.append(show_data)
+        shows_data = [serialize_show(show, cast_by_show.get(show.show_id, [])) for show in filtered_shows]
         
         return JsonResponse({
             'success': True,
             'movies': shows_data,  # Use 'movies' key for frontend compatibility
-            'count': len(shows_data)
+            'count': len(shows_data),
+            'next_cursor': next_cursor
         })
         
+    except InvalidCursor as error:
+        return JsonResponse({'success': False, 'error': str(error)}, status=400)
     except Exception as error:
         import traceback
         return JsonResponse({
@@ -726,8 +916,9 @@ def watch_later_movie(request, film_id=None):
                 film_id=film
             )
             if created:
-                AuditLog.objects.create(
-                    changes_to_data=f"User {request.user.email} added movie '{film.film_name}' to watch later"
+                record_audit(
+                    f"User {request.user.email} added movie '{film.film_name}' to watch later",
+                    'watch_later_add', user_id=request.user.user_id, entity_type='movie', entity_id=film.film_id
                 )
             response = JsonResponse({
                 'success': True,
@@ -742,8 +933,9 @@ def watch_later_movie(request, film_id=None):
                 film_id=film
             ).delete()[0]
             if deleted:
-                AuditLog.objects.create(
-                    changes_to_data=f"User {request.user.email} removed movie '{film.film_name}' from watch later"
+                record_audit(
+                    f"User {request.user.email} removed movie '{film.film_name}' from watch later",
+                    'watch_later_remove', user_id=request.user.user_id, entity_type='movie', entity_id=film.film_id
                 )
             response = JsonResponse({
                 'success': True,
@@ -752,7 +944,9 @@ def watch_later_movie(request, film_id=None):
             })
         else:  # GET
             # Get all watch later movies for user
-            watch_later_list = WatchLaterMovie.objects.filter(user_id=request.user).select_related('film_id')
+            watch_later_list = WatchLaterMovie.objects.filter(user_id=request.user).select_related(
+                'film_id__genre_id', 'film_id__director_id'
+            )
             movies_data = []
             for item in watch_later_list:
                 film = item.film_id
@@ -798,8 +992,9 @@ def watch_later_show(request, show_id=None):
                 show_id=show
             )
             if created:
-                AuditLog.objects.create(
-                    changes_to_data=f"User {request.user.email} added show '{show.show_name}' to watch later"
+                record_audit(
+                    f"User {request.user.email} added show '{show.show_name}' to watch later",
+                    'watch_later_add', user_id=request.user.user_id, entity_type='show', entity_id=show.show_id
                 )
             response = JsonResponse({
                 'success': True,
@@ -813,8 +1008,9 @@ def watch_later_show(request, show_id=None):
                 show_id=show
             ).delete()[0]
             if deleted:
-                AuditLog.objects.create(
-                    changes_to_data=f"User {request.user.email} removed show '{show.show_name}' from watch later"
+                record_audit(
+                    f"User {request.user.email} removed show '{show.show_name}' from watch later",
+                    'watch_later_remove', user_id=request.user.user_id, entity_type='show', entity_id=show.show_id
                 )
             response = JsonResponse({
                 'success': True,
@@ -822,7 +1018,9 @@ def watch_later_show(request, show_id=None):
                 'deleted': deleted > 0
             })
         else:  # GET
-            watch_later_list = WatchLaterShow.objects.filter(user_id=request.user).select_related('show_id')
+            watch_later_list = WatchLaterShow.objects.filter(user_id=request.user).select_related(
+                'show_id__genre_id', 'show_id__cert_id'
+            )
             shows_data = []
             for item in watch_later_list:
                 show = item.show_id
@@ -864,7 +1062,9 @@ def favorites(request):
     
     try:
         if request.method == 'GET':
-            fav, created = Favorites.objects.get_or_create(user_id=request.user)
+            fav, created = Favorites.objects.select_related('fav_director', 'fav_genre').get_or_create(
+                user_id=request.user
+            )
             response = JsonResponse({
                 'success': True,
                 'favorites': {
@@ -897,8 +1097,9 @@ def favorites(request):
                 fav.fav_decade = data['fav_decade']
             
             fav.save()
-            AuditLog.objects.create(
-                changes_to_data=f"User {request.user.email} updated favorites"
+            record_audit(
+                f"User {request.user.email} updated favorites",
+                'favorites_update', user_id=request.user.user_id, entity_type='user', entity_id=request.user.user_id
             )
             response = JsonResponse({
                 'success': True,
@@ -920,6 +1121,46 @@ def favorites(request):
         return response
 
 
+def top_movie_reviews(user):
+    """The user's ten highest movie ratings of 8 or more"""
+    return MovieRating.objects.filter(
+        user_id=user,
+        user_rating__gte=8
+    ).select_related('film_id__genre_id').order_by('-user_rating')[:10]
+
+
+def top_show_reviews(user):
+    """The user's ten highest show ratings of 8 or more"""
+    return ShowUserRating.objects.filter(
+        user_id=user,
+        user_rating__gte=8
+    ).select_related('show_id__genre_id').order_by('-user_rating')[:10]
+
+
+def serialize_top_movie(review):
+    film = review.film_id
+    return {
+        'film_id': film.film_id,
+        'title': film.film_name,
+        'year': film.year,
+        'rating': review.user_rating,
+        'review': review.user_review,
+        'genre': film.genre_id.genre_name if film.genre_id else None,
+    }
+
+
+def serialize_top_show(review):
+    show = review.show_id
+    return {
+        'show_id': show.show_id,
+        'title': show.show_name,
+        'years': show.years,
+        'rating': review.user_rating,
+        'review': review.user_review,
+        'genre': show.genre_id.genre_name if show.genre_id else None,
+    }
+
+
 @csrf_exempt
 @require_http_methods(["GET"])
 def user_top_rated(request):
@@ -930,41 +1171,8 @@ def user_top_rated(request):
         return response
     
     try:
-        # Get top-rated movies (rating >= 8)
-        top_movie_reviews = MovieRating.objects.filter(
-            user_id=request.user,
-            user_rating__gte=8
-        ).select_related('film_id').order_by('-user_rating')[:10]
-        
-        top_movies = []
-        for review in top_movie_reviews:
-            film = review.film_id
-            top_movies.append({
-                'film_id': film.film_id,
-                'title': film.film_name,
-                'year': film.year,
-                'rating': review.user_rating,
-                'review': review.user_review,
-                'genre': film.genre_id.genre_name if film.genre_id else None,
-            })
-        
-        # Get top-rated shows (rating >= 8)
-        top_show_reviews = ShowUserRating.objects.filter(
-            user_id=request.user,
-            user_rating__gte=8
-        ).select_related('show_id').order_by('-user_rating')[:10]
-        
-        top_shows = []
-        for review in top_show_reviews:
-            show = review.show_id
-            top_shows.append({
-                'show_id': show.show_id,
-                'title': show.show_name,
-                'years': show.years,
-                'rating': review.user_rating,
-                'review': review.user_review,
-                'genre': show.genre_id.genre_name if show.genre_id else None,
-            })
+        top_movies = [serialize_top_movie(review) for review in top_movie_reviews(request.user)]
+        top_shows = [serialize_top_show(review) for review in top_show_reviews(request.user)]
         
         response = JsonResponse({
             'success': True,
@@ -997,28 +1205,26 @@ def personalized_recommendations(request):
         # Build query based on favorites
         movies_query = AllFilms.objects.all()
         
-        if fav.fav_genre:
-            movies_query = movies_query.filter(genre_id=fav.fav_genre)
+        if fav.fav_genre_id:
+            movies_query = movies_query.filter(genre_id=fav.fav_genre_id)
         
-        if fav.fav_director:
-            movies_query = movies_query.filter(director_id=fav.fav_director)
+        if fav.fav_director_id:
+            movies_query = movies_query.filter(director_id=fav.fav_director_id)
         
         if fav.fav_decade:
             # Parse decade (e.g., "1990s" -> 1990-1999)
             decade_start = int(fav.fav_decade.replace('s', ''))
             movies_query = movies_query.filter(year__gte=decade_start, year__lt=decade_start + 10)
         
-        # Get recommended movies (limit 20, order by rating)
-        recommended = movies_query.select_related('genre_id', 'director_id')[:20]
+        # Get recommended movies (limit 20, order by rating), with their stored average
+        recommended = movies_query.select_related('genre_id', 'director_id').annotate(
+            avg_rating=F('movieaveragerating__average_score')
+        )[:20]
         
         recommendations_data = []
         for film in recommended:
-            # Get average rating
-            try:
-                avg_rating = MovieAverageRating.objects.get(film_id=film)
-                rating = float(avg_rating.average_score)
-            except:
-                rating = 0.0
+            # 0 when the film has no reviews yet
+            rating = float(film.avg_rating) if film.avg_rating is not None else 0.0
             
             recommendations_data.append({
                 'film_id': film.film_id,
@@ -1048,8 +1254,56 @@ def personalized_recommendations(request):
 
 # ==================== REVIEWS ENDPOINTS ====================
 
+def review_page_limit(request):
+    """Page size for review listings (default and max 100)"""
+    try:
+        return max(1, min(100, int(request.GET.get('limit', '100'))))
+    except (ValueError, TypeError):
+        return 100
+
+
+def movie_review_queryset(film_id=None):
+    reviews = MovieRating.objects.all().select_related('user_id', 'film_id')
+    if film_id:
+        reviews = reviews.filter(film_id=film_id)
+    return reviews
+
+
+def show_review_queryset(show_id=None):
+    reviews = ShowUserRating.objects.all().select_related('user_id', 'show_id')
+    if show_id:
+        reviews = reviews.filter(show_id=show_id)
+    return reviews
+
+
+def serialize_movie_review(review):
+    return {
+        'review_id': review.id,
+        'film_id': review.film_id.film_id,
+        'film_name': review.film_id.film_name,
+        'user_id': review.user_id.user_id,
+        'user_email': review.user_id.email,
+        'rating': review.user_rating,
+        'review': review.user_review,
+        'date': review.id,  # Using id as proxy for date
+    }
+
+
+def serialize_show_review(review):
+    return {
+        'review_id': review.id,
+        'show_id': review.show_id.show_id,
+        'show_name': review.show_id.show_name,
+        'user_id': review.user_id.user_id,
+        'user_email': review.user_id.email,
+        'rating': review.user_rating,
+        'review': review.user_review,
+    }
+
+
 @csrf_exempt
 @require_http_methods(["GET", "POST", "PUT", "DELETE"])
+@read_only_db
 def movie_reviews(request, film_id=None):
     """Get, post, update, or delete movie reviews"""
     if not request.user.is_authenticated and request.method != 'GET':
@@ -1059,28 +1313,17 @@ def movie_reviews(request, film_id=None):
     
     try:
         if request.method == 'GET':
-            # Get all reviews for a movie, or all reviews if no film_id
-            if film_id:
-                reviews = MovieRating.objects.filter(film_id=film_id).select_related('user_id', 'film_id')
-            else:
-                reviews = MovieRating.objects.all().select_related('user_id', 'film_id')[:100]
-            
-            reviews_data = []
-            for review in reviews:
-                reviews_data.append({
-                    'review_id': review.id,
-                    'film_id': review.film_id.film_id,
-                    'film_name': review.film_id.film_name,
-                    'user_id': review.user_id.user_id,
-                    'user_email': review.user_id.email,
-                    'rating': review.user_rating,
-                    'review': review.user_review,
-                    'date': review.id,  # Using id as proxy for date
-                })
+            # Get reviews for a movie, or all reviews if no film_id, one keyset page at a time
+            reviews, next_cursor = keyset_page(
+                movie_review_queryset(film_id), 'reviews', REVIEW_SORT,
+                review_page_limit(request), request.GET.get('cursor')
+            )
+            reviews_data = [serialize_movie_review(review) for review in reviews]
             response = JsonResponse({
                 'success': True,
                 'reviews': reviews_data,
-                'count': len(reviews_data)
+                'count': len(reviews_data),
+                'next_cursor': next_cursor
             })
         elif request.method == 'POST':
             # Create new review
@@ -1090,16 +1333,22 @@ def movie_reviews(request, film_id=None):
             rating = data.get('rating', 5)
             review_text = data.get('review', '')
             
-            review, created = MovieRating.objects.update_or_create(
-                film_id=film,
-                user_id=request.user,
-                defaults={
-                    'user_rating': rating,
-                    'user_review': review_text
-                }
-            )
-            AuditLog.objects.create(
-                changes_to_data=f"User {request.user.email} posted review for movie '{film.film_name}' (Rating: {rating})"
+            with transaction.atomic():
+                previous_rating = MovieRating.objects.filter(
+                    film_id=film, user_id=request.user
+                ).values_list('user_rating', flat=True).first()
+                review, created = MovieRating.objects.update_or_create(
+                    film_id=film,
+                    user_id=request.user,
+                    defaults={
+                        'user_rating': rating,
+                        'user_review': review_text
+                    }
+                )
+                MovieAverageRating.apply_rating_change(film, previous_rating, safe_int(rating))
+            record_audit(
+                f"User {request.user.email} posted review for movie '{film.film_name}' (Rating: {rating})",
+                'review_create', user_id=request.user.user_id, entity_type='movie', entity_id=film.film_id
             )
             response = JsonResponse({
                 'success': True,
@@ -1117,12 +1366,16 @@ def movie_reviews(request, film_id=None):
             # Update review
             body = request.body.decode('utf-8') if isinstance(request.body, bytes) else request.body
             data = json.loads(body)
-            review = MovieRating.objects.get(film_id=film_id, user_id=request.user)
-            review.user_rating = data.get('rating', review.user_rating)
-            review.user_review = data.get('review', review.user_review)
-            review.save()
-            AuditLog.objects.create(
-                changes_to_data=f"User {request.user.email} updated review for movie '{review.film_id.film_name}'"
+            with transaction.atomic():
+                review = MovieRating.objects.select_related('film_id').get(film_id=film_id, user_id=request.user)
+                previous_rating = review.user_rating
+                review.user_rating = data.get('rating', review.user_rating)
+                review.user_review = data.get('review', review.user_review)
+                review.save()
+                MovieAverageRating.apply_rating_change(review.film_id, previous_rating, safe_int(review.user_rating))
+            record_audit(
+                f"User {request.user.email} updated review for movie '{review.film_id.film_name}'",
+                'review_update', user_id=request.user.user_id, entity_type='movie', entity_id=review.film_id_id
             )
             response = JsonResponse({
                 'success': True,
@@ -1135,11 +1388,14 @@ def movie_reviews(request, film_id=None):
                 }
             })
         else:  # DELETE
-            review = MovieRating.objects.get(film_id=film_id, user_id=request.user)
-            film_name = review.film_id.film_name
-            review.delete()
-            AuditLog.objects.create(
-                changes_to_data=f"User {request.user.email} deleted review for movie '{film_name}'"
+            with transaction.atomic():
+                review = MovieRating.objects.select_related('film_id').get(film_id=film_id, user_id=request.user)
+                film_name = review.film_id.film_name
+                review.delete()
+                MovieAverageRating.apply_rating_change(review.film_id, review.user_rating, None)
+            record_audit(
+                f"User {request.user.email} deleted review for movie '{film_name}'",
+                'review_delete', user_id=request.user.user_id, entity_type='movie', entity_id=review.film_id_id
             )
             response = JsonResponse({
                 'success': True,
@@ -1155,6 +1411,10 @@ def movie_reviews(request, film_id=None):
         response = JsonResponse({'success': False, 'error': 'Review not found'}, status=404)
         response['Access-Control-Allow-Origin'] = '*'
         return response
+    except InvalidCursor as error:
+        response = JsonResponse({'success': False, 'error': str(error)}, status=400)
+        response['Access-Control-Allow-Origin'] = '*'
+        return response
     except Exception as error:
         response = JsonResponse({'success': False, 'error': str(error)}, status=500)
         response['Access-Control-Allow-Origin'] = '*'
@@ -1163,6 +1423,7 @@ def movie_reviews(request, film_id=None):
 
 @csrf_exempt
 @require_http_methods(["GET", "POST", "PUT", "DELETE"])
+@read_only_db
 def show_reviews(request, show_id=None):
     """Get, post, update, or delete show reviews"""
     if not request.user.is_authenticated and request.method != 'GET':
@@ -1172,26 +1433,16 @@ def show_reviews(request, show_id=None):
     
     try:
         if request.method == 'GET':
-            if show_id:
-                reviews = ShowUserRating.objects.filter(show_id=show_id).select_related('user_id', 'show_id')
-            else:
-                reviews = ShowUserRating.objects.all().select_related('user_id', 'show_id')[:100]
-            
-            reviews_data = []
-            for review in reviews:
-                reviews_data.append({
-                    'review_id': review.id,
-                    'show_id': review.show_id.show_id,
-                    'show_name': review.show_id.show_name,
-                    'user_id': review.user_id.user_id,
-                    'user_email': review.user_id.email,
-                    'rating': review.user_rating,
-                    'review': review.user_review,
-                })
+            reviews, next_cursor = keyset_page(
+                show_review_queryset(show_id), 'reviews', REVIEW_SORT,
+                review_page_limit(request), request.GET.get('cursor')
+            )
+            reviews_data = [serialize_show_review(review) for review in reviews]
             response = JsonResponse({
                 'success': True,
                 'reviews': reviews_data,
-                'count': len(reviews_data)
+                'count': len(reviews_data),
+                'next_cursor': next_cursor
             })
         elif request.method == 'POST':
             body = request.body.decode('utf-8') if isinstance(request.body, bytes) else request.body
@@ -1200,16 +1451,22 @@ def show_reviews(request, show_id=None):
             rating = data.get('rating', 5)
             review_text = data.get('review', '')
             
-            review, created = ShowUserRating.objects.update_or_create(
-                show_id=show,
-                user_id=request.user,
-                defaults={
-                    'user_rating': rating,
-                    'user_review': review_text
-                }
-            )
-            AuditLog.objects.create(
-                changes_to_data=f"User {request.user.email} posted review for show '{show.show_name}' (Rating: {rating})"
+            with transaction.atomic():
+                previous_rating = ShowUserRating.objects.filter(
+                    show_id=show, user_id=request.user
+                ).values_list('user_rating', flat=True).first()
+                review, created = ShowUserRating.objects.update_or_create(
+                    show_id=show,
+                    user_id=request.user,
+                    defaults={
+                        'user_rating': rating,
+                        'user_review': review_text
+                    }
+                )
+                ShowAverageRating.apply_rating_change(show, previous_rating, safe_int(rating))
+            record_audit(
+                f"User {request.user.email} posted review for show '{show.show_name}' (Rating: {rating})",
+                'review_create', user_id=request.user.user_id, entity_type='show', entity_id=show.show_id
             )
             response = JsonResponse({
                 'success': True,
@@ -1226,12 +1483,16 @@ def show_reviews(request, show_id=None):
         elif request.method == 'PUT':
             body = request.body.decode('utf-8') if isinstance(request.body, bytes) else request.body
             data = json.loads(body)
-            review = ShowUserRating.objects.get(show_id=show_id, user_id=request.user)
-            review.user_rating = data.get('rating', review.user_rating)
-            review.user_review = data.get('review', review.user_review)
-            review.save()
-            AuditLog.objects.create(
-                changes_to_data=f"User {request.user.email} updated review for show '{review.show_id.show_name}'"
+            with transaction.atomic():
+                review = ShowUserRating.objects.select_related('show_id').get(show_id=show_id, user_id=request.user)
+                previous_rating = review.user_rating
+                review.user_rating = data.get('rating', review.user_rating)
+                review.user_review = data.get('review', review.user_review)
+                review.save()
+                ShowAverageRating.apply_rating_change(review.show_id, previous_rating, safe_int(review.user_rating))
+            record_audit(
+                f"User {request.user.email} updated review for show '{review.show_id.show_name}'",
+                'review_update', user_id=request.user.user_id, entity_type='show', entity_id=review.show_id_id
             )
             response = JsonResponse({
                 'success': True,
@@ -1244,11 +1505,14 @@ def show_reviews(request, show_id=None):
                 }
             })
         else:  # DELETE
-            review = ShowUserRating.objects.get(show_id=show_id, user_id=request.user)
-            show_name = review.show_id.show_name
-            review.delete()
-            AuditLog.objects.create(
-                changes_to_data=f"User {request.user.email} deleted review for show '{show_name}'"
+            with transaction.atomic():
+                review = ShowUserRating.objects.select_related('show_id').get(show_id=show_id, user_id=request.user)
+                show_name = review.show_id.show_name
+                review.delete()
+                ShowAverageRating.apply_rating_change(review.show_id, review.user_rating, None)
+            record_audit(
+                f"User {request.user.email} deleted review for show '{show_name}'",
+                'review_delete', user_id=request.user.user_id, entity_type='show', entity_id=review.show_id_id
             )
             response = JsonResponse({
                 'success': True,
@@ -1264,6 +1528,10 @@ def show_reviews(request, show_id=None):
         response = JsonResponse({'success': False, 'error': 'Review not found'}, status=404)
         response['Access-Control-Allow-Origin'] = '*'
         return response
+    except InvalidCursor as error:
+        response = JsonResponse({'success': False, 'error': str(error)}, status=400)
+        response['Access-Control-Allow-Origin'] = '*'
+        return response
     except Exception as error:
         response = JsonResponse({'success': False, 'error': str(error)}, status=500)
         response['Access-Control-Allow-Origin'] = '*'
@@ -18,8 +18,9 @@ def watch_later_movie(request, film_id=None):
                 film_id=film
             )
             if created:
-                AuditLog.objects.create(
-                    changes_to_data=f"User {request.user.email} added movie '{film.film_name}' to watch later"
+                record_audit(
+                    f"User {request.user.email} added movie '{film.film_name}' to watch later",
+                    'watch_later_add', user_id=request.user.user_id, entity_type='movie', entity_id=film.film_id
                 )
             response = JsonResponse({
                 'success': True,
@@ -34,8 +35,9 @@ def watch_later_movie(request, film_id=None):
                 film_id=film
             ).delete()[0]
             if deleted:
-                AuditLog.objects.create(
-                    changes_to_data=f"User {request.user.email} removed movie '{film.film_name}' from watch later"
+                record_audit(
+                    f"User {request.user.email} removed movie '{film.film_name}' from watch later",
+                    'watch_later_remove', user_id=request.user.user_id, entity_type='movie', entity_id=film.film_id
                 )
             response = JsonResponse({
                 'success': True,
@@ -90,8 +92,9 @@ def watch_later_show(request, show_id=None):
                 show_id=show
             )
             if created:
-                AuditLog.objects.create(
-                    changes_to_data=f"User {request.user.email} added show '{show.show_name}' to watch later"
+                record_audit(
+                    f"User {request.user.email} added show '{show.show_name}' to watch later",
+                    'watch_later_add', user_id=request.user.user_id, entity_type='show', entity_id=show.show_id
                 )
             response = JsonResponse({
                 'success': True,
@@ -105,8 +108,9 @@ def watch_later_show(request, show_id=None):
                 show_id=show
             ).delete()[0]
             if deleted:
-                AuditLog.objects.create(
-                    changes_to_data=f"User {request.user.email} removed show '{show.show_name}' from watch later"
+                record_audit(
+                    f"User {request.user.email} removed show '{show.show_name}' from watch later",
+                    'watch_later_remove', user_id=request.user.user_id, entity_type='show', entity_id=show.show_id
                 )
             response = JsonResponse({
                 'success': True,
@@ -189,8 +193,9 @@ def favorites(request):
                 fav.fav_decade = data['fav_decade']
             
             fav.save()
-            AuditLog.objects.create(
-                changes_to_data=f"User {request.user.email} updated favorites"
+            record_audit(
+                f"User {request.user.email} updated favorites",
+                'favorites_update', user_id=request.user.user_id, entity_type='user', entity_id=request.user.user_id
             )
             response = JsonResponse({
                 'success': True,
@@ -264,8 +269,9 @@ def movie_reviews(request, film_id=None):
                     'user_review': review_text
                 }
             )
-            AuditLog.objects.create(
-                changes_to_data=f"User {request.user.email} posted review for movie '{film.film_name}' (Rating: {rating})"
+            record_audit(
+                f"User {request.user.email} posted review for movie '{film.film_name}' (Rating: {rating})",
+                'review_create', user_id=request.user.user_id, entity_type='movie', entity_id=film.film_id
             )
             response = JsonResponse({
                 'success': True,
@@ -287,8 +293,9 @@ def movie_reviews(request, film_id=None):
             review.user_rating = data.get('rating', review.user_rating)
             review.user_review = data.get('review', review.user_review)
             review.save()
-            AuditLog.objects.create(
-                changes_to_data=f"User {request.user.email} updated review for movie '{review.film_id.film_name}'"
+            record_audit(
+                f"User {request.user.email} updated review for movie '{review.film_id.film_name}'",
+                'review_update', user_id=request.user.user_id, entity_type='movie', entity_id=review.film_id_id
             )
             response = JsonResponse({
                 'success': True,
@@ -304,8 +311,9 @@ def movie_reviews(request, film_id=None):
             review = MovieRating.objects.get(film_id=film_id, user_id=request.user)
             film_name = review.film_id.film_name
             review.delete()
-            AuditLog.objects.create(
-                changes_to_data=f"User {request.user.email} deleted review for movie '{film_name}'"
+            record_audit(
+                f"User {request.user.email} deleted review for movie '{film_name}'",
+                'review_delete', user_id=request.user.user_id, entity_type='movie', entity_id=review.film_id_id
             )
             response = JsonResponse({
                 'success': True,
@@ -374,8 +382,9 @@ def show_reviews(request, show_id=None):
                     'user_review': review_text
                 }
             )
-            AuditLog.objects.create(
-                changes_to_data=f"User {request.user.email} posted review for show '{show.show_name}' (Rating: {rating})"
+            record_audit(
+                f"User {request.user.email} posted review for show '{show.show_name}' (Rating: {rating})",
+                'review_create', user_id=request.user.user_id, entity_type='show', entity_id=show.show_id
             )
             response = JsonResponse({
                 'success': True,
@@ -396,8 +405,9 @@ def show_reviews(request, show_id=None):
             review.user_rating = data.get('rating', review.user_rating)
             review.user_review = data.get('review', review.user_review)
             review.save()
-            AuditLog.objects.create(
-                changes_to_data=f"User {request.user.email} updated review for show '{review.show_id.show_name}'"
+            record_audit(
+                f"User {request.user.email} updated review for show '{review.show_id.show_name}'",
+                'review_update', user_id=request.user.user_id, entity_type='show', entity_id=review.show_id_id
             )
             response = JsonResponse({
                 'success': True,
@@ -413,8 +423,9 @@ def show_reviews(request, show_id=None):
             review = ShowUserRating.objects.get(show_id=show_id, user_id=request.user)
             show_name = review.show_id.show_name
             review.delete()
-            AuditLog.objects.create(
-                changes_to_data=f"User {request.user.email} deleted review for show '{show_name}'"
+            record_audit(
+                f"User {request.user.email} deleted review for show '{show_name}'",
+                'review_delete', user_id=request.user.user_id, entity_type='show', entity_id=review.show_id_id
             )
             response = JsonResponse({
                 'success': True,
@@ -37,6 +37,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'api.metrics.RequestMetricsMiddleware',  # first, so it times the whole stack
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -71,11 +72,113 @@ WSGI_APPLICATION = 'databases_proj.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.0/ref/settings/#databases
 
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+# DB_ENGINE selects the backend: 'sqlite' (default) or 'postgres'
+DB_ENGINE = config('DB_ENGINE', default='sqlite')
+
+SQLITE_PATH = config('SQLITE_PATH', default=str(BASE_DIR / 'db.sqlite3'))
+
+if DB_ENGINE == 'postgres':
+    POSTGRES_POOL = config('POSTGRES_POOL', default=False, cast=bool)
+    POSTGRES = {
+        'ENGINE': 'django.db.backends.postgresql',
+        'NAME': config('POSTGRES_DB', default='movies'),
+        'USER': config('POSTGRES_USER', default='postgres'),
+        'PASSWORD': config('POSTGRES_PASSWORD', default=''),
+        'HOST': config('POSTGRES_HOST', default='localhost'),
+        'PORT': config('POSTGRES_PORT', default=5432, cast=int),
+        # Persistent connections; Django's pool replaces them when POSTGRES_POOL is on.
+        # Use the pool under ASGI, where persistent connections aren't reused across requests.
+        'CONN_MAX_AGE': 0 if POSTGRES_POOL else config('POSTGRES_CONN_MAX_AGE', default=60, cast=int),
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {},
     }
+    if POSTGRES_POOL:
+        # psycopg_pool, per process: min_size connections stay open, requests wait up to timeout
+        POSTGRES['OPTIONS']['pool'] = {
+            'min_size': config('POSTGRES_POOL_MIN_SIZE', default=2, cast=int),
+            'max_size': config('POSTGRES_POOL_MAX_SIZE', default=10, cast=int),
+            'timeout': config('POSTGRES_POOL_TIMEOUT', default=10, cast=int),
+        }
+
+    DATABASES = {
+        'default': POSTGRES,
+        # Same database (or a streaming replica via POSTGRES_READ_HOST) in read-only
+        # transactions, for GET catalog views (api/routers.py)
+        'readonly': {
+            **POSTGRES,
+            'HOST': config('POSTGRES_READ_HOST', default=POSTGRES['HOST']),
+            'OPTIONS': {**POSTGRES['OPTIONS'], 'options': '-c default_transaction_read_only=on'},
+            'TEST': {'MIRROR': 'default'},
+        },
+        # No separate audit database: row-level locking already keeps audit inserts
+        # from blocking other writers, so the audit route falls back to 'default'
+    }
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': SQLITE_PATH,
+            'OPTIONS': {
+                # Take the write lock at BEGIN so concurrent writers wait on busy_timeout
+                # instead of failing with "database is locked" when upgrading a read lock
+                'transaction_mode': config('SQLITE_TRANSACTION_MODE', default='IMMEDIATE'),
+            },
+        },
+        # Read-only view of the default database for GET catalog views (api/routers.py).
+        # SQLITE_READ_PATH can point it at a replica file instead.
+        'readonly': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': Path(config('SQLITE_READ_PATH', default=SQLITE_PATH)).resolve().as_uri() + '?mode=ro',
+            'OPTIONS': {
+                # BEGIN IMMEDIATE would need a write lock
+                'transaction_mode': 'DEFERRED',
+            },
+            'TEST': {'MIRROR': 'default'},
+        },
+        # Audit log in its own file: the per-request audit writes take this file's write
+        # lock, not the one reviews, watch lists and catalog imports compete for
+        'audit': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': config('SQLITE_AUDIT_PATH', default=str(BASE_DIR / 'audit.sqlite3')),
+            'OPTIONS': {
+                'transaction_mode': config('SQLITE_AUDIT_TRANSACTION_MODE', default='IMMEDIATE'),
+            },
+        },
+    }
+
+# Model label -> database alias, see api/routers.py. The catalog stays on 'default'
+# with the user-activity tables: ratings, watch lists and rating aggregates are joined
+# with and cascade from it, which Django can't do across databases.
+DATABASE_ROUTERS = ['api.routers.ModelDatabaseRouter']
+DATABASE_ROUTES = {
+    'api.auditlog': 'audit',
+}
+# Alias @read_only_db views read through; empty to read from 'default'
+READ_ONLY_DATABASE = config('READ_ONLY_DATABASE', default='readonly')
+
+# SQLite connection profile, applied to every new connection by api/db_tuning.py.
+# Each value can be overridden from the environment; SQLITE_TUNING=False skips them all.
+SQLITE_TUNING = config('SQLITE_TUNING', default=True, cast=bool)
+SQLITE_PRAGMAS = {
+    'journal_mode': config('SQLITE_JOURNAL_MODE', default='WAL'),  # readers don't block on writers
+    'synchronous': config('SQLITE_SYNCHRONOUS', default='NORMAL'),  # fsync at checkpoints, safe with WAL
+    'cache_size': config('SQLITE_CACHE_SIZE', default=-65536, cast=int),  # negative = KiB, i.e. 64 MB
+    'mmap_size': config('SQLITE_MMAP_SIZE', default=268435456, cast=int),  # 256 MB
+    'temp_store': config('SQLITE_TEMP_STORE', default='MEMORY'),
+    'busy_timeout': config('SQLITE_BUSY_TIMEOUT', default=5000, cast=int),  # ms
+}
+# Per-alias overrides of SQLITE_PRAGMAS
+SQLITE_ALIAS_PRAGMAS = {
+    # Append-only and read back in small pages: no need for the large cache/mmap
+    'audit': {
+        'cache_size': config('SQLITE_AUDIT_CACHE_SIZE', default=-8192, cast=int),  # 8 MB
+        'mmap_size': config('SQLITE_AUDIT_MMAP_SIZE', default=0, cast=int),
+    },
+    # Opened with mode=ro: can't switch journal mode, and refuses writes outright
+    'readonly': {
+        'journal_mode': None,
+        'query_only': 1,
+    },
 }
 
 
@@ -169,3 +272,41 @@ CSRF_COOKIE_SAMESITE = 'Lax'
 CSRF_COOKIE_HTTPONLY = False
 CSRF_TRUSTED_ORIGINS = ['http://localhost:3000', 'http://127.0.0.1:3000']
 
+
+# Serve the catalog and library GET endpoints with the async views in
+# api/async_views.py; turn on when running under ASGI (databases_proj.asgi)
+ASYNC_VIEWS = config('ASYNC_VIEWS', default=False, cast=bool)
+
+
+# Request metrics (see api/metrics.py), exposed at GET /api/metrics/. Requests
+# slower than METRICS_SLOW_REQUEST_MS are logged to 'api.metrics' with their SQL.
+METRICS_ENABLED = config('METRICS_ENABLED', default=True, cast=bool)
+METRICS_SLOW_REQUEST_MS = config('METRICS_SLOW_REQUEST_MS', default=500, cast=int)
+METRICS_SLOW_SQL_LIMIT = 20  # statements kept per request for the slow-request log
+
+
+# Cache for the genres, show genres and actors endpoints (see api/catalog_cache.py),
+# keyed by the catalog version the import scripts bump. Name a CACHES alias in
+# CATALOG_CACHE_BACKEND to share entries between worker processes.
+CATALOG_CACHE_ENABLED = config('CATALOG_CACHE_ENABLED', default=True, cast=bool)
+CATALOG_CACHE_SIZE = 64  # entries in each process's LRU
+CATALOG_CACHE_BACKEND = config('CATALOG_CACHE_BACKEND', default=None)
+
+
+# Audit log writer (see api/audit.py): entries are queued and bulk-written by a
+# background thread; set AUDIT_LOG_ASYNC=False to write them on the request path
+AUDIT_LOG_ASYNC = config('AUDIT_LOG_ASYNC', default=True, cast=bool)
+AUDIT_LOG_BATCH_SIZE = 100
+AUDIT_LOG_FLUSH_INTERVAL = 0.5  # seconds
+AUDIT_LOG_QUEUE_SIZE = 10000
+AUDIT_LOG_PUT_TIMEOUT = 1.0  # seconds a request waits for queue space before writing itself
+
+# Live tail (GET /api/audit-logs/stream/, Server-Sent Events)
+AUDIT_LOG_STREAM_BUFFER = 1000  # recent entries kept in memory for subscribers
+AUDIT_LOG_STREAM_HEARTBEAT = 15  # seconds idle before checking the table / sending a keepalive
+AUDIT_LOG_STREAM_MAX_SECONDS = 300  # streams are closed after this; EventSource reconnects
+
+# Audit log retention (see api/audit_archive.py): `manage.py archive_audit_log` moves
+# rows older than this into compressed monthly segments that audit-logs still reads
+AUDIT_LOG_RETENTION_DAYS = config('AUDIT_LOG_RETENTION_DAYS', default=90, cast=int)
+AUDIT_LOG_ARCHIVE_DIR = BASE_DIR / 'data' / 'audit_archive'
@@ -2,6 +2,14 @@
 """
 Fix data separation - ensures movies come from letterboxd_movies_dataset.csv
 and shows come from tv_only.csv only.
+
+For a database where show rows were imported as films (or the reverse): deletes
+all film cast rows, all Acted_in credits, every film and every show, then runs
+import_all_csv.main(), which picks each CSV's table from its file name (then its
+columns). Every rating, watch list entry and rating aggregate goes with the
+deleted titles. When the tables are already separated correctly,
+python import_all_csv.py --reload rebuilds both catalogs while keeping title ids
+and user data.
 """
 import os
 import sys
@@ -12,6 +20,8 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'databases_proj.settings')
 django.setup()
 
 from api.models import AllFilms, AllShows, Actors, ActedIn
+from api.actor_names import rebuild_actor_names
+from api.catalog_cache import bump_catalog_version
 
 def clear_data():
     """Clear all films and shows data"""
@@ -54,7 +64,11 @@ if __name__ == '__main__':
     
     try:
         clear_data()
-        reimport_correctly()
+        try:
+            reimport_correctly()
+        finally:
+            rebuild_actor_names()
+            bump_catalog_version()
         print("\n" + "=" * 60)
         print("Data separation fixed!")
         print("=" * 60)
@@ -3,13 +3,33 @@
 Import all CSV files from the data/csv folder.
 Detects file type and imports accordingly.
 
-Usage: python import_all_csv.py
+Usage: python import_all_csv.py [--bulk | --incremental | --reload] [--workers N]
+
+  --bulk       Parse each file fully, then insert it with bulk_create in a single
+               transaction (much faster for full reloads)
+  --incremental
+               Keep a content hash per CSV row: insert new titles, update changed
+               ones in place (keeping their ids, ratings and watch lists) and skip
+               unchanged ones. Progress is checkpointed so an interrupted run
+               resumes where it stopped
+  --reload     Rebuild the whole catalog in shadow tables while the API keeps
+               serving the old one, then swap it in with one short transaction.
+               Titles keep their ids; titles no longer in the files are removed
+  --workers N  Parse rows in N worker processes before writing
+               (0 = one per CPU); implies --bulk unless --incremental/--reload
 """
 import os
+import re
 import sys
 import csv
+import time
+import argparse
+import itertools
+import hashlib
+import json
 import django
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 
 # Setup Django
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'databases_proj.settings')
@@ -17,13 +37,29 @@ django.setup()
 
 from api.models import (
     MovieGenre, MovieDirector, MovieLanguage, AllFilms, Actors,
-    ShowGenre, ShowCertificate, AllShows, ActedIn, AuditLog
+    ShowGenre, ShowCertificate, AllShows, ActedIn, AuditLog,
+    ImportRowHash, ImportCheckpoint, parse_show_years
 )
+from django.core.management.color import no_style
+from django.db import connection, transaction
+from api.actor_names import rebuild_actor_names
+from api.catalog_cache import bump_catalog_version
 
 # Get the CSV folder path
 BASE_DIR = Path(__file__).resolve().parent
 CSV_FOLDER = BASE_DIR / 'data' / 'csv'
 
+# Rows per INSERT statement in bulk mode
+BULK_BATCH_SIZE = 1000
+
+# Rows handed to a parse worker at a time
+PARSE_CHUNK_SIZE = 2000
+
+# Records per transaction/checkpoint in incremental mode
+INCREMENTAL_CHUNK_SIZE = 1000
+
+DURATION_PATTERN = re.compile(r'(\d+)')
+
 def detect_delimiter(csv_file):
     """Detect CSV delimiter (comma or semicolon)"""
     with open(csv_file, 'r', encoding='utf-8') as f:
@@ -133,116 +169,204 @@ def import_genres(csv_file):
         print(f"  Failed to import: {e}")
         return 0
 
+def parse_year(value):
+    """Parse a year like "2019.0" or "(2019)"; None if it can't be read"""
+    if not value:
+        return None
+    try:
+        year_str = str(value).strip().replace('(', '').replace(')', '')
+        return int(float(year_str))
+    except (ValueError, OverflowError):
+        return None
+
+def parse_duration(value):
+    """Extract minutes from strings like "30 min" or "133.0"; None if there's no number"""
+    if not value:
+        return None
+    duration_match = DURATION_PATTERN.search(str(value))
+    return int(duration_match.group(1)) if duration_match else None
+
+def parse_actor_list(actors_str):
+    """Unpack the list format used by the CSVs, e.g. "['Name, ', 'Name']" """
+    if not actors_str:
+        return []
+    # Remove brackets and quotes, then split by comma
+    actors_str = str(actors_str).strip()
+    actors_str = actors_str.replace('[', '').replace(']', '').replace("'", '').replace('"', '')
+    actors_list = [a.strip().rstrip(',') for a in actors_str.split(',') if a.strip()]
+    return [actor_name for actor_name in actors_list if actor_name and len(actor_name) > 1]
+
+def first_name(value):
+    """First entry of a comma-separated list like "Thriller, Comedy" """
+    return value.split(',')[0].strip() if value else ''
+
+def parse_film_row(row):
+    """Normalize one films CSV row into a plain dict, or None if it has no title"""
+    film_name = (row.get('film_name') or row.get('title') or
+                row.get('name') or row.get('movie_name') or '').strip()
+    if not film_name:
+        return None
+    return {
+        'film_name': film_name,
+        'director': (row.get('director_name') or row.get('director') or '').strip(),
+        # Take first genre if comma-separated
+        'genre': first_name((row.get('genre_name') or row.get('genre') or
+                             row.get('primary_genre') or row.get('genres') or '').strip()),
+        'language': (row.get('language_name') or row.get('language') or '').strip(),
+        'year': parse_year(row.get('year')),
+        'duration': parse_duration(row.get('duration') or row.get('runtime')),
+        'actors': parse_actor_list(row.get('actors') or row.get('cast') or row.get('stars')),
+    }
+
+def parse_show_row(row):
+    """Normalize one shows CSV row into a plain dict, or None if it has no title"""
+    show_name = (row.get('show_name') or row.get('title') or
+               row.get('name') or '').strip()
+    if not show_name:
+        return None
+    
+    rating = None
+    if row.get('rating'):
+        try:
+            rating = float(row['rating'])
+        except ValueError:
+            pass
+    
+    # Parse year for years field
+    year = parse_year(row.get('year'))
+    years = (row.get('years') or '').strip()
+    if not years and year:
+        years = str(year)
+    start_year, end_year = parse_show_years(years)
+    
+    return {
+        'show_name': show_name,
+        'cert': (row.get('cert_rating') or row.get('certificate') or '').strip(),
+        # Take first genre if comma-separated
+        'genre': first_name((row.get('genre_name') or row.get('genre') or '').strip()),
+        'duration': parse_duration(row.get('duration')),
+        'rating': rating,
+        'years': years,
+        'start_year': start_year,
+        'end_year': end_year,
+        'actors': parse_actor_list(row.get('actors') or row.get('stars')),
+    }
+
+def parse_chunk(parse_row, first_row_num, rows):
+    """Parse a list of CSV rows; returns (records, error messages).
+
+    Module-level so it can run in a worker process.
+    """
+    records = []
+    error_messages = []
+    for row_num, row in enumerate(rows, start=first_row_num):
+        try:
+            record = parse_row(row)
+        except Exception as e:
+            error_messages.append(f"Error on row {row_num}: {e}")
+            continue
+        if record:
+            records.append(record)
+    return records, error_messages
+
+def read_chunks(csv_file):
+    """Yield (first row number, rows) chunks of PARSE_CHUNK_SIZE rows from a CSV file"""
+    delimiter = detect_delimiter(csv_file)
+    with open(csv_file, 'r', encoding='utf-8') as f:
+        reader = csv.DictReader(f, delimiter=delimiter)
+        first_row_num = 2
+        while True:
+            rows = list(itertools.islice(reader, PARSE_CHUNK_SIZE))
+            if not rows:
+                return
+            yield first_row_num, rows
+            first_row_num += len(rows)
+
+def read_records(csv_file, parse_row, workers=1):
+    """Parse every row of a CSV file, returning (records, error count).
+
+    With workers > 1 the chunks are parsed in a process pool; records keep file order.
+    """
+    chunks = read_chunks(csv_file)
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(parse_chunk, parse_row, first_row_num, rows)
+                       for first_row_num, rows in chunks]
+            results = [future.result() for future in futures]
+    else:
+        results = (parse_chunk(parse_row, first_row_num, rows) for first_row_num, rows in chunks)
+    
+    records = []
+    errors = 0
+    for chunk_records, error_messages in results:
+        records += chunk_records
+        errors += len(error_messages)
+        for message in error_messages:
+            print(f"  {message}")
+    return records, errors
+
 def import_films(csv_file):
     """Import films from CSV"""
     print(f"\nImporting films from: {csv_file.name}")
-    from api.models import AuditLog
     AuditLog.objects.create(
         changes_to_data=f"Data import started: Importing films from {csv_file.name}"
     )
     count = 0
     errors = 0
     
-    delimiter = detect_delimiter(csv_file)
-    
     try:
-        with open(csv_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f, delimiter=delimiter)
-            for row_num, row in enumerate(reader, start=2):
-                try:
-                    film_name = (row.get('film_name') or row.get('title') or 
-                                row.get('name') or row.get('movie_name') or '').strip()
-                    if not film_name:
-                        continue
-                    
-                    # Get or create director
-                    director = None
-                    director_name = (row.get('director_name') or row.get('director') or '').strip()
-                    if director_name:
-                        director, _ = MovieDirector.objects.get_or_create(
-                            director_name=director_name
-                        )
-                    
-                    # Get or create genre - handle comma-separated genres
-                    genre = None
-                    genre_name = (row.get('genre_name') or row.get('genre') or 
-                                 row.get('primary_genre') or row.get('genres') or '').strip()
-                    if genre_name:
-                        # Take first genre if comma-separated
-                        first_genre = genre_name.split(',')[0].strip()
-                        genre, _ = MovieGenre.objects.get_or_create(
-                            genre_name=first_genre
-                        )
+        records, errors = read_records(csv_file, parse_film_row)
+        for record in records:
+            try:
+                film_name = record['film_name']
+                
+                # Get or create director, genre and language
+                director = None
+                if record['director']:
+                    director, _ = MovieDirector.objects.get_or_create(
+                        director_name=record['director']
+                    )
+                genre = None
+                if record['genre']:
+                    genre, _ = MovieGenre.objects.get_or_create(
+                        genre_name=record['genre']
+                    )
+                language = None
+                if record['language']:
+                    language, _ = MovieLanguage.objects.get_or_create(
+                        language_name=record['language']
+                    )
+                
+                # Create film
+                film, created = AllFilms.objects.get_or_create(
+                    film_name=film_name,
+                    defaults={
+                        'director_id': director,
+                        'year': record['year'],
+                        'duration': record['duration'],
+                        'genre_id': genre,
+                        'language_id': language
+                    }
+                )
+                
+                if created:
+                    count += 1
+                    if count % 100 == 0:
+                        print(f"  ... {count} films imported so far")
                     
-                    # Get or create language
-                    language = None
-                    language_name = (row.get('language_name') or row.get('language') or '').strip()
-                    if language_name:
-                        language, _ = MovieLanguage.objects.get_or_create(
-                            language_name=language_name
+                    # Add actors if provided
+                    for actor_name in record['actors']:
+                        Actors.objects.get_or_create(
+                            actor_name=actor_name,
+                            film_id=film
                         )
+                else:
+                    if count < 10:  # Only show first few duplicates
+                        print(f"  Already exists: {film_name}")
                     
-                    # Parse year - handle float years like "2019.0"
-                    year = None
-                    if row.get('year'):
-                        try:
-                            year_str = str(row['year']).strip().replace('(', '').replace(')', '')
-                            year = int(float(year_str))
-                        except:
-                            pass
-                    
-                    # Parse duration - handle "30 min" format
-                    duration = None
-                    duration_str = row.get('duration') or row.get('runtime') or ''
-                    if duration_str:
-                        try:
-                            # Extract number from strings like "30 min" or "133.0"
-                            import re
-                            duration_match = re.search(r'(\d+)', str(duration_str))
-                            if duration_match:
-                                duration = int(duration_match.group(1))
-                        except:
-                            pass
-                    
-                    # Create film
-                    film, created = AllFilms.objects.get_or_create(
-                        film_name=film_name,
-                        defaults={
-                            'director_id': director,
-                            'year': year,
-                            'duration': duration,
-                            'genre_id': genre,
-                            'language_id': language
-                        }
-                    )
-                    
-                    if created:
-                        count += 1
-                        if count % 100 == 0:
-                            print(f"  ... {count} films imported so far")
-                        
-                        # Add actors if provided - handle list format like "['Name, ', 'Name, ']"
-                        actors_str = row.get('actors') or row.get('cast') or row.get('stars') or ''
-                        if actors_str:
-                            # Clean up list format
-                            actors_str = str(actors_str).strip()
-                            # Remove brackets and quotes
-                            actors_str = actors_str.replace('[', '').replace(']', '').replace("'", '').replace('"', '')
-                            # Split by comma
-                            actors_list = [a.strip().rstrip(',') for a in actors_str.split(',') if a.strip()]
-                            for actor_name in actors_list:
-                                if actor_name and len(actor_name) > 1:
-                                    Actors.objects.get_or_create(
-                                        actor_name=actor_name,
-                                        film_id=film
-                                    )
-                    else:
-                        if count < 10:  # Only show first few duplicates
-                            print(f"  Already exists: {film_name}")
-                        
-                except Exception as e:
-                    errors += 1
-                    print(f"  Error on row {row_num}: {e}")
+            except Exception as e:
+                errors += 1
+                print(f"  Error importing '{record['film_name']}': {e}")
         
         print(f"  Imported {count} films ({errors} errors)")
         if count > 0:
@@ -268,110 +392,60 @@ def import_shows(csv_file):
     count = 0
     errors = 0
     
-    delimiter = detect_delimiter(csv_file)
-    
     try:
-        with open(csv_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f, delimiter=delimiter)
-            for row_num, row in enumerate(reader, start=2):
-                try:
-                    show_name = (row.get('show_name') or row.get('title') or 
-                               row.get('name') or '').strip()
-                    if not show_name:
-                        continue
-                    
-                    # Get or create certificate
-                    cert = None
-                    cert_rating = (row.get('cert_rating') or row.get('certificate') or '').strip()
-                    if cert_rating:
-                        cert, _ = ShowCertificate.objects.get_or_create(
-                            cert_rating=cert_rating
-                        )
+        records, errors = read_records(csv_file, parse_show_row)
+        for record in records:
+            try:
+                show_name = record['show_name']
+                
+                # Get or create certificate and genre
+                cert = None
+                if record['cert']:
+                    cert, _ = ShowCertificate.objects.get_or_create(
+                        cert_rating=record['cert']
+                    )
+                genre = None
+                if record['genre']:
+                    genre, _ = ShowGenre.objects.get_or_create(
+                        genre_name=record['genre']
+                    )
+                
+                # Create show
+                show, created = AllShows.objects.get_or_create(
+                    show_name=show_name,
+                    defaults={
+                        'duration': record['duration'],
+                        'cert_id': cert,
+                        'rating': record['rating'],
+                        'genre_id': genre,
+                        'years': record['years'],
+                        'start_year': record['start_year'],
+                        'end_year': record['end_year']
+                    }
+                )
+                
+                if created:
+                    count += 1
+                    if count % 100 == 0:
+                        print(f"  ... {count} shows imported so far")
                     
-                    # Get or create genre - handle comma-separated
-                    genre = None
-                    genre_name = (row.get('genre_name') or row.get('genre') or '').strip()
-                    if genre_name:
-                        # Take first genre if comma-separated
-                        first_genre = genre_name.split(',')[0].strip()
-                        genre, _ = ShowGenre.objects.get_or_create(
-                            genre_name=first_genre
+                    # Add actors if provided
+                    for actor_name in record['actors']:
+                        # Get or create actor
+                        actor, _ = Actors.objects.get_or_create(actor_name=actor_name)
+                        # Link to show via ActedIn
+                        ActedIn.objects.get_or_create(
+                            show_id=show,
+                            actor_id=actor,
+                            defaults={'actor_name': actor_name}
                         )
+                else:
+                    if count < 10:
+                        print(f"  Already exists: {show_name}")
                     
-                    # Parse duration - handle "30 min" format
-                    duration = None
-                    duration_str = row.get('duration') or ''
-                    if duration_str:
-                        try:
-                            import re
-                            duration_match = re.search(r'(\d+)', str(duration_str))
-                            if duration_match:
-                                duration = int(duration_match.group(1))
-                        except:
-                            pass
-                    
-                    # Parse rating
-                    rating = None
-                    if row.get('rating'):
-                        try:
-                            rating = float(row['rating'])
-                        except:
-                            pass
-                    
-                    # Parse year for years field
-                    year = None
-                    if row.get('year'):
-                        try:
-                            year_str = str(row['year']).strip().replace('(', '').replace(')', '')
-                            year = int(float(year_str))
-                        except:
-                            pass
-                    
-                    years = row.get('years', '').strip()
-                    if not years and year:
-                        years = str(year)
-                    
-                    # Create show
-                    show, created = AllShows.objects.get_or_create(
-                        show_name=show_name,
-                        defaults={
-                            'duration': duration,
-                            'cert_id': cert,
-                            'rating': rating,
-                            'genre_id': genre,
-                            'years': years
-                        }
-                    )
-                    
-                    if created:
-                        count += 1
-                        if count % 100 == 0:
-                            print(f"  ... {count} shows imported so far")
-                        
-                        # Add actors if provided
-                        actors_str = row.get('actors') or row.get('stars') or ''
-                        if actors_str:
-                            # Clean up list format
-                            actors_str = str(actors_str).strip()
-                            actors_str = actors_str.replace('[', '').replace(']', '').replace("'", '').replace('"', '')
-                            actors_list = [a.strip().rstrip(',') for a in actors_str.split(',') if a.strip()]
-                            for actor_name in actors_list:
-                                if actor_name and len(actor_name) > 1:
-                                    # Get or create actor
-                                    actor, _ = Actors.objects.get_or_create(actor_name=actor_name)
-                                    # Link to show via ActedIn
-                                    ActedIn.objects.get_or_create(
-                                        show_id=show,
-                                        actor_id=actor,
-                                        defaults={'actor_name': actor_name}
-                                    )
-                    else:
-                        if count < 10:
-                            print(f"  Already exists: {show_name}")
-                        
-                except Exception as e:
-                    errors += 1
-                    print(f"  Error on row {row_num}: {e}")
+            except Exception as e:
+                errors += 1
+                print(f"  Error importing '{record['show_name']}': {e}")
         
         print(f"  Imported {count} shows ({errors} errors)")
         if count > 0:
@@ -388,10 +462,546 @@ def import_shows(csv_file):
         traceback.print_exc()
         return 0
 
-def main():
+# ==================== BULK IMPORT ====================
+# Resolves dimension tables through in-memory name -> id maps and inserts with
+# bulk_create inside one transaction per file, instead of several get_or_create
+# round-trips per row. Same results as the per-row importer: rows whose title is
+# already in the database (or earlier in the file) are skipped.
+
+def resolve_names(model, name_field, id_field, names):
+    """Return a name -> id map for ``names``, bulk-creating the ones that don't exist yet"""
+    names = {name for name in names if name}
+    name_map = {}
+    for name, pk in model.objects.values_list(name_field, id_field).order_by(f'-{id_field}'):
+        name_map[name] = pk  # lowest id wins, like get_or_create's first match
+    missing = [model(**{name_field: name}) for name in sorted(names - name_map.keys())]
+    if missing:
+        model.objects.bulk_create(missing, batch_size=BULK_BATCH_SIZE)
+        name_map.update(model.objects.filter(
+            **{f'{name_field}__in': [getattr(obj, name_field) for obj in missing]}
+        ).values_list(name_field, id_field))
+    return name_map
+
+def new_records(records, model, name_field, key):
+    """Drop records whose title already exists in the table or earlier in the file"""
+    seen = set(model.objects.values_list(name_field, flat=True))
+    fresh = []
+    for record in records:
+        if record[key] not in seen:
+            seen.add(record[key])
+            fresh.append(record)
+    return fresh
+
+def report_rate(label, count, started):
+    elapsed = time.perf_counter() - started
+    rate = count / elapsed if elapsed > 0 else 0
+    print(f"  Imported {count} {label} in {elapsed:.2f}s ({rate:,.0f} rows/sec)")
+
+def bulk_write_films(records):
+    """Insert parsed film records in bulk; returns the number of films created"""
+    records = new_records(records, AllFilms, 'film_name', 'film_name')
+    with transaction.atomic():
+        directors = resolve_names(MovieDirector, 'director_name', 'director_id', (r['director'] for r in records))
+        genres = resolve_names(MovieGenre, 'genre_name', 'genre_id', (r['genre'] for r in records))
+        languages = resolve_names(MovieLanguage, 'language_name', 'language_id', (r['language'] for r in records))
+        
+        films = AllFilms.objects.bulk_create([
+            AllFilms(
+                film_name=r['film_name'],
+                director_id_id=directors.get(r['director']),
+                year=r['year'],
+                duration=r['duration'],
+                genre_id_id=genres.get(r['genre']),
+                language_id_id=languages.get(r['language']),
+            )
+            for r in records
+        ], batch_size=BULK_BATCH_SIZE)
+        
+        Actors.objects.bulk_create([
+            Actors(actor_name=actor_name, film_id_id=film.film_id)
+            for film, r in zip(films, records)
+            for actor_name in dict.fromkeys(r['actors'])
+        ], batch_size=BULK_BATCH_SIZE)
+    return len(films)
+
+def bulk_write_shows(records):
+    """Insert parsed show records in bulk; returns the number of shows created"""
+    records = new_records(records, AllShows, 'show_name', 'show_name')
+    with transaction.atomic():
+        certs = resolve_names(ShowCertificate, 'cert_rating', 'cert_id', (r['cert'] for r in records))
+        genres = resolve_names(ShowGenre, 'genre_name', 'genre_id', (r['genre'] for r in records))
+        actors = resolve_names(Actors, 'actor_name', 'actor_id', (a for r in records for a in r['actors']))
+        
+        shows = AllShows.objects.bulk_create([
+            AllShows(
+                show_name=r['show_name'],
+                duration=r['duration'],
+                cert_id_id=certs.get(r['cert']),
+                rating=r['rating'],
+                genre_id_id=genres.get(r['genre']),
+                years=r['years'],
+                start_year=r['start_year'],
+                end_year=r['end_year'],
+            )
+            for r in records
+        ], batch_size=BULK_BATCH_SIZE)
+        
+        ActedIn.objects.bulk_create([
+            ActedIn(show_id_id=show.show_id, actor_id_id=actors[actor_name], actor_name=actor_name)
+            for show, r in zip(shows, records)
+            for actor_name in dict.fromkeys(r['actors'])
+        ], batch_size=BULK_BATCH_SIZE, ignore_conflicts=True)
+    return len(shows)
+
+def bulk_import(csv_file, label, parse_row, write_records, workers=1):
+    """Parse a whole CSV file (in ``workers`` processes), then write it with one bulk transaction"""
+    print(f"\nBulk importing {label} from: {csv_file.name}")
+    AuditLog.objects.create(
+        changes_to_data=f"Data import started: Bulk importing {label} from {csv_file.name}"
+    )
+    started = time.perf_counter()
+    try:
+        records, errors = read_records(csv_file, parse_row, workers)
+        parsed = time.perf_counter()
+        count = write_records(records)
+    except Exception as e:
+        print(f"  Failed to import: {e}")
+        import traceback
+        traceback.print_exc()
+        AuditLog.objects.create(
+            changes_to_data=f"Data import failed: Error bulk importing {label} from {csv_file.name} - {str(e)}"
+        )
+        return 0
+    
+    report_rate(label, count, started)
+    print(f"  (parse {parsed - started:.2f}s, write {time.perf_counter() - parsed:.2f}s)")
+    if errors:
+        print(f"  ({errors} rows could not be parsed)")
+    if count > 0:
+        AuditLog.objects.create(
+            changes_to_data=f"Data import completed: Imported {count} {label} from {csv_file.name} ({errors} errors)"
+        )
+    return count
+
+def bulk_import_films(csv_file, workers=1):
+    """Import films from CSV in bulk"""
+    return bulk_import(csv_file, 'films', parse_film_row, bulk_write_films, workers)
+
+def bulk_import_shows(csv_file, workers=1):
+    """Import shows from CSV in bulk"""
+    return bulk_import(csv_file, 'shows', parse_show_row, bulk_write_shows, workers)
+
+# ==================== INCREMENTAL IMPORT ====================
+# Stores a content hash per source row (ImportRowHash) and, on re-run, inserts
+# new titles, updates changed ones in place and skips unchanged ones, so film
+# and show ids - and the ratings and watch lists that point at them - survive
+# a reload. Records are written in chunks, each in its own transaction together
+# with an ImportCheckpoint, so an interrupted import resumes after the last
+# committed chunk. Titles missing from the file are left untouched.
+
+def file_fingerprint(csv_file):
+    """SHA-256 of the file contents; a checkpoint only applies to the same file"""
+    digest = hashlib.sha256()
+    with open(csv_file, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def record_hash(record):
+    """Stable hash of a parsed record"""
+    payload = json.dumps(record, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def unique_records(records, key):
+    """Keep the first record for each title, as the other import modes do"""
+    seen = set()
+    unique = []
+    for record in records:
+        if record[key] not in seen:
+            seen.add(record[key])
+            unique.append(record)
+    return unique
+
+def film_values(record, directors, genres, languages):
+    return {
+        'director_id_id': directors.get(record['director']),
+        'year': record['year'],
+        'duration': record['duration'],
+        'genre_id_id': genres.get(record['genre']),
+        'language_id_id': languages.get(record['language']),
+    }
+
+def show_values(record, certs, genres):
+    return {
+        'duration': record['duration'],
+        'cert_id_id': certs.get(record['cert']),
+        'rating': record['rating'],
+        'genre_id_id': genres.get(record['genre']),
+        'years': record['years'],
+        'start_year': record['start_year'],
+        'end_year': record['end_year'],
+    }
+
+def sync_chunk(source, records, spec, stats):
+    """Insert/update/skip one chunk of records; must run inside a transaction"""
+    model, key = spec['model'], spec['key']
+    hashes = {r[key]: record_hash(r) for r in records}
+    stored = {
+        row.row_key: row
+        for row in ImportRowHash.objects.filter(source=source, row_key__in=list(hashes))
+    }
+    changed = [r for r in records if r[key] not in stored or stored[r[key]].row_hash != hashes[r[key]]]
+    stats['unchanged'] += len(records) - len(changed)
+    if not changed:
+        return
+
+    values_for = spec['prepare'](changed)
+    existing = dict(model.objects.filter(
+        **{f'{key}__in': [r[key] for r in changed]}
+    ).values_list(key, model._meta.pk.attname))
+
+    new = [r for r in changed if r[key] not in existing]
+    created = model.objects.bulk_create(
+        [model(**{key: r[key]}, **values_for(r)) for r in new],
+        batch_size=BULK_BATCH_SIZE
+    )
+    ids = dict(existing)
+    ids.update((r[key], obj.pk) for r, obj in zip(new, created))
+
+    updated = [r for r in changed if r[key] in existing]
+    if updated:
+        objects = [model(pk=existing[r[key]], **{key: r[key]}, **values_for(r)) for r in updated]
+        model.objects.bulk_update(objects, spec['fields'], batch_size=BULK_BATCH_SIZE)
+
+    spec['write_cast'](changed, ids, replace=[ids[r[key]] for r in updated])
+
+    ImportRowHash.objects.filter(source=source, row_key__in=[r[key] for r in changed]).delete()
+    ImportRowHash.objects.bulk_create([
+        ImportRowHash(source=source, row_key=r[key], row_hash=hashes[r[key]], object_id=ids[r[key]])
+        for r in changed
+    ], batch_size=BULK_BATCH_SIZE)
+    stats['inserted'] += len(new)
+    stats['updated'] += len(updated)
+
+def prepare_films(records):
+    directors = resolve_names(MovieDirector, 'director_name', 'director_id', (r['director'] for r in records))
+    genres = resolve_names(MovieGenre, 'genre_name', 'genre_id', (r['genre'] for r in records))
+    languages = resolve_names(MovieLanguage, 'language_name', 'language_id', (r['language'] for r in records))
+    return lambda record: film_values(record, directors, genres, languages)
+
+def write_film_cast(records, ids, replace):
+    # Show credits link to an Actors row by name (see resolve_names), which can be one
+    # of these film rows; deleting it would cascade to Acted_in, so keep such rows
+    # as film-less actor entries and delete only the rest
+    old_cast = Actors.objects.filter(film_id__in=replace)
+    old_cast.filter(actedin__isnull=False).update(film_id=None)
+    old_cast.filter(actedin__isnull=True).delete()
+    Actors.objects.bulk_create([
+        Actors(actor_name=actor_name, film_id_id=ids[r['film_name']])
+        for r in records
+        for actor_name in dict.fromkeys(r['actors'])
+    ], batch_size=BULK_BATCH_SIZE)
+
+def prepare_shows(records):
+    certs = resolve_names(ShowCertificate, 'cert_rating', 'cert_id', (r['cert'] for r in records))
+    genres = resolve_names(ShowGenre, 'genre_name', 'genre_id', (r['genre'] for r in records))
+    return lambda record: show_values(record, certs, genres)
+
+def write_show_cast(records, ids, replace):
+    ActedIn.objects.filter(show_id__in=replace).delete()
+    actors = resolve_names(Actors, 'actor_name', 'actor_id', (a for r in records for a in r['actors']))
+    ActedIn.objects.bulk_create([
+        ActedIn(show_id_id=ids[r['show_name']], actor_id_id=actors[actor_name], actor_name=actor_name)
+        for r in records
+        for actor_name in dict.fromkeys(r['actors'])
+    ], batch_size=BULK_BATCH_SIZE, ignore_conflicts=True)
+
+INCREMENTAL_SPECS = {
+    'films': {
+        'model': AllFilms,
+        'key': 'film_name',
+        'parse_row': parse_film_row,
+        'fields': ['director_id', 'year', 'duration', 'genre_id', 'language_id'],
+        'prepare': prepare_films,
+        'write_cast': write_film_cast,
+    },
+    'shows': {
+        'model': AllShows,
+        'key': 'show_name',
+        'parse_row': parse_show_row,
+        'fields': ['duration', 'cert_id', 'rating', 'genre_id', 'years', 'start_year', 'end_year'],
+        'prepare': prepare_shows,
+        'write_cast': write_show_cast,
+    },
+}
+
+def incremental_import(csv_file, label, workers=1):
+    """Bring the database in line with one CSV file, touching only rows that changed"""
+    spec = INCREMENTAL_SPECS[label]
+    source = csv_file.name
+    print(f"\nIncrementally importing {label} from: {source}")
+    started = time.perf_counter()
+    stats = {'inserted': 0, 'updated': 0, 'unchanged': 0}
+    try:
+        fingerprint = file_fingerprint(csv_file)
+        records, errors = read_records(csv_file, spec['parse_row'], workers)
+        records = unique_records(records, spec['key'])
+
+        checkpoint = ImportCheckpoint.objects.filter(source=source, file_hash=fingerprint).first()
+        start = checkpoint.records_done if checkpoint else 0
+        if start:
+            print(f"  Resuming after {start} records from an interrupted run")
+
+        for offset in range(start, len(records), INCREMENTAL_CHUNK_SIZE):
+            chunk = records[offset:offset + INCREMENTAL_CHUNK_SIZE]
+            with transaction.atomic():
+                sync_chunk(source, chunk, spec, stats)
+                ImportCheckpoint.objects.update_or_create(
+                    source=source,
+                    defaults={'file_hash': fingerprint, 'records_done': offset + len(chunk)}
+                )
+        ImportCheckpoint.objects.filter(source=source).delete()
+    except Exception as e:
+        print(f"  Failed to import: {e}")
+        import traceback
+        traceback.print_exc()
+        AuditLog.objects.create(
+            changes_to_data=f"Data import failed: Error incrementally importing {label} from {source} - {str(e)}"
+        )
+        return 0
+
+    elapsed = time.perf_counter() - started
+    print(f"  {stats['inserted']} inserted, {stats['updated']} updated, "
+          f"{stats['unchanged']} unchanged in {elapsed:.2f}s ({errors} errors)")
+    if stats['inserted'] or stats['updated']:
+        AuditLog.objects.create(
+            changes_to_data=(
+                f"Data import completed: Incremental import of {label} from {source} - "
+                f"{stats['inserted']} inserted, {stats['updated']} updated, "
+                f"{stats['unchanged']} unchanged ({errors} errors)"
+            )
+        )
+    return stats['inserted']
+
+# ==================== SHADOW RELOAD ====================
+# Rebuilds the whole catalog (All_Films, All_shows, Actors, Acted_in) in shadow
+# tables while the live tables keep serving requests, then swaps the new
+# contents in with one short transaction. A film/show keeps its id when its
+# title is still in the files, so ratings, watch lists and searches that point at
+# it stay attached; titles that disappear are deleted through the ORM, which
+# cascades (or nulls) the user rows that referenced them. The swap only writes
+# rows that actually differ, so the write lock is held for the size of the change
+# rather than the whole import.
+
+SHADOW_SUFFIX = '__shadow'
+
+# Catalog models in dependency order (referenced tables first)
+SHADOW_MODELS = [AllFilms, AllShows, Actors, ActedIn]
+
+def shadow_table(model):
+    return model._meta.db_table + SHADOW_SUFFIX
+
+def create_shadow_tables(cursor):
+    """(Re)create empty shadow tables with the live tables' columns"""
+    qn = connection.ops.quote_name
+    for model in SHADOW_MODELS:
+        cursor.execute(f"DROP TABLE IF EXISTS {qn(shadow_table(model))}")
+        cursor.execute(
+            f"CREATE TABLE {qn(shadow_table(model))} AS SELECT * FROM {qn(model._meta.db_table)} WHERE 1 = 0"
+        )
+
+def drop_shadow_tables(cursor):
+    qn = connection.ops.quote_name
+    for model in SHADOW_MODELS:
+        cursor.execute(f"DROP TABLE IF EXISTS {qn(shadow_table(model))}")
+
+def fill_shadow_table(cursor, model, objects):
+    """Insert unsaved model instances (with their pk set) into the model's shadow table"""
+    qn = connection.ops.quote_name
+    fields = model._meta.concrete_fields
+    sql = (
+        f"INSERT INTO {qn(shadow_table(model))} ({', '.join(qn(f.column) for f in fields)}) "
+        f"VALUES ({', '.join(['%s'] * len(fields))})"
+    )
+    for start in range(0, len(objects), BULK_BATCH_SIZE):
+        with transaction.atomic():
+            cursor.executemany(sql, [
+                [f.get_db_prep_save(getattr(obj, f.attname), connection) for f in fields]
+                for obj in objects[start:start + BULK_BATCH_SIZE]
+            ])
+
+def existing_ids(model, name_field):
+    """title -> id for the live table (lowest id wins for duplicate titles)"""
+    pk = model._meta.pk.attname
+    return {name: obj_id for name, obj_id in model.objects.values_list(name_field, pk).order_by(f'-{pk}')}
+
+def assign_ids(records, key, current):
+    """Give each record its live id when its title exists, else a fresh one"""
+    next_id = max(current.values(), default=0) + 1
+    ids = {}
+    for record in records:
+        if record[key] in current:
+            ids[record[key]] = current[record[key]]
+        else:
+            ids[record[key]] = next_id
+            next_id += 1
+    return ids
+
+def build_shadow_catalog(cursor, film_records, show_records):
+    """Load parsed records into the shadow tables; returns shadow row counts"""
+    film_ids = assign_ids(film_records, 'film_name', existing_ids(AllFilms, 'film_name'))
+    show_ids = assign_ids(show_records, 'show_name', existing_ids(AllShows, 'show_name'))
+
+    # Dimension tables are only ever added to, so they are written live
+    directors = resolve_names(MovieDirector, 'director_name', 'director_id', (r['director'] for r in film_records))
+    film_genres = resolve_names(MovieGenre, 'genre_name', 'genre_id', (r['genre'] for r in film_records))
+    languages = resolve_names(MovieLanguage, 'language_name', 'language_id', (r['language'] for r in film_records))
+    certs = resolve_names(ShowCertificate, 'cert_rating', 'cert_id', (r['cert'] for r in show_records))
+    show_genres = resolve_names(ShowGenre, 'genre_name', 'genre_id', (r['genre'] for r in show_records))
+
+    films = [
+        AllFilms(film_id=film_ids[r['film_name']], film_name=r['film_name'],
+                 **film_values(r, directors, film_genres, languages))
+        for r in film_records
+    ]
+    shows = [
+        AllShows(show_id=show_ids[r['show_name']], show_name=r['show_name'],
+                 **show_values(r, certs, show_genres))
+        for r in show_records
+    ]
+
+    # Actors is rebuilt from scratch: one row per film credit, and shows link to
+    # the first actor row with a matching name (adding one if there is none)
+    actors = []
+    actor_ids = {}
+    for r in film_records:
+        for actor_name in dict.fromkeys(r['actors']):
+            actors.append(Actors(actor_id=len(actors) + 1, actor_name=actor_name,
+                                 film_id_id=film_ids[r['film_name']]))
+            actor_ids.setdefault(actor_name, len(actors))
+    acted_in = []
+    for r in show_records:
+        for actor_name in dict.fromkeys(r['actors']):
+            if actor_name not in actor_ids:
+                actors.append(Actors(actor_id=len(actors) + 1, actor_name=actor_name))
+                actor_ids[actor_name] = len(actors)
+            acted_in.append(ActedIn(id=len(acted_in) + 1, show_id_id=show_ids[r['show_name']],
+                                    actor_id_id=actor_ids[actor_name], actor_name=actor_name))
+
+    for model, objects in [(AllFilms, films), (AllShows, shows), (Actors, actors), (ActedIn, acted_in)]:
+        fill_shadow_table(cursor, model, objects)
+    return {'films': len(films), 'shows': len(shows), 'actors': len(actors), 'acted_in': len(acted_in)}
+
+def merge_shadow_table(cursor, model):
+    """Make the live table match its shadow by primary key: update differing rows, insert new ones"""
+    qn = connection.ops.quote_name
+    live, shadow = qn(model._meta.db_table), qn(shadow_table(model))
+    pk = qn(model._meta.pk.column)
+    columns = [qn(f.column) for f in model._meta.concrete_fields if not f.primary_key]
+    differs = 'IS NOT' if connection.vendor == 'sqlite' else 'IS DISTINCT FROM'
+
+    cursor.execute(
+        f"UPDATE {live} SET {', '.join(f'{c} = s.{c}' for c in columns)} "
+        f"FROM {shadow} AS s WHERE {live}.{pk} = s.{pk} "
+        f"AND ({' OR '.join(f'{live}.{c} {differs} s.{c}' for c in columns)})"
+    )
+    updated = cursor.rowcount
+    all_columns = ', '.join([pk] + columns)
+    cursor.execute(
+        f"INSERT INTO {live} ({all_columns}) SELECT {all_columns} FROM {shadow} "
+        f"WHERE {pk} NOT IN (SELECT {pk} FROM {live})"
+    )
+    return updated, cursor.rowcount
+
+def swap_in_shadow_catalog(cursor):
+    """Apply the shadow tables to the live catalog in one transaction"""
+    qn = connection.ops.quote_name
+    stats = {}
+    with transaction.atomic():
+        # Cast tables hold no user data and are replaced wholesale
+        for model in (ActedIn, Actors):
+            cursor.execute(f"DELETE FROM {qn(model._meta.db_table)}")
+
+        for label, model in (('films', AllFilms), ('shows', AllShows)):
+            pk = qn(model._meta.pk.column)
+            cursor.execute(
+                f"SELECT {pk} FROM {qn(model._meta.db_table)} "
+                f"WHERE {pk} NOT IN (SELECT {pk} FROM {qn(shadow_table(model))})"
+            )
+            removed = [row[0] for row in cursor.fetchall()]
+            # Through the ORM so ratings, watch lists and searches follow on_delete
+            model.objects.filter(pk__in=removed).delete()
+            updated, inserted = merge_shadow_table(cursor, model)
+            stats[label] = {'inserted': inserted, 'updated': updated, 'removed': len(removed)}
+
+        for model in (Actors, ActedIn):
+            merge_shadow_table(cursor, model)
+
+        # Rows went in with explicit ids (cast ids renumbered from 1): move the
+        # sequences past them so the next ORM insert doesn't reuse one (PostgreSQL)
+        for sql in connection.ops.sequence_reset_sql(no_style(), [AllFilms, AllShows, Actors, ActedIn]):
+            cursor.execute(sql)
+    return stats
+
+def shadow_reload(film_files, show_files, workers=1):
+    """Rebuild the catalog from the given files in shadow tables and swap it in"""
+    print(f"\nReloading catalog through shadow tables")
+    AuditLog.objects.create(
+        changes_to_data="Data import started: Shadow reload of films and shows"
+    )
+    started = time.perf_counter()
+    try:
+        film_records, show_records, errors = [], [], 0
+        for csv_file in film_files:
+            records, file_errors = read_records(csv_file, parse_film_row, workers)
+            film_records += records
+            errors += file_errors
+        for csv_file in show_files:
+            records, file_errors = read_records(csv_file, parse_show_row, workers)
+            show_records += records
+            errors += file_errors
+        film_records = unique_records(film_records, 'film_name')
+        show_records = unique_records(show_records, 'show_name')
+
+        with connection.cursor() as cursor:
+            create_shadow_tables(cursor)
+            try:
+                counts = build_shadow_catalog(cursor, film_records, show_records)
+                built = time.perf_counter()
+                print(f"  Built shadow catalog in {built - started:.2f}s "
+                      f"({counts['films']} films, {counts['shows']} shows, {counts['actors']} actors)")
+                stats = swap_in_shadow_catalog(cursor)
+                swapped = time.perf_counter()
+            finally:
+                drop_shadow_tables(cursor)
+    except Exception as e:
+        print(f"  Failed to reload: {e}")
+        import traceback
+        traceback.print_exc()
+        AuditLog.objects.create(
+            changes_to_data=f"Data import failed: Shadow reload of films and shows - {str(e)}"
+        )
+        return {'films': 0, 'shows': 0}
+
+    print(f"  Swapped in {(swapped - built) * 1000:.0f} ms")
+    for label in ('films', 'shows'):
+        print(f"  {label}: {stats[label]['inserted']} inserted, {stats[label]['updated']} updated, "
+              f"{stats[label]['removed']} removed")
+    summary = ', '.join(
+        f"{label} {s['inserted']} inserted/{s['updated']} updated/{s['removed']} removed"
+        for label, s in stats.items()
+    )
+    AuditLog.objects.create(
+        changes_to_data=f"Data import completed: Shadow reload - {summary} ({errors} errors)"
+    )
+    return {label: s['inserted'] for label, s in stats.items()}
+
+def main(bulk=False, workers=1, incremental=False, reload=False):
     """Main function to import all CSV files"""
+    mode = (" (shadow reload)" if reload else " (incremental mode)" if incremental
+            else " (bulk mode)" if bulk else "")
     print("=" * 60)
-    print("CSV Auto-Import Tool")
+    print("CSV Auto-Import Tool" + mode)
     print("=" * 60)
     
     # Check if folder exists
@@ -426,6 +1036,9 @@ def main():
         'shows': 0
     }
     
+    # Catalog files collected for a shadow reload
+    reload_files = {'films': [], 'shows': []}
+    
     # Process each file
     for csv_file in csv_files:
         # Skip README if it's a CSV
@@ -438,10 +1051,29 @@ def main():
             total_imported['directors'] += import_directors(csv_file)
         elif file_type == 'genres':
             total_imported['genres'] += import_genres(csv_file)
+        elif reload and file_type in reload_files:
+            reload_files[file_type].append(csv_file)
+        elif incremental and file_type in INCREMENTAL_SPECS:
+            total_imported[file_type] += incremental_import(csv_file, file_type, workers)
         elif file_type == 'shows':
-            total_imported['shows'] += import_shows(csv_file)
+            if bulk:
+                total_imported['shows'] += bulk_import_shows(csv_file, workers)
+            else:
+                total_imported['shows'] += import_shows(csv_file)
         else:  # films (default)
-            total_imported['films'] += import_films(csv_file)
+            if bulk:
+                total_imported['films'] += bulk_import_films(csv_file, workers)
+            else:
+                total_imported['films'] += import_films(csv_file)
+    
+    if reload:
+        for label, count in shadow_reload(reload_files['films'], reload_files['shows'], workers).items():
+            total_imported[label] += count
+    
+    # Re-index actor names and serve genres and actors from the new catalog
+    # (see api/actor_names.py, api/catalog_cache.py)
+    rebuild_actor_names()
+    bump_catalog_version()
     
     # Summary
     print("\n" + "=" * 60)
@@ -462,9 +1094,31 @@ def main():
     else:
         print(f"\nNo new records imported (may already exist)")
 
+def parse_args():
+    parser = argparse.ArgumentParser(description='Import all CSV files from data/csv')
+    parser.add_argument('--bulk', action='store_true',
+                        help='insert each file with bulk_create in one transaction')
+    parser.add_argument('--incremental', action='store_true',
+                        help='insert new rows, update changed ones in place and skip unchanged ones; '
+                             'resumes an interrupted run')
+    parser.add_argument('--reload', action='store_true',
+                        help='rebuild the whole catalog in shadow tables and swap it in atomically')
+    parser.add_argument('--workers', type=int, default=None, metavar='N',
+                        help='parse rows in N processes (0 = one per CPU); implies --bulk '
+                             'unless --incremental or --reload is given')
+    args = parser.parse_args()
+    if args.workers is not None:
+        args.bulk = not (args.incremental or args.reload)
+        if args.workers <= 0:
+            args.workers = os.cpu_count() or 1
+    else:
+        args.workers = 1
+    return args
+
 if __name__ == '__main__':
+    args = parse_args()
     try:
-        main()
+        main(bulk=args.bulk, workers=args.workers, incremental=args.incremental, reload=args.reload)
     except KeyboardInterrupt:
         print("\n\nImport cancelled by user")
     except Exception as e:
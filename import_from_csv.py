@@ -19,6 +19,8 @@ django.setup()
 from api.models import (
     MovieGenre, MovieDirector, MovieLanguage, AllFilms, Actors
 )
+from api.actor_names import rebuild_actor_names
+from api.catalog_cache import bump_catalog_version
 
 def import_directors(csv_file):
     """Import directors from CSV"""
@@ -176,6 +178,9 @@ def main():
         print(f"Error: Unknown data type '{data_type}'")
         print("Valid types: directors, genres, films")
         sys.exit(1)
+    
+    rebuild_actor_names()
+    bump_catalog_version()
 
 if __name__ == '__main__':
     main()
@@ -15,6 +15,8 @@ from api.models import (
     MovieGenre, MovieDirector, MovieLanguage, AllFilms, Actors,
     ShowGenre, ShowCertificate, AllShows, ActedIn
 )
+from api.actor_names import rebuild_actor_names
+from api.catalog_cache import bump_catalog_version
 
 def create_sample_data():
     """Create sample movies and shows"""
@@ -124,6 +126,8 @@ def create_sample_data():
 if __name__ == '__main__':
     try:
         create_sample_data()
+        rebuild_actor_names()
+        bump_catalog_version()
     except Exception as e:
         print(f"Error: {e}")
         import traceback
@@ -13,6 +13,8 @@ django.setup()
 from api.models import (
     MovieGenre, MovieDirector, MovieLanguage, AllFilms, Actors
 )
+from api.actor_names import rebuild_actor_names
+from api.catalog_cache import bump_catalog_version
 
 def insert_movie_interactive():
     """Interactively insert a movie"""
@@ -99,6 +101,8 @@ def main():
         
         if choice == '1':
             insert_movie_interactive()
+            rebuild_actor_names()
+            bump_catalog_version()
         elif choice == '2':
             print(f"\nCurrent data:")
             print(f"  Films: {AllFilms.objects.count()}")
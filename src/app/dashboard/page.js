@@ -224,7 +224,8 @@ export default function DashboardPage() {
       year: "Newest first",
       year_old: "Oldest first",
       runtime: "Shortest runtime",
-      runtime_long: "Longest runtime"
+      runtime_long: "Longest runtime",
+      relevance: "Best match"
     };
     return labels[sortBy] || "Rating";
   }, [sortBy]);
@@ -430,6 +431,7 @@ export default function DashboardPage() {
                       <option value="year_old">Year (Oldest First)</option>
                       <option value="runtime">Runtime (Shortest First)</option>
                       <option value="runtime_long">Runtime (Longest First)</option>
+                      {titleSearch && <option value="relevance">Best Match (Title Search)</option>}
                     </select>
                   </div>
                 </div>
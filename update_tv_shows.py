@@ -2,6 +2,12 @@
 """
 Update TV shows data from tv_shows_only_multi_year.csv.
 Clears existing shows and re-imports from the new file.
+
+Deletes every show and its Acted_in credits - and with them all show ratings,
+watched/watch-later entries and show rating aggregates - then imports the file
+row by row with import_all_csv.import_shows(). Films are not touched. Shows get new
+ids, so links to them from outside the database break; to keep ids and user data,
+use python import_all_csv.py --incremental instead.
 """
 import os
 import sys
@@ -11,6 +17,8 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'databases_proj.settings')
 django.setup()
 
 from api.models import AllShows, ActedIn
+from api.actor_names import rebuild_actor_names
+from api.catalog_cache import bump_catalog_version
 
 def clear_shows():
     """Clear all shows data"""
@@ -58,7 +66,11 @@ if __name__ == '__main__':
     
     try:
         clear_shows()
-        success = reimport_shows()
+        try:
+            success = reimport_shows()
+        finally:
+            rebuild_actor_names()
+            bump_catalog_version()
         
         if success:
             from api.models import AllShows
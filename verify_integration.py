@@ -1,6 +1,6 @@
 #!/usr/bin/env python
 """
-Verification script to test SQLite integration with the website.
+Verification script to test the database integration with the website.
 Run this to verify all connections are working correctly.
 """
 import os
@@ -11,11 +11,34 @@ import django
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'databases_proj.settings')
 django.setup()
 
-from django.test import RequestFactory
-from django.db import connection
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.test import RequestFactory, override_settings
+from django.urls import resolve
+from django.db import connection, connections, router, transaction
+from django.db.models import Count, FloatField, Sum
+from django.db.models.functions import Cast
+from django.test.utils import CaptureQueriesContext
+from asgiref.sync import async_to_sync
+from api import async_views, views
 from api.views import testdb, genres, actors, movies
-from api.models import AllFilms, MovieGenre, Actors, MovieDirector
+from api.audit import flush_audit_log, record_audit
+from api.actor_names import credit_counts, normalize_actor_name, search_actor_names
+from api.catalog_cache import bump_catalog_version, catalog_version, local_cache
+from api.pagination import split_phases
+from api.search import apply_title_search
+from api.metrics import RequestMetricsMiddleware, request_metrics
+from api.query_budget import QueryBudgetExceeded, query_budget
+from api.routers import read_only_alias, route_for
+from api.models import (
+    ActorName, AllFilms, AllShows, MovieGenre, Actors, MovieDirector, User, AuditLog, WatchLaterMovie, WatchLaterShow,
+    MovieRating, MovieAverageRating, ShowUserRating, ShowAverageRating,
+)
 import json
+import re
+import time
+from contextlib import ExitStack
+from decimal import ROUND_HALF_UP, Decimal
 
 def print_section(title):
     print("\n" + "=" * 60)
@@ -27,6 +50,13 @@ def test_database():
     print_section("1. Database Connection Test")
     
     try:
+        if connection.vendor != 'sqlite':
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT 1')
+            tables = [name for name in connection.introspection.table_names() if not name.startswith('django_')]
+            print(f"Connected to {connection.vendor}, found {len(tables)} custom tables")
+            return True
+        
         with connection.cursor() as cursor:
             # Integrity check
             cursor.execute('PRAGMA integrity_check')
@@ -175,10 +205,635 @@ def test_filtering():
     
     return all(results.values())
 
+PAGE_SIZES = (5, 50, 500)
+
+def phases_read(limit):
+    """Sort phases a first rating-sorted page of ``limit`` movies reads (see api/pagination.py).
+
+    keyset_page() reads phases in order until it has limit + 1 rows.
+    """
+    queryset, sort_name, _, _ = views.movie_page_query({'sortBy': 'rating'})
+    phases = split_phases(views.MOVIE_SORTS[sort_name])
+    rows = 0
+    for read, (phase_filter, _) in enumerate(phases, 1):
+        rows += queryset.filter(phase_filter).count()
+        if rows > limit:
+            return read
+    return len(phases)
+
+def test_query_counts():
+    """Test that a movie page costs one query per sort phase it spans, whatever its size"""
+    print_section("5. Query Count Test")
+    
+    factory = RequestFactory()
+    passed = True
+    
+    try:
+        for limit in PAGE_SIZES:
+            request = factory.get(f'/api/movies?limit={limit}&sortBy=rating')
+            with CaptureQueriesContext(connections[read_only_alias() or 'default']) as ctx:
+                response = movies(request)
+            data = json.loads(response.content)
+            if response.status_code != 200 or not data.get('success'):
+                print(f"FAIL /api/movies?limit={limit} - Status: {response.status_code}")
+                return False
+            # A page spanning rated and unrated films reads each phase with its own
+            # LIMITed query, so the count can differ between page sizes - but never
+            # with the number of rows: phases read + one batch for the cast lists
+            spanned = phases_read(limit)
+            expected = spanned + (1 if data['movies'] else 0)
+            ok = len(ctx.captured_queries) == expected
+            passed = passed and ok
+            print(f"{'PASS' if ok else 'FAIL'} limit={limit}: {len(data['movies'])} movies, "
+                  f"{len(ctx.captured_queries)} queries (expected {expected}: {spanned} sort phase(s) + cast)")
+        return passed
+    except Exception as e:
+        print(f"FAIL Query count test: Error - {e}")
+        return False
+
+# Tables that must never be read in full to answer an API request
+PLAN_CHECKED_TABLES = ('All_Films', 'All_shows', 'Audit_log')
+
+SORT_MODES = ['rating', 'votes', 'year', 'year_old', 'runtime', 'runtime_long']
+
+def full_scans(sql, plan):
+    """Return the checked tables that a query plan reads in full.
+
+    A SCAN is only acceptable when it walks the table (or an index) in ORDER BY order
+    and a LIMIT stops it early - i.e. the query has a LIMIT and no full temp-b-tree sort.
+    """
+    needs_full_sort = any(detail == 'USE TEMP B-TREE FOR ORDER BY' for detail in plan)
+    bounded = re.search(r'\bLIMIT\b', sql) is not None
+    scanned = []
+    for detail in plan:
+        match = re.match(r'SCAN (\w+)', detail)
+        if match and match.group(1) in PLAN_CHECKED_TABLES and (needs_full_sort or not bounded):
+            scanned.append(match.group(1))
+    return scanned
+
+def test_query_plans():
+    """Test that no endpoint query does a full scan of the large tables"""
+    print_section("6. Query Plan Test")
+    
+    factory = RequestFactory()
+    cases = [('movies', f'sortBy={mode}') for mode in SORT_MODES]
+    cases += [('shows', f'sortBy={mode}') for mode in SORT_MODES]
+    cases += [
+        ('movies', 'genre=Action'),
+        ('movies', 'yearFrom=2008&yearTo=2010'),
+        ('movies', 'genre=Action&sortBy=year'),
+        ('shows', 'genre=Drama'),
+        ('shows', 'yearFrom=2008&yearTo=2010'),
+        ('genres', ''),
+        ('show_genres', ''),
+        ('actors', ''),
+        ('audit_logs', ''),
+        ('audit_logs', 'userId=1'),
+        ('audit_logs', 'action=signin'),
+        ('audit_logs', 'entityType=movie&entityId=1'),
+        ('audit_logs', 'since=2020-01-01&until=2030-01-01'),
+        ('movie_reviews', ''),
+        ('show_reviews', ''),
+        ('watch_later_movie', ''),
+        ('watch_later_show', ''),
+        ('favorites', ''),
+        ('user_top_rated', ''),
+        ('personalized_recommendations', ''),
+    ]
+    
+    if connection.vendor != 'sqlite':
+        print(f"SKIP Plan checks read SQLite's EXPLAIN QUERY PLAN output (database is {connection.vendor})")
+        return True
+    
+    passed = True
+    try:
+        with transaction.atomic():
+            # Library endpoints need a signed-in user; roll the user back afterwards
+            user = User.objects.create_user(email='plan-check@example.com', password='plan-check')
+            for view_name, params in cases:
+                request = factory.get(f'/api/{view_name}?{params}')
+                request.user = user
+                # Capture on every database: the audit log is routed to its own
+                captures = {alias: CaptureQueriesContext(connections[alias]) for alias in connections}
+                with ExitStack() as stack:
+                    for ctx in captures.values():
+                        stack.enter_context(ctx)
+                    getattr(views, view_name)(request)
+                
+                offending = set()
+                for alias, ctx in captures.items():
+                    for query in ctx.captured_queries:
+                        sql = query['sql']
+                        if not sql.lstrip().upper().startswith('SELECT'):
+                            continue
+                        with connections[alias].cursor() as cursor:
+                            cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+                            plan = [row[3] for row in cursor.fetchall()]
+                        offending.update(full_scans(sql, plan))
+                
+                label = f"{view_name}?{params}" if params else view_name
+                if offending:
+                    passed = False
+                    print(f"FAIL {label}: full scan of {', '.join(sorted(offending))}")
+                else:
+                    print(f"PASS {label}")
+            transaction.set_rollback(True)
+        return passed
+    except Exception as e:
+        print(f"FAIL Query plan test: Error - {e}")
+        return False
+
+def test_audit_writer():
+    """Test that audit entries are written in the background and only after commit"""
+    print_section("7. Audit Writer Test")
+    
+    marker = f"verify_integration audit check {time.time()}"
+    try:
+        with transaction.atomic():
+            record_audit(f"{marker} (rolled back)", 'other')
+            transaction.set_rollback(True)
+        record_audit(f"{marker} (committed)", 'review_create', user_id=1, entity_type='movie', entity_id=2)
+        
+        # The background thread should pick the entry up within a few flush intervals
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline and not AuditLog.objects.filter(changes_to_data__startswith=marker).exists():
+            time.sleep(0.05)
+        flush_audit_log()
+        written = set(AuditLog.objects.filter(changes_to_data__startswith=marker).values_list(
+            'changes_to_data', 'action', 'user_id', 'entity_type', 'entity_id'
+        ))
+        AuditLog.objects.filter(changes_to_data__startswith=marker).delete()
+        
+        passed = written == {(f"{marker} (committed)", 'review_create', 1, 'movie', 2)}
+        print(f"{'PASS' if passed else 'FAIL'} Committed entry written, rolled-back entry dropped ({len(written)} written)")
+        return passed
+    except Exception as e:
+        print(f"FAIL Audit writer test: Error - {e}")
+        return False
+
+def test_database_routing():
+    """Test that routed models live only on their own database"""
+    print_section("8. Database Routing Test")
+    
+    passed = True
+    try:
+        for model in (AuditLog, User):
+            alias = router.db_for_write(model)
+            expected = route_for(model._meta.app_label, model._meta.model_name)
+            # Mirrors (the read-only alias) open another database's file
+            present = [
+                name for name in connections
+                if not connections[name].settings_dict['TEST'].get('MIRROR')
+                and model._meta.db_table in connections[name].introspection.table_names()
+            ]
+            ok = alias == expected and present == [alias]
+            passed = passed and ok
+            print(f"{'PASS' if ok else 'FAIL'} {model.__name__}: routed to '{alias}', table on {present}")
+        
+        # GET catalog views read through the read-only alias when one is configured
+        reader = read_only_alias() or 'default'
+        with CaptureQueriesContext(connections['default']) as primary, CaptureQueriesContext(connections[reader]) as ctx:
+            movies(RequestFactory().get('/api/movies?limit=5'))
+        ok = len(ctx.captured_queries) > 0 and (reader == 'default' or len(primary.captured_queries) == 0)
+        passed = passed and ok
+        print(f"{'PASS' if ok else 'FAIL'} movies GET read from '{reader}' ({len(ctx.captured_queries)} queries)")
+        return passed
+    except Exception as e:
+        print(f"FAIL Database routing test: Error - {e}")
+        return False
+
+def test_async_views():
+    """Test that the async views return the same responses as the sync ones"""
+    print_section("9. Async Views Test")
+    
+    factory = RequestFactory()
+    cases = [
+        ('movies', 'limit=20&sortBy=year'),
+        ('shows', 'limit=20&genre=Drama'),
+        ('genres', ''),
+        ('show_genres', ''),
+        ('actors', ''),
+        ('movie_reviews', 'limit=20'),
+        ('show_reviews', 'limit=20'),
+    ]
+    passed = True
+    try:
+        for view_name, params in cases:
+            request = factory.get(f'/api/{view_name}?{params}')
+            request.user = AnonymousUser()
+            expected = getattr(views, view_name)(request)
+            actual = async_to_sync(getattr(async_views, view_name))(request)
+            ok = actual.status_code == expected.status_code and json.loads(actual.content) == json.loads(expected.content)
+            passed = passed and ok
+            label = f"{view_name}?{params}" if params else view_name
+            print(f"{'PASS' if ok else 'FAIL'} {label}")
+        return passed
+    except Exception as e:
+        print(f"FAIL Async views test: Error - {e}")
+        return False
+
+def test_request_metrics():
+    """Test that the metrics middleware records each request under its URL name"""
+    print_section("10. Request Metrics Test")
+    
+    factory = RequestFactory()
+    passed = True
+    try:
+        request_metrics.reset()
+        for path, view in (('/api/movies/', views.movies), ('/api/genres/', async_views.genres)):
+            request = factory.get(f'{path}?limit=20')
+            request.user = AnonymousUser()
+            request.resolver_match = resolve(path)
+            middleware = RequestMetricsMiddleware(view)
+            with CaptureQueriesContext(connections[read_only_alias() or 'default']) as ctx:
+                if view is async_views.genres:
+                    response = async_to_sync(middleware)(request)
+                else:
+                    response = middleware(request)
+            histograms = request_metrics.snapshot()[(request.resolver_match.url_name, 'GET')]
+            _, count, queries = histograms['api_request_queries']
+            _, _, size = histograms['api_response_bytes']
+            ok = count == 1 and queries == len(ctx.captured_queries) and size == len(response.content)
+            passed = passed and ok
+            print(f"{'PASS' if ok else 'FAIL'} {path}: {int(queries)} queries, {int(size)} bytes recorded")
+        
+        exposition = request_metrics.render()
+        ok = 'api_requests_total{route="movies",method="GET",status="200"} 1' in exposition
+        passed = passed and ok
+        print(f"{'PASS' if ok else 'FAIL'} Prometheus exposition lists the requests")
+        return passed
+    except Exception as e:
+        print(f"FAIL Request metrics test: Error - {e}")
+        return False
+
+# Most queries each view may run, by request and user state ('member' is signed in).
+# Views are called directly, so session and user lookups by the middleware aren't
+# counted. Catalog and review budgets hold at every page size, library budgets at
+# every library size. Writes include the SAVEPOINTs of nested atomic blocks; a
+# review POST is budgeted for a title nobody has rated yet.
+QUERY_BUDGETS = [
+    # (view, method, query string or URL kwargs, user, budget)
+    ('testdb', 'GET', '', 'anonymous', 4),
+    ('metrics', 'GET', '', 'anonymous', 0),
+    ('genres', 'GET', '', 'anonymous', 2),  # catalog version, then the names on a cache miss
+    ('show_genres', 'GET', '', 'anonymous', 2),
+    ('actors', 'GET', '', 'anonymous', 2),
+    ('actors', 'GET', 'q=a', 'anonymous', 1),
+    ('actors', 'GET', 'q=son&match=substring', 'anonymous', 1),
+    ('movies', 'GET', 'limit=20', 'anonymous', 4),
+    ('movies', 'GET', 'limit=500', 'anonymous', 4),
+    ('movies', 'GET', 'limit=100&sortBy=votes&genre=Drama&yearFrom=1990', 'anonymous', 4),
+    ('movies', 'GET', 'limit=100&titleSearch=love&sortBy=relevance', 'anonymous', 4),
+    ('shows', 'GET', 'limit=20', 'anonymous', 4),
+    ('shows', 'GET', 'limit=500', 'anonymous', 4),
+    ('shows', 'GET', 'limit=100&sortBy=year&maxRating=TV-PG', 'anonymous', 4),
+    ('audit_logs', 'GET', 'limit=100', 'anonymous', 4),
+    ('audit_logs', 'GET', 'limit=1000&action=review_create', 'anonymous', 4),
+    ('audit_log_stream', 'GET', '', 'anonymous', 1),
+    ('check_auth', 'GET', '', 'anonymous', 0),
+    ('signup', 'POST', {'email': 'budget-signup@example.com', 'password': 'budget-password'}, 'anonymous', 2),
+    ('signin', 'POST', {'email': 'budget-check@example.com', 'password': 'budget-password'}, 'anonymous', 5),
+    ('movie_reviews', 'GET', 'limit=20', 'anonymous', 1),
+    ('movie_reviews', 'GET', 'limit=100', 'anonymous', 1),
+    ('show_reviews', 'GET', 'limit=100', 'anonymous', 1),
+    ('check_auth', 'GET', '', 'member', 0),
+    ('watch_later_movie', 'GET', '', 'member', 1),
+    ('watch_later_show', 'GET', '', 'member', 1),
+    ('favorites', 'GET', '', 'member', 3),  # creates the row on the first visit
+    ('user_top_rated', 'GET', '', 'member', 2),
+    ('personalized_recommendations', 'GET', '', 'member', 2),
+    ('movie_reviews', 'GET', {'film_id': 'library'}, 'member', 1),
+    ('show_reviews', 'GET', {'show_id': 'library'}, 'member', 1),
+    ('watch_later_movie', 'POST', {'film_id': 'new'}, 'member', 4),
+    ('watch_later_movie', 'DELETE', {'film_id': 'new'}, 'member', 3),
+    ('watch_later_show', 'POST', {'show_id': 'new'}, 'member', 4),
+    ('watch_later_show', 'DELETE', {'show_id': 'new'}, 'member', 3),
+    ('favorites', 'POST', {'fav_decade': '1990s'}, 'member', 2),
+    ('movie_reviews', 'POST', {'film_id': 'new', 'rating': 4}, 'member', 14),
+    ('movie_reviews', 'PUT', {'film_id': 'new', 'rating': 5}, 'member', 5),
+    ('movie_reviews', 'DELETE', {'film_id': 'new'}, 'member', 6),
+    ('show_reviews', 'POST', {'show_id': 'new', 'rating': 4}, 'member', 14),
+    ('show_reviews', 'PUT', {'show_id': 'new', 'rating': 5}, 'member', 5),
+    ('show_reviews', 'DELETE', {'show_id': 'new'}, 'member', 6),
+    ('signout', 'POST', '', 'member', 0),
+]
+LIBRARY_SIZES = (2, 12)
+
+def budget_request(factory, view_name, method, params, user, titles):
+    """Build the request and URL kwargs for one QUERY_BUDGETS entry"""
+    query, body, kwargs = '', None, {}
+    if isinstance(params, str):
+        query = params
+    else:
+        body = dict(params)
+        for key in ('film_id', 'show_id'):
+            if key in body:
+                kwargs[key] = titles[key][body.pop(key)]
+    if method == 'GET':
+        request = factory.get(f'/api/{view_name}/?{query}')
+    else:
+        request = factory.generic(method, f'/api/{view_name}/', json.dumps(body or {}), content_type='application/json')
+    SessionMiddleware(lambda r: None).process_request(request)
+    request.user = user if user.is_authenticated else AnonymousUser()
+    if user.is_authenticated:
+        request.session['_auth_user_id'] = str(user.pk)
+    return request, kwargs
+
+def test_query_budgets():
+    """Test that every view stays within its query budget, whatever the page or library size"""
+    print_section("11. Query Budget Test")
+    
+    factory = RequestFactory()
+    films = list(AllFilms.objects.order_by('film_id').values_list('film_id', flat=True)[:max(LIBRARY_SIZES) + 1])
+    shows = list(AllShows.objects.order_by('show_id').values_list('show_id', flat=True)[:max(LIBRARY_SIZES) + 1])
+    passed = True
+    try:
+        # Everything the member does is rolled back; GETs read 'default' so they see it
+        with override_settings(READ_ONLY_DATABASE=None), transaction.atomic():
+            member = User.objects.create_user(email='budget-check@example.com', password='budget-password')
+            for size in LIBRARY_SIZES:
+                # The member's library: watch later plus reviews (through the views, to keep aggregates right)
+                titles = {'film_id': {'library': films[0], 'new': films[-1]}, 'show_id': {'library': shows[0], 'new': shows[-1]}}
+                for film_id, show_id in zip(films[:size], shows[:size]):
+                    WatchLaterMovie.objects.get_or_create(user_id=member, film_id_id=film_id)
+                    WatchLaterShow.objects.get_or_create(user_id=member, show_id_id=show_id)
+                    for view, key, item_id in ((views.movie_reviews, 'film_id', film_id), (views.show_reviews, 'show_id', show_id)):
+                        request = factory.post('/', json.dumps({'rating': 3}), content_type='application/json')
+                        request.user = member
+                        view(request, **{key: item_id})
+                
+                for view_name, method, params, state, budget in QUERY_BUDGETS:
+                    if state == 'anonymous' and size != LIBRARY_SIZES[0]:
+                        continue
+                    user = member if state == 'member' else AnonymousUser()
+                    request, kwargs = budget_request(factory, view_name, method, params, user, titles)
+                    label = f"{method} {view_name} {params if isinstance(params, str) else ''}".strip()
+                    label += f" ({state}, library of {size})" if state == 'member' else ''
+                    try:
+                        with query_budget(budget, label) as recorder:
+                            response = getattr(views, view_name)(request, **kwargs)
+                        ok = response.status_code < 500
+                        print(f"{'PASS' if ok else 'FAIL'} {label}: {recorder.count} queries (budget {budget})")
+                    except QueryBudgetExceeded as error:
+                        ok = False
+                        print(f"FAIL {error}")
+                    passed = passed and ok
+                User.objects.filter(email='budget-signup@example.com').delete()
+            transaction.set_rollback(True)
+        return passed
+    except Exception as e:
+        print(f"FAIL Query budget test: Error - {e}")
+        return False
+
+def test_catalog_cache():
+    """Test that catalog endpoints are cached until the catalog version is bumped"""
+    print_section("12. Catalog Cache Test")
+    
+    factory = RequestFactory()
+    passed = True
+    
+    def fetch(view, is_async=False):
+        request = factory.get('/api/catalog')
+        request.user = AnonymousUser()
+        with CaptureQueriesContext(connections[read_only_alias() or 'default']) as ctx:
+            response = async_to_sync(view)(request) if is_async else view(request)
+        return json.loads(response.content), len(ctx.captured_queries)
+    
+    try:
+        local_cache.clear()
+        for name in ('genres', 'show_genres', 'actors'):
+            with override_settings(CATALOG_CACHE_ENABLED=False):
+                expected, _ = fetch(getattr(views, name))
+            first, _ = fetch(getattr(views, name))
+            cached, cached_queries = fetch(getattr(views, name))
+            async_cached, async_queries = fetch(getattr(async_views, name), is_async=True)
+            ok = first == cached == async_cached == expected and cached_queries == async_queries == 1
+            passed = passed and ok
+            print(f"{'PASS' if ok else 'FAIL'} {name}: cached responses match, {cached_queries} query (sync), "
+                  f"{async_queries} (async)")
+        
+        version = catalog_version()
+        bump_catalog_version()
+        _, queries = fetch(views.genres)
+        ok = catalog_version() == version + 1 and queries > 1
+        passed = passed and ok
+        print(f"{'PASS' if ok else 'FAIL'} Bumping the catalog version ({version} -> {catalog_version()}) "
+              f"recomputes: {queries} queries")
+        return passed
+    except Exception as e:
+        print(f"FAIL Catalog cache test: Error - {e}")
+        return False
+
+AUTOCOMPLETE_LATENCY_MS = 1.0
+
+def test_actor_autocomplete():
+    """Test the actor name index and the ?q= autocomplete on /api/actors"""
+    print_section("13. Actor Autocomplete Test")
+    
+    factory = RequestFactory()
+    passed = True
+    
+    def get(params):
+        request = factory.get('/api/actors', params)
+        request.user = AnonymousUser()
+        response = actors(request)
+        return response.status_code, json.loads(response.content)
+    
+    try:
+        # The table holds exactly the cleaned names of the cast tables, with their credits
+        indexed = dict(ActorName.objects.values_list('name', 'credit_count'))
+        ok = indexed == dict(credit_counts())
+        passed = passed and ok
+        print(f"{'PASS' if ok else 'FAIL'} Actor_name is current: {len(indexed)} names")
+        
+        top = ActorName.objects.order_by('-credit_count', 'name').first()
+        if top is None:
+            print("SKIP No actors in the database")
+            return passed
+        cases = [
+            ({'q': top.name[:2]}, 'prefix', lambda name, term: name.startswith(term)),
+            ({'q': top.name.upper()}, 'prefix', lambda name, term: name.startswith(term)),
+            ({'q': top.name.split()[-1][1:], 'match': 'substring'}, 'substring', lambda name, term: term in name),
+        ]
+        for params, match, matches in cases:
+            status, data = get(params)
+            term = normalize_actor_name(params['q'])
+            credits = [actor['credits'] for actor in data.get('actors', [])]
+            ok = (status == 200 and data['count'] > 0 and credits == sorted(credits, reverse=True) and
+                  all(matches(normalize_actor_name(actor['name']), term) for actor in data['actors']))
+            passed = passed and ok
+            print(f"{'PASS' if ok else 'FAIL'} ?{'&'.join(f'{k}={v}' for k, v in params.items())}: "
+                  f"{data.get('count')} {match} matches, top {data['actors'][0] if data.get('actors') else None}")
+        
+        status, _ = get({'q': 'a', 'match': 'fuzzy'})
+        ok = status == 400
+        passed = passed and ok
+        print(f"{'PASS' if ok else 'FAIL'} Unknown match mode rejected - Status: {status}")
+        
+        if connection.vendor == 'sqlite':
+            sql, params = search_actor_names('to')[:10].query.sql_with_params()
+            with connection.cursor() as cursor:
+                cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+                plan = [row[-1] for row in cursor.fetchall()]
+            ok = any('actor_name_prefix_idx' in detail for detail in plan)
+            passed = passed and ok
+            print(f"{'PASS' if ok else 'FAIL'} Prefix search uses the index: {'; '.join(plan)}")
+            
+            # In process, so this is the lookup itself (on PostgreSQL the round trip dominates)
+            term = top.name[:3]
+            list(search_actor_names(term)[:10])
+            started = time.perf_counter()
+            for _ in range(200):
+                list(search_actor_names(term)[:10])
+            elapsed_ms = (time.perf_counter() - started) * 1000 / 200
+            ok = elapsed_ms < AUTOCOMPLETE_LATENCY_MS
+            passed = passed and ok
+            print(f"{'PASS' if ok else 'FAIL'} Prefix search for {term!r}: {elapsed_ms:.3f} ms "
+                  f"(budget {AUTOCOMPLETE_LATENCY_MS} ms)")
+        return passed
+    except Exception as e:
+        print(f"FAIL Actor autocomplete test: Error - {e}")
+        return False
+
+def aggregate_errors(rating_model, aggregate_model, key, item_id):
+    """Differences between a title's stored rating aggregate and its ratings"""
+    totals = rating_model.objects.filter(**{key: item_id}).aggregate(total=Sum('user_rating'), votes=Count('id'))
+    stored = aggregate_model.objects.filter(**{key: item_id}).first()
+    if not totals['votes']:
+        return ['aggregate row left behind'] if stored else []
+    if stored is None:
+        return ['no aggregate row']
+    expected = (Decimal(totals['total']) / totals['votes']).quantize(Decimal('0.01'), ROUND_HALF_UP)
+    errors = []
+    if (stored.rating_sum, stored.rating_count) != (totals['total'], totals['votes']):
+        errors.append(f"sum/count {stored.rating_sum}/{stored.rating_count}, expected {totals['total']}/{totals['votes']}")
+    if stored.average_score != expected:
+        errors.append(f"average {stored.average_score}, expected {expected}")
+    # The raw column must hold the rounded value too, or cursors compare against another number
+    raw = aggregate_model.objects.filter(**{key: item_id}).values_list(Cast('average_score', FloatField()), flat=True).get()
+    if raw != float(expected):
+        errors.append(f"stored {raw!r}, read back as {stored.average_score}")
+    return errors
+
+def test_rating_aggregates():
+    """Test that stored rating aggregates follow reviews being created, updated and deleted"""
+    print_section("14. Rating Aggregates Test")
+    
+    factory = RequestFactory()
+    passed = True
+    cases = [
+        (views.movie_reviews, AllFilms, MovieRating, MovieAverageRating, 'film_id'),
+        (views.show_reviews, AllShows, ShowUserRating, ShowAverageRating, 'show_id'),
+    ]
+    try:
+        with transaction.atomic():
+            member = User.objects.create_user(email='aggregate-check@example.com', password='aggregate-password')
+            # Rates each title first, so there is an aggregate row to update even after a fresh import
+            other = User.objects.create_user(email='aggregate-other@example.com', password='aggregate-password')
+            for view, catalog_model, rating_model, aggregate_model, key in cases:
+                item_id = catalog_model.objects.order_by('pk').values_list('pk', flat=True).first()
+                if item_id is None:
+                    print(f"FAIL {view.__name__}: no titles in the catalog")
+                    passed = False
+                    continue
+                for user, method, body in ((other, 'POST', {'rating': 5}), (member, 'POST', {'rating': 4}),
+                                           (member, 'PUT', {'rating': 2}), (member, 'DELETE', {})):
+                    request = factory.generic(method, '/', json.dumps(body), content_type='application/json')
+                    request.user = user
+                    response = view(request, **{key: item_id})
+                    errors = aggregate_errors(rating_model, aggregate_model, key, item_id)
+                    ok = response.status_code < 400 and not errors
+                    passed = passed and ok
+                    print(f"{'PASS' if ok else 'FAIL'} {view.__name__} {method} by {user.email} on {key} {item_id}: "
+                          f"{'; '.join(errors) or 'aggregate matches the ratings'}")
+            transaction.set_rollback(True)
+        return passed
+    except Exception as e:
+        print(f"FAIL Rating aggregates test: Error - {e}")
+        return False
+
+# Small and odd, so page boundaries land inside runs of equal sort keys
+PAGE_WALK_LIMIT = 97
+RELEVANCE_WALK_SEARCH = 'th'
+
+def walk_pages(view, params, id_key):
+    """Follow next_cursor from the first page to the last; returns the ids in order"""
+    factory = RequestFactory()
+    ids, cursor = [], None
+    while True:
+        query = dict(params, limit=PAGE_WALK_LIMIT, **({'cursor': cursor} if cursor else {}))
+        request = factory.get('/api/catalog', query)
+        request.user = AnonymousUser()
+        data = json.loads(view(request).content)
+        if not data.get('success'):
+            raise RuntimeError(data.get('error'))
+        ids += [item[id_key] for item in data['movies']]
+        cursor = data['next_cursor']
+        if not cursor:
+            return ids
+
+# (rating sum, count) given in turn to unrated titles before the walk: repeats tie on
+# both average and count, the rest have distinct averages, some rounded
+SEEDED_RATINGS = [(9, 2), (9, 2), (9, 2), (10, 3), (7, 2), (5, 1), (13, 3), (9, 2), (4, 1), (14, 4)]
+SEEDED_TITLES = 250
+SEED_STRIDE = 7
+
+def seed_aggregates(model, aggregate_model):
+    """Aggregate rows for every SEED_STRIDE-th unrated title; returns how many were added"""
+    unrated = model.objects.filter(**{f'{aggregate_model._meta.model_name}__isnull': True}).order_by('pk')
+    titles = list(unrated)[::SEED_STRIDE][:SEEDED_TITLES]
+    rows = []
+    for title, (total, votes) in zip(titles, SEEDED_RATINGS * len(titles)):
+        rows.append(aggregate_model(**{
+            aggregate_model.subject_field: title,
+            aggregate_model.name_field: getattr(title, aggregate_model.name_field),
+            'rating_sum': total,
+            'rating_count': votes,
+            'average_score': (Decimal(total) / votes).quantize(Decimal('0.01'), ROUND_HALF_UP),
+        }))
+    aggregate_model.objects.bulk_create(rows)
+    return len(rows)
+
+def test_pagination_walk():
+    """Test that following cursors visits every title exactly once, for every sort"""
+    print_section("15. Pagination Walk Test")
+    
+    passed = True
+    catalogs = [
+        (views.movies, views.MOVIE_SORTS, AllFilms, MovieAverageRating, 'film_id'),
+        (views.shows, views.SHOW_SORTS, AllShows, ShowAverageRating, 'show_id'),
+    ]
+    try:
+        # Seeded ratings are rolled back; the views read 'default' so they see them.
+        # Every sort then has rated and unrated phases, whatever the database holds
+        with override_settings(READ_ONLY_DATABASE=None), transaction.atomic():
+            for view, sorts, model, aggregate_model, id_key in catalogs:
+                seeded = seed_aggregates(model, aggregate_model)
+                expected = set(model.objects.values_list('pk', flat=True))
+                rated = aggregate_model.objects.count()
+                walks = [({'sortBy': sort_name}, expected) for sort_name in sorts if not sort_name.startswith('relevance')]
+                # Relevance only applies to title searches: walk one matching much of the catalog
+                matches = apply_title_search(model.objects.all(), RELEVANCE_WALK_SEARCH).values_list('pk', flat=True)
+                walks.append(({'sortBy': 'relevance', 'titleSearch': RELEVANCE_WALK_SEARCH}, set(matches)))
+                for params, expected_ids in walks:
+                    ids = walk_pages(view, params, id_key)
+                    duplicates = len(ids) - len(set(ids))
+                    missing = len(expected_ids - set(ids))
+                    ok = not duplicates and not missing
+                    passed = passed and ok
+                    label = '&'.join(f'{key}={value}' for key, value in params.items())
+                    print(f"{'PASS' if ok else 'FAIL'} {view.__name__} {label}: {len(ids)} rows, "
+                          f"{duplicates} duplicates, {missing} missing ({rated} rated, {seeded} seeded)")
+            transaction.set_rollback(True)
+        return passed
+    except Exception as e:
+        print(f"FAIL Pagination walk test: Error - {e}")
+        return False
+
 def main():
     """Run all tests"""
     print("\n" + "=" * 60)
-    print("SQLite Integration Verification")
+    print(f"Database Integration Verification ({connection.vendor})")
     print("=" * 60)
     
     tests = [
@@ -186,6 +841,17 @@ def main():
         ("Django Models", test_models),
         ("API Endpoints", test_api_endpoints),
         ("Filtering", test_filtering),
+        ("Query Counts", test_query_counts),
+        ("Query Plans", test_query_plans),
+        ("Audit Writer", test_audit_writer),
+        ("Database Routing", test_database_routing),
+        ("Async Views", test_async_views),
+        ("Request Metrics", test_request_metrics),
+        ("Query Budgets", test_query_budgets),
+        ("Catalog Cache", test_catalog_cache),
+        ("Actor Autocomplete", test_actor_autocomplete),
+        ("Rating Aggregates", test_rating_aggregates),
+        ("Pagination Walk", test_pagination_walk),
     ]
     
     results = {}